@@ -0,0 +1 @@
+"""Benchmarks for the SDK, run with ``python -m benchmarks`` or ``nox -s benchmarks``."""
@@ -0,0 +1,305 @@
+"""Run the benchmarks and write their results as JSON.
+
+Each result records the time of every repeat, and the median used to compare runs. ``--compare`` checks the
+results against an earlier run, e.g. of the previous SDK version, and fails on regressions.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from datetime import UTC, datetime
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from ssactivewear_sdk import AsyncSSActivewear, OrderRequest, Product, SSActivewear
+from ssactivewear_sdk.codec import dump_order_request, dump_order_requests
+from ssactivewear_sdk.export import export_products
+
+from .payloads import FIXTURES_DIRECTORY, catalog_fixture, order_lines, order_request
+from .server import StubServer, mock_transport
+
+ACCOUNT_NUMBER = "12345"
+TOKEN = "8b0b7c2e-3f6a-4c1d-9a0e-2d5f4b6c7e8f"  # noqa: S105 - Not a real token
+
+Result = dict[str, Any]
+
+
+def main() -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--sizes", type=_sizes, default=[10_000, 100_000], help="catalog sizes, e.g. 10k,100k,1m")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of each timed benchmark")
+    parser.add_argument("--transport", choices=["server", "mock"], default="server", help="how payloads are served")
+    parser.add_argument("--latency", type=float, default=0.02, help="stub server latency per request, in seconds")
+    parser.add_argument("--orders", type=int, default=500, help="orders submitted by the order benchmarks")
+    parser.add_argument("--concurrency", type=int, default=16, help="orders in flight at once")
+    parser.add_argument("--order-lines", type=int, default=1000, help="lines per order serialized by the benchmarks")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIRECTORY, help="where catalog fixtures are kept")
+    parser.add_argument("--output", type=Path, help="file to write the results to, instead of stdout")
+    parser.add_argument("--compare", type=Path, help="earlier results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown tolerated by --compare, e.g. 0.1")
+    arguments = parser.parse_args()
+
+    baseline = None
+    if arguments.compare is not None:
+        baseline = json.loads(arguments.compare.read_text(encoding="utf-8"))
+        if baseline["transport"] != arguments.transport:
+            parser.error(f"cannot compare against results served by the {baseline['transport']} transport")
+
+    results = [
+        *(
+            result
+            for size in arguments.sizes
+            for result in _catalog_benchmarks(
+                catalog_fixture(size, arguments.fixtures),
+                size,
+                arguments.transport,
+                arguments.repeat,
+            )
+        ),
+        *_order_benchmarks(
+            catalog_fixture(0, arguments.fixtures),
+            arguments.orders,
+            arguments.concurrency,
+            arguments.transport,
+            arguments.latency,
+        ),
+        *_serialization_benchmarks(arguments.order_lines, arguments.repeat),
+        *_import_benchmarks(arguments.repeat),
+    ]
+    report = {
+        "sdk_version": _sdk_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(UTC).isoformat(),
+        "transport": arguments.transport,
+        "results": results,
+    }
+
+    output = json.dumps(report, indent=2)
+    if arguments.output is None:
+        print(output)
+    else:
+        arguments.output.write_text(output + "\n", encoding="utf-8")
+
+    if baseline is None:
+        return 0
+    regressions = compare(baseline["results"], results, arguments.threshold)
+    for regression in regressions:
+        print(regression, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def compare(baseline: list[Result], results: list[Result], threshold: float) -> list[str]:
+    """Describe the results more than ``threshold`` slower, or using that much more memory, than the baseline."""
+    previous = {_key(result): result for result in baseline}
+    regressions = []
+    for result in results:
+        earlier = previous.get(_key(result))
+        if earlier is None:
+            continue
+        for metric in ("median", "peak_bytes"):
+            if metric in result and result[metric] > earlier[metric] * (1 + threshold):
+                change = result[metric] / earlier[metric] - 1
+                parameters = ", ".join(f"{name}={value}" for name, value in result["parameters"].items())
+                regressions.append(f"{result['name']} ({parameters}): {metric} {change:+.1%}")
+    return regressions
+
+
+def _catalog_benchmarks(catalog: Path, size: int, transport: str, repeat: int) -> Iterator[Result]:
+    """Benchmark downloading, streaming and validating a catalog of ``size`` products."""
+    with _client(catalog, transport) as client:
+        yield _timed("products", lambda: len(client.products()), repeat, size=size)
+        yield _timed("products_trusted", lambda: len(client.products(trusted=True)), repeat, size=size)
+        yield _timed("iter_products", lambda: sum(1 for _ in client.iter_products()), repeat, size=size)
+        yield _peak_memory("products_memory", lambda: len(client.products()), size=size)
+        yield _peak_memory("iter_products_memory", lambda: sum(1 for _ in client.iter_products()), size=size)
+
+        with tempfile.TemporaryDirectory() as directory:
+            export = lambda: export_products(client.iter_products(), directory).products  # noqa: E731
+            yield _timed("export_ndjson", export, repeat, size=size)
+            yield _peak_memory("export_ndjson_memory", export, size=size)
+
+    body = catalog.read_bytes()
+    adapter = TypeAdapter(list[Product])
+    yield _timed("validate_json", lambda: len(adapter.validate_json(body)), repeat, size=size)
+
+
+def _order_benchmarks(
+    catalog: Path,
+    orders: int,
+    concurrency: int,
+    transport: str,
+    latency: float,
+) -> Iterator[Result]:
+    """Benchmark submitting ``orders`` orders, ``concurrency`` at a time, against a server with ``latency``."""
+    order_requests = [OrderRequest.model_validate(order_request(index)) for index in range(orders)]
+    parameters = {"orders": orders, "concurrency": concurrency, "latency": latency if transport == "server" else 0}
+
+    with _client(catalog, transport, latency) as client:
+        yield _timed(
+            "submit_orders",
+            lambda: sum(1 for _ in client.submit_orders(order_requests, concurrency, ordered=False)),
+            1,
+            **parameters,
+        )
+
+    async def submit() -> int:
+        async with _async_client(catalog, transport, latency) as client:
+            return sum([1 async for _ in client.submit_orders(order_requests, concurrency, ordered=False)])
+
+    yield _timed("async_submit_orders", lambda: asyncio.run(submit()), 1, **parameters)
+
+
+def _serialization_benchmarks(lines: int, repeat: int, orders: int = 50) -> Iterator[Result]:
+    """Benchmark serializing ``orders`` orders of ``lines`` lines to request bodies."""
+    order_requests = [
+        OrderRequest.model_validate(order_request(index) | {"lines": order_lines(lines)}) for index in range(orders)
+    ]
+    options: dict[str, Any] = {"exclude_none": True, "by_alias": True, "exclude_unset": True}
+
+    def model_dump() -> int:
+        # How bodies used to be built: dumped to dicts, then encoded again by httpx.
+        for order in order_requests:
+            json.dumps(order.model_dump(mode="json", **options)).encode()
+        return orders
+
+    def dump_json() -> int:
+        for order in order_requests:
+            dump_order_request(order)
+        return orders
+
+    def dump_json_batch() -> int:
+        dump_order_requests(order_requests)
+        return orders
+
+    yield _timed("order_model_dump", model_dump, repeat, lines=lines)
+    yield _timed("order_dump_json", dump_json, repeat, lines=lines)
+    yield _timed("order_dump_json_batch", dump_json_batch, repeat, lines=lines)
+
+
+# What importing the SDK costs, from the bare package to the names pulling in models or the client and httpx.
+_IMPORTS = {
+    "import": "import ssactivewear_sdk",
+    "import_models": "from ssactivewear_sdk import Product",
+    "import_client": "from ssactivewear_sdk import SSActivewear",
+}
+
+
+def _import_benchmarks(repeat: int) -> Iterator[Result]:
+    """Benchmark importing the SDK, each repeat in a fresh interpreter so that nothing is imported already.
+
+    Only the import statement is timed, not the interpreter's startup; run it under ``python -X importtime`` for a
+    breakdown by module.
+    """
+    for name, statement in _IMPORTS.items():
+        code = f"import time\nstarted = time.perf_counter()\n{statement}\nprint(time.perf_counter() - started)"
+        seconds = []
+        for _ in range(repeat):
+            command = [sys.executable, "-c", code]
+            process = subprocess.run(command, capture_output=True, check=True, text=True)  # noqa: S603 - Fixed statement
+            seconds.append(float(process.stdout))
+        yield _timed_runs(name, seconds, 1, statement=statement)
+
+
+@contextmanager
+def _client(catalog: Path, transport: str, latency: float = 0) -> Iterator[SSActivewear]:
+    if transport == "mock":
+        with SSActivewear(ACCOUNT_NUMBER, TOKEN, "https://api.test/v2", transport=mock_transport(catalog)) as client:
+            yield client
+        return
+    with StubServer(catalog, latency) as server, SSActivewear(ACCOUNT_NUMBER, TOKEN, server.base_url) as client:
+        yield client
+
+
+@asynccontextmanager
+async def _async_client(catalog: Path, transport: str, latency: float = 0) -> AsyncIterator[AsyncSSActivewear]:
+    if transport == "mock":
+        async with AsyncSSActivewear(
+            ACCOUNT_NUMBER,
+            TOKEN,
+            "https://api.test/v2",
+            transport=mock_transport(catalog),
+        ) as client:
+            yield client
+        return
+    with StubServer(catalog, latency) as server:
+        async with AsyncSSActivewear(ACCOUNT_NUMBER, TOKEN, server.base_url) as client:
+            yield client
+
+
+def _timed(name: str, run: Callable[[], int], repeat: int, **parameters: Any) -> Result:  # noqa: ANN401
+    """Time ``repeat`` runs of a benchmark, each returning the number of items it processed."""
+    seconds = []
+    items = 0
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        items = run()
+        seconds.append(time.perf_counter() - started)
+    return _timed_runs(name, seconds, items, **parameters)
+
+
+def _timed_runs(name: str, seconds: list[float], items: int, **parameters: Any) -> Result:  # noqa: ANN401
+    """Summarize the times of the runs of a benchmark, each processing ``items`` items."""
+    median = statistics.median(seconds)
+    return {
+        "name": name,
+        "parameters": parameters,
+        "seconds": seconds,
+        "median": median,
+        "min": min(seconds),
+        "items": items,
+        "items_per_second": items / median if median else None,
+    }
+
+
+def _peak_memory(name: str, run: Callable[[], int], **parameters: Any) -> Result:  # noqa: ANN401
+    """Measure the peak memory allocated by Python during a run of a benchmark."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        items = run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"name": name, "parameters": parameters, "items": items, "peak_bytes": peak}
+
+
+def _key(result: Result) -> tuple[str, str]:
+    """Identify a result across runs by its name and parameters."""
+    return result["name"], json.dumps(result["parameters"], sort_keys=True)
+
+
+def _sizes(value: str) -> list[int]:
+    """Parse catalog sizes such as ``10k,100k,1m``."""
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    sizes = []
+    for size in value.lower().split(","):
+        multiplier = multipliers.get(size[-1:], 1)
+        sizes.append(int(size.rstrip("km")) * multiplier)
+    return sizes
+
+
+def _sdk_version() -> str | None:
+    try:
+        return metadata.version("idi-ssactivewear-sdk")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+if __name__ == "__main__":
+    sys.exit(main())
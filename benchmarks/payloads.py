@@ -0,0 +1,225 @@
+"""Synthetic API payloads, shaped like real `/products` and `/orders` responses."""
+
+import json
+import random
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+FIXTURES_DIRECTORY = Path(__file__).parent / "fixtures"
+
+_BRANDS = [("5", "Gildan"), ("35", "Bella + Canvas"), ("21", "Next Level"), ("13", "Comfort Colors"), ("8", "Hanes")]
+_COLORS = [
+    ("Black", "02", "#000000"),
+    ("White", "00", "#FFFFFF"),
+    ("Navy", "35", "#1F2A44"),
+    ("Sport Grey", "81", "#97999B"),
+    ("Red", "40", "#C8102E"),
+    ("Royal", "51", "#1D4F91"),
+    ("Forest Green", "33", "#2C5234"),
+    ("Maroon", "44", "#5C2C35"),
+]
+_SIZES = [
+    ("S", "3", "B3"),
+    ("M", "4", "B4"),
+    ("L", "5", "B5"),
+    ("XL", "6", "B6"),
+    ("2XL", "7", "B7"),
+    ("3XL", "8", "B8"),
+]
+_WAREHOUSES = ["IL", "KS", "NV", "TX", "GA", "PA", "OH"]
+
+
+def products(count: int, seed: int = 0) -> Iterator[dict[str, Any]]:
+    """Generate ``count`` products, grouped in styles of every color and size like the real catalog."""
+    rng = random.Random(seed)  # noqa: S311 - Not used for security
+    sku_id = 0
+    style_id = 0
+    while sku_id < count:
+        style_id += 1
+        brand = _BRANDS[style_id % len(_BRANDS)]
+        piece_price = round(rng.uniform(2, 25), 2)
+        for color in rng.sample(_COLORS, rng.randint(2, len(_COLORS))):
+            for size in _SIZES:
+                if sku_id == count:
+                    return
+                sku_id += 1
+                yield _product(
+                    rng,
+                    sku_id,
+                    style_id=style_id,
+                    brand=brand,
+                    color=color,
+                    size=size,
+                    piece_price=piece_price,
+                )
+
+
+def _product(  # noqa: PLR0913
+    rng: random.Random,
+    sku_id: int,
+    *,
+    style_id: int,
+    brand: tuple[str, str],
+    color: tuple[str, str, str],
+    size: tuple[str, str, str],
+    piece_price: float,
+) -> dict[str, Any]:
+    brand_id, brand_name = brand
+    color_name, color_code, color_hex = color
+    size_name, size_code, size_order = size
+    warehouses = [
+        {
+            "warehouseAbbr": abbr,
+            "skuID": sku_id,
+            "qty": rng.choice([0, rng.randint(1, 5000)]),
+            "closeout": rng.random() < 0.02,  # noqa: PLR2004
+            "dropship": False,
+            "excludeFreeFreight": False,
+            "fullCaseOnly": False,
+            "returnable": True,
+        }
+        for abbr in rng.sample(_WAREHOUSES, rng.randint(2, len(_WAREHOUSES)))
+    ]
+    image = f"Images/Color/{style_id}_{color_code}"
+    return {
+        "skuID_Master": sku_id,
+        "sku": f"B{sku_id:08d}",
+        "gtin": f"{sku_id:014d}",
+        "yourSku": "",
+        "baseCategoryID": str(style_id % 40),
+        "brandID": brand_id,
+        "brandName": brand_name,
+        "styleID": style_id,
+        "styleName": f"{style_id:05d}",
+        "colorName": color_name,
+        "colorCode": color_code,
+        "colorPriceCodeName": "Colors",
+        "colorGroup": color_code,
+        "colorGroupName": color_name,
+        "colorFamilyID": color_code,
+        "colorFamily": color_name,
+        "colorSwatchImage": f"Images/ColorSwatch/{style_id}_{color_code}_fm.jpg",
+        "colorSwatchTextColor": "#FFFFFF",
+        "colorFrontImage": f"{image}_f_fm.jpg",
+        "colorSideImage": f"{image}_s_fm.jpg",
+        "colorBackImage": f"{image}_b_fm.jpg",
+        "colorDirectSideImage": f"{image}_d_fm.jpg",
+        "colorOnModelFrontImage": f"{image}_omf_fm.jpg",
+        "colorOnModelSideImage": f"{image}_oms_fm.jpg",
+        "colorOnModelBackImage": f"{image}_omb_fm.jpg",
+        "color1": color_hex,
+        "color2": "",
+        "sizeName": size_name,
+        "sizeCode": size_code,
+        "sizeOrder": size_order,
+        "sizePriceCodeName": "S-XL",
+        "caseQty": 72,
+        "unitWeight": 0.44,
+        "mapPrice": 0.0,
+        "piecePrice": piece_price,
+        "dozenPrice": round(piece_price * 0.9, 2),
+        "casePrice": round(piece_price * 0.8, 2),
+        "salePrice": 0.0,
+        "customerPrice": piece_price,
+        "noeRetailing": False,
+        "caseWeight": 32.0,
+        "caseWidth": 12.0,
+        "caseLength": 24.0,
+        "caseHeight": 12.0,
+        "polyPackQty": 12,
+        "qty": sum(warehouse["qty"] for warehouse in warehouses),
+        "countryOfOrigin": "HN",
+        "warehouses": warehouses,
+    }
+
+
+def catalog_fixture(count: int, directory: Path = FIXTURES_DIRECTORY) -> Path:
+    """Get the path of a recorded `/products` response of ``count`` products, generating it on first use.
+
+    Fixtures are written once and reused by later runs, so every run of a given size sees the same catalog.
+    """
+    path = directory / f"products-{count}.json"
+    if not path.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".partial")
+        with partial.open("w", encoding="utf-8") as file:
+            file.write("[")
+            for index, product in enumerate(products(count)):
+                if index:
+                    file.write(",")
+                file.write(json.dumps(product, separators=(",", ":")))
+            file.write("]")
+        partial.replace(path)
+    return path
+
+
+def order_lines(count: int, start: int = 0) -> list[dict[str, Any]]:
+    """Get order lines for consecutive SKUs."""
+    return [{"identifier": f"B{start + line:08d}", "qty": 12} for line in range(count)]
+
+
+def order_request(index: int) -> dict[str, Any]:
+    """Get an order request with a few lines, as sent to `/orders`."""
+    return {
+        "shippingAddress": {
+            "customer": "Impress Designs",
+            "attn": "Receiving",
+            "address": "1 Main St",
+            "city": "Chicago",
+            "state": "IL",
+            "zip": "60601",
+        },
+        "lines": order_lines(3, index * 3),
+        "poNumber": f"PO-{index}",
+    }
+
+
+def order_response(po_number: str) -> dict[str, Any]:
+    """Get the `/orders` response to an order."""
+    return {
+        "guid": "a4f0e1c2-9b8d-4e7f-a6b5-c4d3e2f1a0b9",
+        "companyName": "Impress Designs",
+        "warehouseAbbr": "IL",
+        "orderNumber": "1234567",
+        "invoiceNumber": "",
+        "poNumber": po_number,
+        "customerNumber": "12345",
+        "orderDate": "2026-10-01T09:30:00",
+        "expectedDeliveryDate": "2026-10-03",
+        "orderType": "API",
+        "terms": "Net 30",
+        "orderStatus": "In Progress",
+        "dropship": False,
+        "shippingCarrier": "UPS",
+        "shippingMethod": "UPS Ground",
+        "shipBlind": False,
+        "shippingCollectNumber": "",
+        "shippingAddress": {
+            "customer": "Impress Designs",
+            "attn": "Receiving",
+            "address": "1 Main St",
+            "city": "Chicago",
+            "state": "IL",
+            "zip": "60601",
+        },
+        "subtotal": 126.0,
+        "shipping": 0.0,
+        "cod": 0.0,
+        "tax": 0.0,
+        "smallOrderFee": 0.0,
+        "cuponDiscount": 0.0,
+        "sampleDiscount": 0.0,
+        "setUpFee": 0.0,
+        "restockFee": 0.0,
+        "debitCredit": 0.0,
+        "total": 126.0,
+        "totalPieces": 36,
+        "totalLines": 3,
+        "totalWeight": 15.84,
+        "totalBoxes": 1,
+        "deliveryStatus": "",
+        "conveyorLane": "",
+        "lines": [],
+        "shippingSaved": 0.0,
+    }
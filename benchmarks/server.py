@@ -0,0 +1,105 @@
+"""Serving recorded payloads, from a local stub server or an httpx mock transport."""
+
+import json
+import shutil
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+import httpx
+
+from .payloads import order_response
+
+
+class StubServer(ThreadingHTTPServer):
+    """A local HTTP server standing in for the API, answering each request after ``latency`` seconds.
+
+    Use it as a context manager; the API's base URL is then available as :attr:`base_url`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, catalog: Path, latency: float = 0) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.catalog = catalog
+        self.latency = latency
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Get the base URL of the API served."""
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}/v2"
+
+    def __enter__(self) -> Self:
+        """Start serving in a background thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop serving on leaving the server's context."""
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answers `GET /v2/products` with the catalog fixture and `POST /v2/orders` with an order response."""
+
+    protocol_version = "HTTP/1.1"
+    server: StubServer
+
+    def do_GET(self) -> None:
+        if not self.path.startswith("/v2/products"):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        self._delay()
+        catalog = self.server.catalog
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(catalog.stat().st_size))
+        self.end_headers()
+        with catalog.open("rb") as file:
+            shutil.copyfileobj(file, self.wfile, 1 << 20)
+
+    def do_POST(self) -> None:
+        if self.path != "/v2/orders":
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        order = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self._delay()
+        body = json.dumps([order_response(order["poNumber"])]).encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - Required by BaseHTTPRequestHandler
+        pass
+
+    def _delay(self) -> None:
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+
+def mock_transport(catalog: Path) -> httpx.MockTransport:
+    """Get a transport answering requests in-process like :class:`StubServer`, without any network overhead."""
+    body = catalog.read_bytes()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            order = json.loads(request.content)
+            return httpx.Response(HTTPStatus.OK, json=[order_response(order["poNumber"])])
+        return httpx.Response(HTTPStatus.OK, content=body, headers={"Content-Type": "application/json"})
+
+    return httpx.MockTransport(handler)
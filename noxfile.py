@@ -16,6 +16,7 @@ CLEANABLE_TARGETS = [
     "./.coverage",
     "./.coverage.*",
     "./coverage.json",
+    "./benchmarks/fixtures",
     "./**/.mypy_cache",
     "./**/.pytest_cache",
     "./**/__pycache__",
@@ -30,13 +31,19 @@ def tests(session: nox.Session) -> None:
     session.run("pytest")
 
 
+@nox.session
+def benchmarks(session: nox.Session) -> None:
+    """Run benchmarks, passing any arguments through, e.g. ``nox -s benchmarks -- --sizes 10k,1m``."""
+    session.run("python", "-m", "benchmarks", *session.posargs)
+
+
 @nox.session
 def lints(session: nox.Session) -> None:
     """Run lints."""
     session.run("pre-commit", "run", "--all-files")
     session.run("ruff", "format", ".")
     session.run("ruff", "check", "--fix", ".")
-    session.run("mypy", "--strict", "src/", "tests/")
+    session.run("mypy", "--strict", "src/", "tests/", "benchmarks/")
 
 
 @nox.session
@@ -1,20 +1,96 @@
 """A wrapper for S&S' API."""
 
-from .client import SSActivewear
-from .exceptions import SSActivewearBadRequestError, SSActivewearError
-from .models import (
-    OrderRequest,
-    OrderRequestOrderLine,
-    OrderRequestPaymentProfile,
-    OrderRequestShippingAddress,
-    OrderResponse,
-    OrderResponseLine,
-    OrderResponseShippingAddress,
-    Product,
-    Warehouse,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .allocation import Allocation, AllocationPlan, WarehouseAllocator
+    from .cache import CatalogCache
+    from .catalog import Catalog
+    from .client import AsyncSSActivewear, SSActivewear
+    from .exceptions import SSActivewearBadRequestError, SSActivewearError
+    from .instrumentation import HistogramRegistry, Instrumentation, LoggingInstrumentation
+    from .inventory import InventoryEvent, InventoryTracker
+    from .models import (
+        OrderRequest,
+        OrderRequestOrderLine,
+        OrderRequestPaymentProfile,
+        OrderRequestShippingAddress,
+        OrderResponse,
+        OrderResponseLine,
+        OrderResponseShippingAddress,
+        PartialProduct,
+        Product,
+        Warehouse,
+    )
+    from .preflight import OrderPreflight, PreflightIssue, SSActivewearPreflightError
+    from .quotes import Quote, QuoteEngine
+    from .reconciliation import OrderSync
+    from .replay import AsyncRecordingTransport, RecordingTransport, ReplayTransport
+    from .retry import RetryPolicy, TokenBucket
+    from .sharding import CatalogShard
+    from .snapshot import CatalogSnapshot, SharedProductTable
+    from .table import ProductTable
+
+# Modules are only imported when one of their names is first accessed, so that e.g. using the models does not
+# import httpx and the client.
+_LAZY_IMPORTS = {
+    "Allocation": ".allocation",
+    "AllocationPlan": ".allocation",
+    "AsyncRecordingTransport": ".replay",
+    "AsyncSSActivewear": ".client",
+    "Catalog": ".catalog",
+    "CatalogCache": ".cache",
+    "CatalogShard": ".sharding",
+    "CatalogSnapshot": ".snapshot",
+    "HistogramRegistry": ".instrumentation",
+    "Instrumentation": ".instrumentation",
+    "InventoryEvent": ".inventory",
+    "InventoryTracker": ".inventory",
+    "LoggingInstrumentation": ".instrumentation",
+    "OrderRequest": ".models",
+    "OrderRequestOrderLine": ".models",
+    "OrderRequestPaymentProfile": ".models",
+    "OrderRequestShippingAddress": ".models",
+    "OrderResponse": ".models",
+    "OrderResponseLine": ".models",
+    "OrderResponseShippingAddress": ".models",
+    "OrderSync": ".reconciliation",
+    "OrderPreflight": ".preflight",
+    "PartialProduct": ".models",
+    "PreflightIssue": ".preflight",
+    "Product": ".models",
+    "ProductTable": ".table",
+    "Quote": ".quotes",
+    "QuoteEngine": ".quotes",
+    "RecordingTransport": ".replay",
+    "ReplayTransport": ".replay",
+    "RetryPolicy": ".retry",
+    "SSActivewear": ".client",
+    "SSActivewearBadRequestError": ".exceptions",
+    "SSActivewearError": ".exceptions",
+    "SSActivewearPreflightError": ".preflight",
+    "SharedProductTable": ".snapshot",
+    "TokenBucket": ".retry",
+    "Warehouse": ".models",
+    "WarehouseAllocator": ".allocation",
+}
 
 __all__ = [
+    "Allocation",
+    "AllocationPlan",
+    "AsyncRecordingTransport",
+    "AsyncSSActivewear",
+    "Catalog",
+    "CatalogCache",
+    "CatalogShard",
+    "CatalogSnapshot",
+    "HistogramRegistry",
+    "Instrumentation",
+    "InventoryEvent",
+    "InventoryTracker",
+    "LoggingInstrumentation",
+    "OrderPreflight",
     "OrderRequest",
     "OrderRequestOrderLine",
     "OrderRequestPaymentProfile",
@@ -22,9 +98,38 @@ __all__ = [
     "OrderResponse",
     "OrderResponseLine",
     "OrderResponseShippingAddress",
+    "OrderSync",
+    "PartialProduct",
+    "PreflightIssue",
     "Product",
+    "ProductTable",
+    "Quote",
+    "QuoteEngine",
+    "RecordingTransport",
+    "ReplayTransport",
+    "RetryPolicy",
     "SSActivewear",
     "SSActivewearBadRequestError",
     "SSActivewearError",
+    "SSActivewearPreflightError",
+    "SharedProductTable",
+    "TokenBucket",
     "Warehouse",
+    "WarehouseAllocator",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import exported names on first access."""
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *__all__]
@@ -0,0 +1,170 @@
+"""Running calls concurrently with a bounded number in flight, and coalescing concurrent duplicate calls."""
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Hashable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        msg = "max_concurrency must be at least 1"
+        raise ValueError(msg)
+
+
+def bounded_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_concurrency: int,
+    *,
+    ordered: bool = True,
+) -> Iterator[tuple[Any, Future[Any]]]:
+    """Call ``func`` on each item in a thread pool, yielding each item with its completed future.
+
+    At most ``max_concurrency`` calls are in flight at once and ``items`` is only consumed as slots free up,
+    so an arbitrarily large iterable is never buffered. Results are yielded in input order when ``ordered``,
+    otherwise as soon as each call completes. Calls that have not started are cancelled if the consumer stops
+    iterating early.
+    """
+    _check_concurrency(max_concurrency)
+    iterator = iter(items)
+    pending: deque[tuple[Any, Future[Any]]] = deque()
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    def fill() -> None:
+        while len(pending) < max_concurrency:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            pending.append((item, executor.submit(func, item)))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                item, future = pending.popleft()
+                wait([future])
+            else:
+                done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+                index = next(index for index, (_, future) in enumerate(pending) if future in done)
+                item, future = pending[index]
+                del pending[index]
+            fill()
+            yield item, future
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def abounded_map(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    max_concurrency: int,
+    *,
+    ordered: bool = True,
+) -> AsyncGenerator[tuple[Any, asyncio.Task[Any]]]:
+    """Await ``func`` on each item as concurrent tasks, yielding each item with its completed task.
+
+    This is the asyncio counterpart of :func:`bounded_map`, with the same backpressure and ordering guarantees.
+    Like the threads of :func:`bounded_map`, tasks already in flight when the consumer stops iterating early are
+    awaited rather than cancelled, so that e.g. a submitted order's request is never abandoned half way.
+    """
+    _check_concurrency(max_concurrency)
+    iterator = iter(items)
+    pending: deque[tuple[Any, asyncio.Task[Any]]] = deque()
+
+    async def call(item: Any) -> Any:  # noqa: ANN401
+        return await func(item)
+
+    def fill() -> None:
+        while len(pending) < max_concurrency:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            pending.append((item, asyncio.ensure_future(call(item))))
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                item, task = pending.popleft()
+                await asyncio.wait([task])
+            else:
+                done, _ = await asyncio.wait([task for _, task in pending], return_when=asyncio.FIRST_COMPLETED)
+                index = next(index for index, (_, task) in enumerate(pending) if task in done)
+                item, task = pending[index]
+                del pending[index]
+            fill()
+            yield item, task
+    finally:
+        if pending:
+            await asyncio.wait([task for _, task in pending])
+
+
+class SingleFlight[K: Hashable, T]:
+    """Coalesces concurrent calls sharing a key into a single call, whose result or error they all get.
+
+    A call only coalesces with the one in flight for its key; once that completes, the next call runs afresh.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[K, Future[T]] = {}
+
+    def do(self, key: K, func: Callable[[], T]) -> T:
+        """Call ``func``, or wait for the call in flight for ``key``, in the calling thread."""
+        future, leader = self._join(key)
+        if leader:
+            self._run(key, future, func)
+        return future.result()
+
+    def submit(self, key: K, func: Callable[[], T]) -> Future[T]:
+        """Call ``func`` in a background thread unless a call for ``key`` is in flight, returning its future."""
+        future, leader = self._join(key)
+        if leader:
+            threading.Thread(target=self._run, args=(key, future, func), daemon=True).start()
+        return future
+
+    def _join(self, key: K) -> tuple[Future[T], bool]:
+        """Get the future of the call in flight for ``key``, and whether the caller has to make that call."""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def _run(self, key: K, future: Future[T], func: Callable[[], T]) -> None:
+        try:
+            result = func()
+        except BaseException as exception:  # noqa: BLE001 - Raised to every caller by the future
+            self._done(key)
+            future.set_exception(exception)
+        else:
+            self._done(key)
+            future.set_result(result)
+
+    def _done(self, key: K) -> None:
+        with self._lock:
+            del self._calls[key]
+
+
+class AsyncSingleFlight[K: Hashable, T]:
+    """The asyncio counterpart of :class:`SingleFlight`.
+
+    The call runs as a task of its own, so it completes for the remaining callers when one of them is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[K, asyncio.Task[T]] = {}
+
+    async def do(self, key: K, func: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Await ``func``, or the call in flight for ``key``."""
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
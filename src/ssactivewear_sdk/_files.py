@@ -0,0 +1,33 @@
+"""Writing files in place of previous ones atomically, and normalizing the datetimes written to them."""
+
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+
+
+def utc(value: datetime) -> datetime:
+    """Treat naive datetimes, such as S&S' order dates, as UTC, like :class:`ProductTable` does."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+@contextmanager
+def replacing(path: Path) -> Iterator[Path]:
+    """Reserve a temporary file to write in place of ``path``, renamed over it once the block completes.
+
+    The temporary file is next to ``path``, on the same filesystem, and synced to disk before the rename, so that
+    readers and crashes see either the previous file or the new one in full. It is removed if the block fails.
+    """
+    descriptor, name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    os.close(descriptor)
+    temporary = Path(name)
+    try:
+        yield temporary
+        with temporary.open("rb+") as file:
+            os.fsync(file.fileno())
+        temporary.replace(path)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,135 @@
+"""Incremental parsing of JSON array bodies."""
+
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+# What may follow an element of the array.
+_DELIMITERS = _WHITESPACE + ",]"
+
+# Characters ending a JSON token: once one follows an error, more text cannot fix it.
+_TOKEN_END = re.compile(r'[\s,:\[\]{}"]')
+
+
+class JSONArrayParser:
+    """Incrementally parse a top-level JSON array, yielding its elements as they complete.
+
+    Text is fed in arbitrary chunks with :meth:`feed`. Only the element currently being received is
+    held in the buffer, so memory use is bounded by the largest single element rather than the body.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        self._expect_value = True
+        self._after_comma = False
+
+    def feed(self, text: str) -> list[Any]:
+        """Add a chunk of text and return every element completed by it."""
+        self._buffer += text
+        items: list[Any] = []
+        position = 0
+        buffer = self._buffer
+
+        while True:
+            position = self._skip_whitespace(buffer, position)
+            if position >= len(buffer):
+                break
+
+            if self._consume_punctuation(buffer[position]):
+                position += 1
+                continue
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as exception:
+                if not _truncated(buffer, exception):
+                    msg = f"Malformed element in the JSON array: {exception.msg}"
+                    raise ValueError(msg) from exception
+                # The element has not been received in full yet.
+                break
+
+            # A scalar at the very end of the buffer may still be truncated (e.g. ``12`` of ``123``),
+            # so only accept an element once the delimiter that follows it has arrived.
+            if self._skip_whitespace(buffer, end) >= len(buffer):
+                break
+            # A number may also be cut right after its ``.`` or exponent, which it is decoded without
+            # (e.g. ``1`` of ``1.``), so it is only complete if a delimiter follows it.
+            if _is_number(item) and buffer[end] not in _DELIMITERS:
+                if _TOKEN_END.search(buffer, end) is None:
+                    break
+                msg = f"Malformed element in the JSON array: unexpected {buffer[end]!r} in a number"
+                raise ValueError(msg)
+
+            items.append(item)
+            self._expect_value = False
+            self._after_comma = False
+            position = end
+
+        self._buffer = buffer[position:]
+        return items
+
+    def _consume_punctuation(self, char: str) -> bool:
+        """Consume the array's own brackets and separators, returning whether ``char`` was one of them."""
+        if self._finished:
+            msg = "Unexpected data after the end of the JSON array"
+            raise ValueError(msg)
+        if not self._started:
+            if char != "[":
+                msg = "Expected the response body to be a JSON array"
+                raise ValueError(msg)
+            self._started = True
+            return True
+        if char == "]":
+            if self._after_comma:
+                msg = "Expected a value after ',' in the JSON array, got ']'"
+                raise ValueError(msg)
+            self._finished = True
+            return True
+        if self._expect_value:
+            return False
+        if char != ",":
+            msg = f"Expected ',' or ']' between the elements of the JSON array, got {char!r}"
+            raise ValueError(msg)
+        self._expect_value = True
+        self._after_comma = True
+        return True
+
+    def close(self) -> None:
+        """Signal the end of the input, raising if the array was not terminated."""
+        if not self._finished or self._buffer.strip(_WHITESPACE):
+            msg = "Incomplete JSON array in response body"
+            raise ValueError(msg)
+
+    @staticmethod
+    def _skip_whitespace(buffer: str, position: int) -> int:
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        return position
+
+
+def _is_number(item: Any) -> bool:  # noqa: ANN401
+    return isinstance(item, int | float) and not isinstance(item, bool)
+
+
+def _truncated(buffer: str, exception: json.JSONDecodeError) -> bool:
+    """Tell whether a decoding error is due to the element being cut short at the end of the buffer.
+
+    That is the case when the error is at the end of the buffer, inside a string still open there, or in a token
+    running up to it, e.g. ``tru`` of ``true`` or ``-`` of ``-1``.
+    """
+    if exception.pos >= len(buffer) or exception.msg.startswith("Unterminated string"):
+        return True
+    return _TOKEN_END.search(buffer, exception.pos) is None
+
+
+def iter_json_array(chunks: Iterable[str]) -> Iterator[Any]:
+    """Yield the elements of a JSON array received as an iterable of text chunks."""
+    parser = JSONArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
@@ -0,0 +1,240 @@
+"""Simulating how S&S splits an order across warehouses."""
+
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Literal
+
+from .catalog import Catalog
+from .inventory import InventoryTracker
+from .models import OrderRequest, OrderRequestOrderLine, Product, Warehouse
+
+AllocationPreference = Literal["fewest", "fastest"]
+
+# A line's product, the quantity ordered, and the warehouses it may ship from, by abbreviation.
+_Line = tuple[Product, int, dict[str, Warehouse]]
+# The index of a line, the warehouse shipping it and the quantity shipped.
+_Shipment = tuple[int, str, int]
+
+
+@dataclass(frozen=True, slots=True)
+class Allocation:
+    """A quantity of an order line shipped from a warehouse."""
+
+    line: int
+    identifier: str
+    warehouse_abbr: str
+    quantity: int
+
+
+@dataclass(frozen=True, slots=True)
+class AllocationPlan:
+    """How an order's lines are split across warehouses.
+
+    ``preference`` is the strategy the plan was built with, which is ``fastest`` when ``fewest`` could not fill
+    the order within its maximum days in transit. ``unfilled`` maps the index of each line that could not be
+    filled in full, e.g. for lack of stock or an unknown identifier, to its missing quantity.
+    """
+
+    preference: AllocationPreference
+    allocations: tuple[Allocation, ...]
+    unfilled: dict[int, int] = field(default_factory=dict)
+    transit_days: Mapping[str, int] = field(default_factory=dict, repr=False)
+
+    @property
+    def warehouses(self) -> tuple[str, ...]:
+        """Get the warehouses shipping the order, in allocation order."""
+        return tuple(dict.fromkeys(allocation.warehouse_abbr for allocation in self.allocations))
+
+    @property
+    def shipments(self) -> int:
+        """Get the number of warehouses shipping the order."""
+        return len(self.warehouses)
+
+    @property
+    def complete(self) -> bool:
+        """Check whether every line is filled in full."""
+        return not self.unfilled
+
+    @property
+    def max_transit_days(self) -> float:
+        """Get the days in transit of the slowest shipment; ``inf`` when unknown for a warehouse, 0 if none."""
+        return max((self.transit_days.get(abbr, math.inf) for abbr in self.warehouses), default=0)
+
+    def order_lines(self) -> list[OrderRequestOrderLine]:
+        """Get the allocations as order lines pinned to their warehouse, to submit the plan as is."""
+        return [
+            OrderRequestOrderLine.model_validate(
+                {
+                    "identifier": allocation.identifier,
+                    "qty": allocation.quantity,
+                    "warehouseAbbr": allocation.warehouse_abbr,
+                },
+            )
+            for allocation in self.allocations
+        ]
+
+
+class WarehouseAllocator:
+    """Splits orders across warehouses locally, the way ``autoselect_warehouse`` has S&S do it.
+
+    ``transit_days`` maps warehouse abbreviations to the days in transit to the ship-to address. Stock comes from
+    the ``catalog``, or from ``inventory`` when given. Each order is allocated against its own copy of the stock,
+    so any number of candidate carts can be evaluated with the same allocator.
+
+    The ``fastest`` preference fills each line from the warehouses with the fewest days in transit first. The
+    ``fewest`` preference minimizes the number of shipments, greedily picking the warehouse able to ship the most
+    units still needed among those within the maximum days in transit; when that cannot fill the order, it
+    switches to ``fastest``, like S&S does. Warehouses that only sell full cases only ship whole cases, and lines
+    pinned to a warehouse only ship from it.
+    """
+
+    def __init__(
+        self,
+        catalog: Catalog,
+        transit_days: Mapping[str, int],
+        inventory: InventoryTracker | None = None,
+    ) -> None:
+        self.catalog = catalog
+        self.transit_days = transit_days
+        self.inventory = inventory
+
+    def allocate(self, order_request: OrderRequest) -> AllocationPlan:
+        """Allocate an order with its own warehouse preference, maximum days in transit and allowed warehouses.
+
+        Only orders setting ``autoselect_warehouse`` are split by S&S, so others are rejected with a
+        :class:`ValueError` rather than allocated in a way S&S would not ship them; use :meth:`allocate_lines` to
+        plan their lines regardless.
+        """
+        if not order_request.autoselect_warehouse:
+            msg = f"Order {order_request.po_number} does not let S&S select its warehouses (autoselect_warehouse)"
+            raise ValueError(msg)
+        warehouses = None
+        if order_request.autoselect_warehouse_warehouses:
+            warehouses = [abbr.strip() for abbr in order_request.autoselect_warehouse_warehouses.split(",")]
+        return self.allocate_lines(
+            order_request.lines,
+            preference=order_request.autoselect_warehouse_preference,
+            max_transit_days=order_request.autoselect_warehouse_fewest_max_dit,
+            warehouses=warehouses,
+        )
+
+    def allocate_lines(
+        self,
+        lines: Sequence[OrderRequestOrderLine],
+        *,
+        preference: AllocationPreference = "fewest",
+        max_transit_days: int = 10,
+        warehouses: Iterable[str] | None = None,
+    ) -> AllocationPlan:
+        """Allocate order lines, only shipping from ``warehouses`` when given."""
+        allowed = None if warehouses is None else frozenset(warehouses)
+        resolved: dict[int, _Line] = {}
+        unfilled: dict[int, int] = {}
+        for index, line in enumerate(lines):
+            product = self.catalog.lookup(line.identifier)
+            if product is None:
+                unfilled[index] = line.quantity
+            elif line.quantity > 0:
+                pinned = line.warehouse_abbreviation
+                eligible = {
+                    warehouse.warehouse_abbr: warehouse
+                    for warehouse in product.warehouses
+                    if warehouse.warehouse_abbr == pinned
+                    or (pinned is None and (allowed is None or warehouse.warehouse_abbr in allowed))
+                }
+                resolved[index] = (product, line.quantity, eligible)
+
+        shipments = self._fewest(resolved, max_transit_days) if preference == "fewest" else None
+        if shipments is None:
+            preference = "fastest"
+            shipments, unfilled_lines = self._fastest(resolved)
+            unfilled |= unfilled_lines
+
+        allocations = sorted(
+            (Allocation(index, lines[index].identifier, abbr, quantity) for index, abbr, quantity in shipments),
+            key=lambda allocation: allocation.line,
+        )
+        return AllocationPlan(preference, tuple(allocations), dict(sorted(unfilled.items())), self.transit_days)
+
+    def _fastest(self, lines: dict[int, _Line]) -> tuple[list[_Shipment], dict[int, int]]:
+        """Fill each line from the warehouses with the fewest days in transit first."""
+        stock = _Stock(self.inventory)
+        shipments: list[_Shipment] = []
+        unfilled: dict[int, int] = {}
+        for index, (product, quantity, eligible) in lines.items():
+            needed = quantity
+            for abbr in sorted(eligible, key=lambda abbr: (self.transit_days.get(abbr, math.inf), abbr)):
+                shipped = stock.take(product, eligible[abbr], needed)
+                if shipped:
+                    shipments.append((index, abbr, shipped))
+                    needed -= shipped
+                    if not needed:
+                        break
+            if needed:
+                unfilled[index] = needed
+        return shipments, unfilled
+
+    def _fewest(self, lines: dict[int, _Line], max_transit_days: int) -> list[_Shipment] | None:
+        """Fill the order from as few warehouses within ``max_transit_days`` as possible, or get ``None``."""
+        stock = _Stock(self.inventory)
+        needed = {index: quantity for index, (_, quantity, _) in lines.items()}
+        candidates = {
+            abbr
+            for _, _, eligible in lines.values()
+            for abbr in eligible
+            if self.transit_days.get(abbr, math.inf) <= max_transit_days
+        }
+        shipments: list[_Shipment] = []
+        while needed and candidates:
+            best = max(
+                candidates,
+                key=lambda abbr: (stock.coverage(lines, needed, abbr), -self.transit_days[abbr], abbr),
+            )
+            candidates.remove(best)
+            for index in list(needed):
+                product, _, eligible = lines[index]
+                if best not in eligible:
+                    continue
+                shipped = stock.take(product, eligible[best], needed[index])
+                if shipped:
+                    shipments.append((index, best, shipped))
+                    needed[index] -= shipped
+                    if not needed[index]:
+                        del needed[index]
+        return None if needed else shipments
+
+
+class _Stock:
+    """The stock left while allocating an order, read from the catalog or the inventory on first use."""
+
+    def __init__(self, inventory: InventoryTracker | None) -> None:
+        self._inventory = inventory
+        self._left: dict[tuple[int, str], int] = {}
+
+    def available(self, product: Product, warehouse: Warehouse, needed: int) -> int:
+        """Get how much of ``needed`` a warehouse can ship, in whole cases if it only sells full cases."""
+        key = (product.sku_id_master, warehouse.warehouse_abbr)
+        left = self._left.get(key)
+        if left is None:
+            left = self._left[key] = warehouse.qty if self._inventory is None else self._inventory.qty(*key)
+        available = max(min(left, needed), 0)
+        if warehouse.full_case_only and product.case_qty > 0:
+            available -= available % product.case_qty
+        return available
+
+    def take(self, product: Product, warehouse: Warehouse, needed: int) -> int:
+        """Ship as much of ``needed`` as a warehouse can, returning the quantity shipped."""
+        shipped = self.available(product, warehouse, needed)
+        self._left[product.sku_id_master, warehouse.warehouse_abbr] -= shipped
+        return shipped
+
+    def coverage(self, lines: dict[int, _Line], needed: dict[int, int], warehouse_abbr: str) -> int:
+        """Get the number of units still needed that a warehouse can ship."""
+        total = 0
+        for index, quantity in needed.items():
+            product, _, eligible = lines[index]
+            warehouse = eligible.get(warehouse_abbr)
+            if warehouse is not None:
+                total += self.available(product, warehouse, quantity)
+        return total
@@ -0,0 +1,195 @@
+"""Persistent, on-disk caching of the product catalog."""
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import closing
+from datetime import timedelta
+from os import PathLike
+from types import TracebackType
+from typing import Any, Self
+
+from .models import Product
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    sku_id_master INTEGER PRIMARY KEY,
+    position INTEGER NOT NULL,
+    generation INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metadata (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    generation INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+"""
+
+
+# Products buffered by a writer before being staged in one short transaction.
+_STAGING_BATCH_SIZE = 1000
+
+_STAGING_SCHEMA = """
+CREATE TEMP TABLE staged_products (
+    position INTEGER PRIMARY KEY,
+    sku_id_master INTEGER NOT NULL,
+    data TEXT NOT NULL
+)
+"""
+
+
+class CatalogCacheWriter:
+    """Writes a downloaded catalog into a :class:`CatalogCache`, replacing the cached one once complete.
+
+    Products are staged in a temporary table private to the writer's connection, a batch at a time, so the cache
+    is not locked while the download is in progress, however slowly it is consumed. The staged catalog replaces
+    the cached one in a single short transaction if the context exits without an exception; otherwise it is
+    discarded, so an interrupted download leaves the previously cached catalog untouched.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, headers: Mapping[str, str]) -> None:
+        self.etag = headers.get("ETag")
+        self.last_modified = headers.get("Last-Modified")
+        self._connection = connection
+        self._batch: list[tuple[int, int, str]] = []
+        self._position = 0
+
+    def __enter__(self) -> Self:
+        """Create the staging table."""
+        self._connection.execute(_STAGING_SCHEMA)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Replace the cached catalog with the staged one, or discard it if the download failed or was abandoned."""
+        try:
+            if exc_type is None:
+                self._flush()
+                self._replace()
+        finally:
+            self._connection.close()
+
+    def write(self, product: Mapping[str, Any]) -> None:
+        """Stage one raw product, as returned by the API."""
+        self._batch.append((self._position, product["skuID_Master"], json.dumps(product, separators=(",", ":"))))
+        self._position += 1
+        if len(self._batch) >= _STAGING_BATCH_SIZE:
+            self._flush()
+
+    def write_many(self, products: Iterable[Mapping[str, Any]]) -> None:
+        """Stage raw products in order, e.g. a batch written from a worker thread."""
+        for product in products:
+            self.write(product)
+
+    def _flush(self) -> None:
+        """Stage the buffered products, committing at once so that no transaction outlives the call."""
+        with self._connection:
+            self._connection.executemany("INSERT INTO staged_products VALUES (?, ?, ?)", self._batch)
+        self._batch = []
+
+    def _replace(self) -> None:
+        """Upsert the staged products by ``sku_id_master``, and delete the cached ones missing from them."""
+        with self._connection:
+            self._connection.execute("BEGIN IMMEDIATE")
+            row = self._connection.execute("SELECT generation FROM metadata").fetchone()
+            generation = 0 if row is None else row[0] + 1
+            self._connection.execute(
+                "INSERT INTO products (sku_id_master, position, generation, data) "
+                "SELECT sku_id_master, position, ?, data FROM staged_products WHERE true ORDER BY position "
+                "ON CONFLICT (sku_id_master) DO UPDATE "
+                "SET position = excluded.position, generation = excluded.generation, data = excluded.data",
+                (generation,),
+            )
+            self._connection.execute("DELETE FROM products WHERE generation != ?", (generation,))
+            self._connection.execute(
+                "INSERT OR REPLACE INTO metadata (id, generation, fetched_at, etag, last_modified) "
+                "VALUES (0, ?, ?, ?, ?)",
+                (generation, time.time(), self.etag, self.last_modified),
+            )
+
+
+class CatalogCache:
+    """A SQLite-backed cache of the product catalog, keyed by ``sku_id_master``.
+
+    Pass an instance to the client as ``catalog_cache`` to serve catalog reads locally. Within ``ttl`` of the
+    last download the catalog is read straight from disk. Once stale, the client revalidates it with a
+    conditional request using any ``ETag``/``Last-Modified`` headers the API sent, so an unchanged catalog is
+    not downloaded again. A download only replaces the cached catalog once it completes; rows are upserted by
+    ``sku_id_master`` and only the rows missing from the new catalog are deleted.
+
+    A changed catalog is downloaded in full: S&S offers no way to list the products changed since a given time,
+    and answers conditional requests for the whole catalog only. To refresh part of a catalog, e.g. a few styles
+    or SKUs, use :meth:`SSActivewear.iter_products_sharded` instead.
+
+    Connections are not tied to the thread that opened them, so the asynchronous client can run each step in a
+    worker thread; a cache must still not be used by several threads at once.
+    """
+
+    def __init__(self, path: str | PathLike[str], ttl: timedelta = timedelta(hours=1)) -> None:
+        self.path = path
+        self.ttl = ttl
+
+        with closing(self._connect()) as connection, connection:
+            connection.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, check_same_thread=False)
+
+    def _metadata(self) -> tuple[int, float, str | None, str | None] | None:
+        with closing(self._connect()) as connection:
+            return connection.execute(  # type: ignore[no-any-return]
+                "SELECT generation, fetched_at, etag, last_modified FROM metadata",
+            ).fetchone()
+
+    def is_fresh(self) -> bool:
+        """Whether the cached catalog was downloaded or revalidated within the TTL."""
+        metadata = self._metadata()
+        return metadata is not None and time.time() - metadata[1] < self.ttl.total_seconds()
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers making a catalog request conditional on it having changed since it was cached."""
+        metadata = self._metadata()
+        headers: dict[str, str] = {}
+        if metadata is None:
+            return headers
+        _, _, etag, last_modified = metadata
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def mark_not_modified(self) -> None:
+        """Record that the API confirmed the cached catalog is current, restarting the TTL."""
+        with closing(self._connect()) as connection, connection:
+            connection.execute("UPDATE metadata SET fetched_at = ?", (time.time(),))
+
+    def refresh(self, headers: Mapping[str, str]) -> CatalogCacheWriter:
+        """Start replacing the cached catalog with a new download, given the response's headers."""
+        return CatalogCacheWriter(self._connect(), headers)
+
+    def iter_products(self) -> Iterator[Product]:
+        """Yield the cached products, in the order the API returned them."""
+        with closing(self._connect()) as connection:
+            for (data,) in connection.execute("SELECT data FROM products ORDER BY position"):
+                yield Product.model_validate_json(data)
+
+    def iter_batches(self, size: int = 1000) -> Iterator[list[Product]]:
+        """Yield the cached products in order, ``size`` at a time, e.g. to read each batch in a worker thread."""
+        with closing(self._connect()) as connection:
+            cursor = connection.execute("SELECT data FROM products ORDER BY position")
+            while rows := cursor.fetchmany(size):
+                yield [Product.model_validate_json(data) for (data,) in rows]
+
+    def clear(self) -> None:
+        """Remove every cached product, forcing the next read to download the catalog."""
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM products")
+            connection.execute("DELETE FROM metadata")
@@ -0,0 +1,92 @@
+"""Indexed, in-memory product catalog."""
+
+from collections import defaultdict
+from collections.abc import Callable, Hashable, Iterable, Iterator
+
+from .models import Product
+
+
+def _unique_index(products: list[Product], key: Callable[[Product], Hashable]) -> dict[Hashable, Product]:
+    index: dict[Hashable, Product] = {}
+    for product in products:
+        value = key(product)
+        if value != "":
+            index.setdefault(value, product)
+    return index
+
+
+def _group_index(products: list[Product], key: Callable[[Product], Hashable]) -> dict[Hashable, tuple[Product, ...]]:
+    groups: defaultdict[Hashable, list[Product]] = defaultdict(list)
+    for product in products:
+        groups[key(product)].append(product)
+    return {value: tuple(group) for value, group in groups.items()}
+
+
+class Catalog:
+    """A product catalog with hash indexes for constant-time lookups.
+
+    Build one from any product iterable, such as :meth:`SSActivewear.iter_products`. Unique identifiers
+    (``sku_id_master``, ``sku``, ``gtin`` and ``your_sku``) resolve to a single product; blank ``gtin`` and
+    ``your_sku`` values are not indexed. Grouping attributes (``style_id``, ``brand_id``, ``color_code`` and
+    ``size_code``) resolve to every matching product, in catalog order.
+    """
+
+    def __init__(self, products: Iterable[Product]) -> None:
+        self._products = list(products)
+
+        self._by_sku_id_master = _unique_index(self._products, lambda product: product.sku_id_master)
+        self._by_sku = _unique_index(self._products, lambda product: product.sku)
+        self._by_gtin = _unique_index(self._products, lambda product: product.gtin)
+        self._by_your_sku = _unique_index(self._products, lambda product: product.your_sku)
+
+        self._by_style_id = _group_index(self._products, lambda product: product.style_id)
+        self._by_brand_id = _group_index(self._products, lambda product: product.brand_id)
+        self._by_color_code = _group_index(self._products, lambda product: product.color_code)
+        self._by_size_code = _group_index(self._products, lambda product: product.size_code)
+
+    def __len__(self) -> int:
+        """Return the number of products in the catalog."""
+        return len(self._products)
+
+    def __iter__(self) -> Iterator[Product]:
+        """Iterate over the products, in catalog order."""
+        return iter(self._products)
+
+    def by_sku_id_master(self, sku_id_master: int) -> Product | None:
+        """Get the product with the given master SKU ID."""
+        return self._by_sku_id_master.get(sku_id_master)
+
+    def by_sku(self, sku: str) -> Product | None:
+        """Get the product with the given S&S SKU."""
+        return self._by_sku.get(sku)
+
+    def by_gtin(self, gtin: str) -> Product | None:
+        """Get the product with the given GTIN."""
+        return self._by_gtin.get(gtin)
+
+    def by_your_sku(self, your_sku: str) -> Product | None:
+        """Get the product with the given cross-referenced SKU."""
+        return self._by_your_sku.get(your_sku)
+
+    def lookup(self, identifier: str) -> Product | None:
+        """Resolve an order line identifier, which may be a master SKU ID, a SKU or a GTIN."""
+        product = self._by_sku.get(identifier) or self._by_gtin.get(identifier)
+        if product is None and identifier.isdigit():
+            product = self._by_sku_id_master.get(int(identifier))
+        return product
+
+    def by_style_id(self, style_id: int) -> tuple[Product, ...]:
+        """Get every color and size of a style."""
+        return self._by_style_id.get(style_id, ())
+
+    def by_brand_id(self, brand_id: str) -> tuple[Product, ...]:
+        """Get every product of a brand."""
+        return self._by_brand_id.get(brand_id, ())
+
+    def by_color_code(self, color_code: str) -> tuple[Product, ...]:
+        """Get every product with the given color code."""
+        return self._by_color_code.get(color_code, ())
+
+    def by_size_code(self, size_code: str) -> tuple[Product, ...]:
+        """Get every product with the given size code."""
+        return self._by_size_code.get(size_code, ())
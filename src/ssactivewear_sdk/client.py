@@ -1,23 +1,108 @@
 """Interacting with S&S' API."""
 
+import asyncio
+import time
 import uuid
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import Future
+from contextlib import aclosing, contextmanager
+from datetime import datetime
 from http import HTTPStatus
-from typing import Any
+from types import TracebackType
+from typing import Any, Self, cast, overload
+from urllib.parse import quote, urlsplit
 
-from httpx import Client
+from httpx import (
+    AsyncBaseTransport,
+    AsyncByteStream,
+    AsyncClient,
+    BaseTransport,
+    Client,
+    Limits,
+    Request,
+    Response,
+    ResponseNotRead,
+    SyncByteStream,
+    TransportError,
+)
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
+from ._concurrency import AsyncSingleFlight, SingleFlight, abounded_map, bounded_map
+from ._files import utc
+from ._streaming import JSONArrayParser
+from .cache import CatalogCache
+from .codec import dump_order_request
 from .exceptions import SSActivewearBadRequestError
-from .models import ErrorResponse, OrderRequest, OrderResponseContainer, Product
+from .instrumentation import (
+    AsyncMeteredStream,
+    Instrumentation,
+    MeteredStream,
+    OperationMetrics,
+    PhaseTracer,
+    RequestMetrics,
+)
+from .models import ErrorResponse, OrderRequest, OrderResponse, OrderResponseContainer, PartialProduct, Product
+from .retry import RetryPolicy, TokenBucket
+from .sharding import CatalogShard, identifier_chunks, query_shards
 
+OrderOutcome = OrderResponseContainer | SSActivewearBadRequestError
 
-class SSActivewear:
-    """A class wrapping S&S' API."""
+# A product query, with its filters materialized so that identical concurrent queries can be coalesced.
+_ProductsKey = tuple[
+    bool,
+    tuple[int, ...] | None,
+    tuple[str, ...] | None,
+    tuple[str, ...] | None,
+    tuple[str, ...] | None,
+]
 
-    def __init__(
+# Like the models themselves, adapters only build their schemas when first used, keeping imports fast.
+_DEFERRED = ConfigDict(defer_build=True)
+
+_PRODUCT_LISTS: dict[type[BaseModel], TypeAdapter[Any]] = {
+    Product: TypeAdapter(list[Product], config=_DEFERRED),
+    PartialProduct: TypeAdapter(list[PartialProduct], config=_DEFERRED),
+}
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_ORDER_RESPONSES = TypeAdapter(list[OrderResponse], config=_DEFERRED)
+_ORDER_RESPONSE_CONTAINER = TypeAdapter(OrderResponseContainer)
+
+# The whole catalog, as fetched when products are not filtered.
+_CATALOG = CatalogShard("/products")
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Matches httpx's own defaults, used when no limits are given.
+DEFAULT_LIMITS = Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# Products read from or written to the catalog cache per trip to a worker thread, by the asynchronous client.
+_CACHE_BATCH_SIZE = 1000
+
+# Shards are far smaller than the whole catalog, so they get a much shorter timeout than `GET /products`.
+_SHARD_TIMEOUT = 60
+
+
+class _BaseSSActivewear:
+    """Behaviour shared by the synchronous and asynchronous clients."""
+
+    def __init__(  # noqa: PLR0913
         self,
         account_number: str,
         token: str,
-        base_url: str = "https://api.ssactivewear.com/v2",
+        base_url: str,
+        *,
+        shared_http_client: bool,
+        limits: Limits | None,
+        http2: bool,
+        transport: BaseTransport | AsyncBaseTransport | None,
+        catalog_cache: CatalogCache | None,
+        retry_policy: RetryPolicy,
+        rate_limiter: TokenBucket | None,
+        instrumentation: Instrumentation | None,
     ) -> None:
         try:
             int(account_number)
@@ -31,49 +116,1012 @@ class SSActivewear:
             msg = "Token is not a valid UUID!"
             raise TypeError(msg) from exception
 
-        self.http_client = Client(base_url=base_url, auth=(account_number, token))
+        if shared_http_client and (limits is not None or http2 or transport is not None):
+            msg = "limits, http2 and transport cannot be set when an http_client is supplied!"
+            raise TypeError(msg)
+
+        self.base_url = base_url.rstrip("/")
+        self._base_path = urlsplit(self.base_url).path
+        self._auth = (account_number, token)
+        self._owns_http_client = not shared_http_client
+        self.catalog_cache = catalog_cache
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.instrumentation = instrumentation
+
+    def _throttle_delay(self) -> float:
+        """Take a request token from the rate limiter, returning how long to wait before sending."""
+        return 0.0 if self.rate_limiter is None else self.rate_limiter.reserve()
+
+    def _retry_delay(
+        self,
+        request: Request,
+        attempt: int,
+        response: Response | None = None,
+        exception: TransportError | None = None,
+    ) -> float | None:
+        """Record a response with the rate limiter and decide whether, and after how long, to retry the request."""
+        if response is not None and self.rate_limiter is not None:
+            self.rate_limiter.observe(response)
+        return self.retry_policy.retry_delay(
+            attempt,
+            idempotent=request.method in _IDEMPOTENT_METHODS,
+            response=response,
+            exception=exception,
+        )
+
+    def _request_metrics(self, request: Request) -> RequestMetrics | None:
+        """Start measuring a request, if the client is instrumented."""
+        if self.instrumentation is None:
+            return None
+        path = request.url.path
+        return RequestMetrics(
+            method=request.method,
+            path=path,
+            route=self._route(path),
+            request_bytes=len(request.content),
+        )
+
+    def _route(self, path: str) -> str:
+        """Replace the identifiers of a request path, e.g. the SKUs of ``/v2/products/B00760004,B00760005``."""
+        resource, slash, identifiers = path.removeprefix(self._base_path).lstrip("/").partition("/")
+        return f"{self._base_path}/{resource}{slash}{'{identifiers}' if identifiers else ''}"
+
+    @staticmethod
+    def _response_bytes(response: Response) -> int:
+        """Get the size of the body read so far, including bodies loaded before sending (e.g. by mock transports)."""
+        if response.num_bytes_downloaded or not response.is_closed:
+            return response.num_bytes_downloaded
+        try:
+            return len(response.content)
+        except ResponseNotRead:
+            return 0
+
+    def _record_attempt(self, metrics: RequestMetrics | None, attempt: int, response: Response | None) -> None:
+        """Record the outcome of an attempt at sending a request."""
+        if metrics is not None:
+            metrics.attempts = attempt
+            metrics.status_code = None if response is None else response.status_code
+            metrics.response_bytes = 0 if response is None else self._response_bytes(response)
 
-    def _make_request(
+    def _request_completed(self, metrics: RequestMetrics, started: float, response: Response | None = None) -> None:
+        """Report a request's metrics once it has failed or its response has been read."""
+        metrics.elapsed = time.perf_counter() - started
+        if response is not None:
+            metrics.response_bytes = self._response_bytes(response)
+        if self.instrumentation is not None:
+            self.instrumentation.request_completed(metrics)
+
+    @contextmanager
+    def _measure(self, operation: str) -> Iterator[OperationMetrics]:
+        """Measure an operation, reporting its metrics once it has finished or failed."""
+        metrics = OperationMetrics(operation=operation)
+        started = time.perf_counter()
+        try:
+            yield metrics
+        finally:
+            if self.instrumentation is not None:
+                metrics.elapsed = time.perf_counter() - started
+                self.instrumentation.operation_completed(metrics)
+
+    @staticmethod
+    def _validate_model[M: BaseModel](
+        metrics: OperationMetrics,
+        data: dict[str, Any],
+        model: type[M],
+    ) -> M:
+        """Validate a product or an order, timing it."""
+        started = time.perf_counter()
+        product = model.model_validate(data)
+        metrics.validation += time.perf_counter() - started
+        metrics.validated += 1
+        return product
+
+    def _validate_products[M: BaseModel](
+        self,
+        metrics: OperationMetrics,
+        content: bytes,
+        model: type[M],
+    ) -> list[M]:
+        """Validate a whole catalog body straight from JSON, timing it; parsing counts towards validation."""
+        started = time.perf_counter()
+        products: list[M] = _PRODUCT_LISTS[model].validate_json(content)
+        metrics.validation += time.perf_counter() - started
+        metrics.validated += len(products)
+        return products
+
+    @staticmethod
+    def _product_query(
+        style_ids: Iterable[int] | None,
+        skus: Iterable[str] | None,
+        warehouses: Iterable[str] | None,
+        fields: Iterable[str] | None,
+    ) -> list[CatalogShard] | None:
+        """Get the shards answering a product query, or ``None`` if it asks for the whole catalog."""
+        if style_ids is None and skus is None and warehouses is None and fields is None:
+            return None
+        return query_shards(style_ids=style_ids, skus=skus, warehouses=warehouses, fields=fields)
+
+    @staticmethod
+    def _products_key(
+        trusted: bool,  # noqa: FBT001 - Mirrors the keyword argument of products()
+        style_ids: Iterable[int] | None,
+        skus: Iterable[str] | None,
+        warehouses: Iterable[str] | None,
+        fields: Iterable[str] | None,
+    ) -> _ProductsKey:
+        """Get the key coalescing concurrent product queries, materializing their (possibly one-shot) iterables."""
+        return (
+            trusted,
+            None if style_ids is None else tuple(style_ids),
+            None if skus is None else tuple(skus),
+            None if warehouses is None else tuple(warehouses),
+            None if fields is None else tuple(fields),
+        )
+
+    @staticmethod
+    def _order_queries(identifiers: Iterable[str] | None, *, open_only: bool) -> list[tuple[str, dict[str, str]]]:
+        """Get the paths and query parameters of the requests answering an order query."""
+        if identifiers is None:
+            return [("/orders/", {"lines": "true"} if open_only else {"All": "true", "lines": "true"})]
+        if open_only:
+            msg = "identifiers and open_only cannot be combined"
+            raise ValueError(msg)
+        return [
+            (f"/orders/{','.join(quote(identifier, safe='') for identifier in chunk)}", {"lines": "true"})
+            for chunk in identifier_chunks(identifiers)
+        ]
+
+    @staticmethod
+    def _placed_within(order: dict[str, Any], since: datetime | None, until: datetime | None) -> bool:
+        """Tell whether a raw order was placed within ``[since, until)``, without validating it."""
+        if since is None and until is None:
+            return True
+        placed = utc(datetime.fromisoformat(order["orderDate"]))
+        return (since is None or utc(since) <= placed) and (until is None or placed < utc(until))
+
+    @staticmethod
+    def _raise_for_status(response: Response) -> None:
+        """Raise the appropriate exception for an unsuccessful response."""
+        if response.status_code == HTTPStatus.BAD_REQUEST:
+            error_response = ErrorResponse.model_validate_json(response.content)
+            raise SSActivewearBadRequestError(error_response.message, error_response)
+        response.raise_for_status()
+
+    def _order_response(
+        self,
+        order_request: OrderRequest,
+        content: bytes,
+        metrics: OperationMetrics,
+    ) -> OrderResponseContainer:
+        """Validate the response to `POST /orders` straight from JSON; parsing counts towards validation."""
+        started = time.perf_counter()
+        if order_request.reject_line_errors:
+            orders = _ORDER_RESPONSES.validate_json(content)
+            order_response = OrderResponseContainer.model_validate({"lineErrors": [], "orders": orders})
+        else:
+            order_response = _ORDER_RESPONSE_CONTAINER.validate_json(content)
+        metrics.validation += time.perf_counter() - started
+        metrics.validated += 1
+        return order_response
+
+    @staticmethod
+    def _order_outcome(future: Future[OrderResponseContainer] | asyncio.Task[OrderResponseContainer]) -> OrderOutcome:
+        """Unwrap a completed order submission, returning rather than raising a rejected order's error."""
+        exception = future.exception()
+        if isinstance(exception, SSActivewearBadRequestError):
+            return exception
+        if exception is not None:
+            raise exception
+        return future.result()
+
+
+class SSActivewear(_BaseSSActivewear):
+    """A class wrapping S&S' API.
+
+    By default the client owns a connection pool with httpx's default settings. ``limits``, ``http2`` and
+    ``transport`` tune that pool; HTTP/2 requires the ``httpx[http2]`` extra. Alternatively pass an existing
+    ``http_client`` to share one pool between several instances (e.g. for different accounts); credentials
+    and the base URL are applied per request, and a supplied client is never closed by this class.
+
+    Use the client as a context manager, or call :meth:`close`, to release pooled connections.
+
+    Pass a :class:`~ssactivewear_sdk.cache.CatalogCache` as ``catalog_cache`` to serve catalog reads from disk.
+
+    Failed requests are retried according to ``retry_policy``; pass ``RetryPolicy(max_attempts=1)`` to disable
+    retries. Pass a :class:`~ssactivewear_sdk.retry.TokenBucket` as ``rate_limiter`` to stay under S&S' request
+    quota; share one bucket between clients using the same account.
+
+    Pass an :class:`~ssactivewear_sdk.instrumentation.Instrumentation` as ``instrumentation`` to receive the
+    timings, sizes and retry counts of every request, and the parse and validation costs of every operation.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        account_number: str,
+        token: str,
+        base_url: str = "https://api.ssactivewear.com/v2",
+        *,
+        http_client: Client | None = None,
+        limits: Limits | None = None,
+        http2: bool = False,
+        transport: BaseTransport | None = None,
+        catalog_cache: CatalogCache | None = None,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        rate_limiter: TokenBucket | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        super().__init__(
+            account_number,
+            token,
+            base_url,
+            shared_http_client=http_client is not None,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            catalog_cache=catalog_cache,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            instrumentation=instrumentation,
+        )
+
+        if http_client is None:
+            http_client = Client(
+                base_url=base_url,
+                auth=self._auth,
+                limits=limits or DEFAULT_LIMITS,
+                http2=http2,
+                transport=transport,
+            )
+        self.http_client = http_client
+        self._products_in_flight: SingleFlight[_ProductsKey, tuple[Product | PartialProduct, ...]] = SingleFlight()
+
+    def __enter__(self) -> Self:
+        """Enter the client's context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client on leaving its context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection pool, unless it was supplied by the caller."""
+        if self._owns_http_client:
+            self.http_client.close()
+
+    def _send(self, request: Request, *, stream: bool = False) -> Response:
+        """Send a request, retrying failures as the retry policy allows, and raise if it was unsuccessful.
+
+        With ``stream``, the body of a successful response is left unread for the caller to stream and close.
+        """
+        metrics = self._request_metrics(request)
+        if metrics is None:
+            return self._send_attempts(request, None, stream=stream)
+
+        request.extensions["trace"] = PhaseTracer(metrics).trace
+        started = time.perf_counter()
+        try:
+            response = self._send_attempts(request, metrics, stream=stream)
+        except BaseException:
+            self._request_completed(metrics, started)
+            raise
+
+        # Bodies loaded before sending (e.g. by mock transports) are complete already.
+        if stream and not response.is_closed:
+            response.stream = MeteredStream(
+                cast("SyncByteStream", response.stream),
+                lambda: self._request_completed(metrics, started, response),
+            )
+        else:
+            self._request_completed(metrics, started, response)
+        return response
+
+    def _send_attempts(self, request: Request, metrics: RequestMetrics | None, *, stream: bool) -> Response:
+        """Send a request until it succeeds or may no longer be retried, recording each attempt."""
+        attempt = 1
+        while True:
+            time.sleep(self._throttle_delay())
+            try:
+                response = self.http_client.send(request, auth=self._auth, stream=stream)
+            except TransportError as exception:
+                self._record_attempt(metrics, attempt, None)
+                delay = self._retry_delay(request, attempt, exception=exception)
+                if delay is None:
+                    raise
+            else:
+                self._record_attempt(metrics, attempt, response)
+                delay = self._retry_delay(request, attempt, response=response)
+                if delay is None:
+                    break
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+        if response.is_error:
+            try:
+                response.read()
+                self._record_attempt(metrics, attempt, response)
+                self._raise_for_status(response)
+            finally:
+                response.close()
+        return response
+
+    def _stream_array(
         self,
         method: str,
         path: str,
         params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        metrics: OperationMetrics | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Make a request to SSActivewear, yielding the elements of the JSON array body as they arrive."""
+        request = self._build_request(method, path, params=params, timeout=timeout)
+        yield from self._iter_array(self._send(request, stream=True), metrics)
+
+    @staticmethod
+    def _iter_array(response: Response, metrics: OperationMetrics | None = None) -> Iterator[dict[str, Any]]:
+        """Yield the elements of a streamed response's JSON array body, closing it once done."""
+        parser = JSONArrayParser()
+        parse = 0.0
+        try:
+            for chunk in response.iter_text():
+                started = time.perf_counter()
+                items = parser.feed(chunk)
+                parse += time.perf_counter() - started
+                yield from items
+            parser.close()
+        finally:
+            response.close()
+            if metrics is not None:
+                metrics.parse += parse
+
+    def _build_request(  # noqa: PLR0913
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
         timeout: float | None = None,
-    ) -> dict[str, Any]:
-        """Make a request to SSActivewear."""
-        request = self.http_client.build_request(
+    ) -> Request:
+        """Build a request to SSActivewear."""
+        return self.http_client.build_request(
             method=method,
-            url=path,
+            url=f"{self.base_url}{path}",
             params=params,
             json=json,
+            content=content,
+            headers=headers,
             timeout=timeout,
         )
-        response = self.http_client.send(request)
 
-        if response.status_code == HTTPStatus.BAD_REQUEST:
-            error_response = ErrorResponse.model_validate(response.json())
-            raise SSActivewearBadRequestError(error_response.message, error_response)
-        response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+    @overload
+    def products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: None = None,
+    ) -> list[Product]: ...
+
+    @overload
+    def products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: Iterable[str],
+    ) -> list[PartialProduct]: ...
+
+    def products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> list[Product] | list[PartialProduct]:
+        """Get all products, or those matching the given filters.
+
+        See :meth:`iter_products` for the meaning of the arguments. Concurrent calls from several threads with the
+        same arguments share a single download, and get lists of the same (immutable) products.
+        """
+        query = self._products_key(trusted, style_ids, skus, warehouses, fields)
+        trusted, style_ids, skus, warehouses, fields = query
+        products = self._products_in_flight.do(
+            query,
+            lambda: tuple(
+                self.iter_products(
+                    trusted=trusted,
+                    style_ids=style_ids,
+                    skus=skus,
+                    warehouses=warehouses,
+                    fields=fields,
+                ),
+            ),
+        )
+        return list(products)  # type: ignore[return-value]
+
+    @overload
+    def iter_products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: None = None,
+    ) -> Iterator[Product]: ...
+
+    @overload
+    def iter_products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: Iterable[str],
+    ) -> Iterator[PartialProduct]: ...
+
+    def iter_products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> Iterator[Product | PartialProduct]:
+        """Get all products, or those matching the given filters, yielding each one as soon as it has been received.
+
+        The catalog body is streamed and parsed incrementally, so memory use stays flat regardless of
+        the catalog size. The request is closed once the iterator is exhausted or garbage collected.
 
-    def products(self) -> list[Product]:
-        """Get all products."""
-        product_data = self._make_request("GET", "/products", timeout=500)
-        return [Product.model_validate(dict_) for dict_ in product_data]
+        Products are filtered server-side by ``style_ids`` or by ``skus`` (SKUs, master SKU IDs or GTINs), and
+        their warehouses narrowed to the ``warehouses`` abbreviations. Long style and SKU lists are split over
+        several requests to stay within URL length limits. ``fields`` projects the products to the named
+        :class:`Product` fields, which are then returned as :class:`PartialProduct` models.
+
+        With a catalog cache configured, a fresh cache is read from disk instead and a stale one is revalidated
+        before being downloaded again. Filtered queries bypass the cache.
+
+        With ``trusted`` set, each body is buffered and validated straight from its JSON bytes in a single
+        pydantic-core pass, rather than being streamed into dicts and validated one product at a time. This is
+        markedly faster but holds the raw body in memory and yields nothing until it has been received in full.
+        Validation is just as strict either way, so schema drift is detected in both modes. ``trusted`` is
+        ignored when reading through the catalog cache, as cached products are already validated from JSON.
+        """
+        query = self._product_query(style_ids, skus, warehouses, fields)
+        model: type[Product | PartialProduct] = Product if fields is None else PartialProduct
+        with self._measure("products") as metrics:
+            if query is None and self.catalog_cache is not None:
+                yield from self._iter_cached_products(self.catalog_cache, metrics)
+                return
+
+            for shard in query or [_CATALOG]:
+                params = dict(shard.params)
+                if trusted:
+                    request = self._build_request("GET", shard.path, params=params, timeout=500)
+                    yield from self._validate_products(metrics, self._send(request).content, model)
+                    continue
+
+                for dict_ in self._stream_array("GET", shard.path, params=params, timeout=500, metrics=metrics):
+                    yield self._validate_model(metrics, dict_, model)
+
+    def iter_products_sharded(
+        self,
+        shards: Iterable[CatalogShard],
+        max_concurrency: int = 8,
+        *,
+        completed: set[CatalogShard] | None = None,
+        ordered: bool = False,
+    ) -> Iterator[Product]:
+        """Get the products of many catalog shards, downloading them concurrently over the connection pool.
+
+        Build ``shards`` with :func:`~ssactivewear_sdk.sharding.style_shards`,
+        :func:`~ssactivewear_sdk.sharding.sku_shards` or :func:`~ssactivewear_sdk.sharding.brand_shards`. At most
+        ``max_concurrency`` shards are downloaded at once, and each shard is retried on its own according to the
+        retry policy, so a dropped connection only costs that shard. Products are yielded shard by shard, as each
+        download completes, or in shard order when ``ordered``.
+
+        Pass a set as ``completed`` to make the sync resumable: every shard whose products have all been yielded is
+        added to it, and shards already in it are skipped. If a shard fails for good its error is raised; call
+        again with the same set to resume where the sync left off.
+        """
+        done = set() if completed is None else completed
+        remaining = (shard for shard in shards if shard not in done)
+        with self._measure("products") as metrics:
+            for shard, future in bounded_map(self._fetch_shard, remaining, max_concurrency, ordered=ordered):
+                yield from self._validate_products(metrics, future.result(), Product)
+                done.add(shard)
+
+    def _fetch_shard(self, shard: CatalogShard) -> bytes:
+        """Download the raw body of a catalog shard."""
+        request = self._build_request("GET", shard.path, params=dict(shard.params), timeout=_SHARD_TIMEOUT)
+        return self._send(request).content
+
+    def _iter_cached_products(self, cache: CatalogCache, metrics: OperationMetrics) -> Iterator[Product]:
+        """Get all products through the catalog cache, refreshing it if it is stale."""
+        if not cache.is_fresh():
+            request = self._build_request("GET", "/products", headers=cache.conditional_headers(), timeout=500)
+            response = self._send(request, stream=True)
+            if response.status_code != HTTPStatus.NOT_MODIFIED:
+                with cache.refresh(response.headers) as writer:
+                    for dict_ in self._iter_array(response, metrics):
+                        product = self._validate_model(metrics, dict_, Product)
+                        writer.write(dict_)
+                        yield product
+                return
+
+            response.close()
+            cache.mark_not_modified()
+
+        for product in cache.iter_products():
+            metrics.validated += 1
+            yield product
+
+    def iter_orders(
+        self,
+        identifiers: Iterable[str] | None = None,
+        *,
+        open_only: bool = False,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[OrderResponse]:
+        """Get orders with their lines, yielding each one as soon as it has been received.
+
+        Orders are looked up by ``identifiers`` (order numbers, PO numbers, invoice numbers or GUIDs), split over
+        several requests when the list is long. Otherwise the account's order history is listed, or only its open
+        orders with ``open_only``.
+
+        ``since`` and ``until`` narrow the orders to those placed within ``[since, until)``, naive datetimes being
+        compared as UTC. S&S cannot filter orders by date, so orders outside the window are skipped as the body
+        streams in, before being validated. To only fetch the orders that changed since a previous run, see
+        :class:`~ssactivewear_sdk.reconciliation.OrderSync`.
+        """
+        with self._measure("orders") as metrics:
+            for path, params in self._order_queries(identifiers, open_only=open_only):
+                for dict_ in self._stream_array("GET", path, params=params, timeout=500, metrics=metrics):
+                    if self._placed_within(dict_, since, until):
+                        yield self._validate_model(metrics, dict_, OrderResponse)
 
     def submit_order(self, order_request: OrderRequest) -> OrderResponseContainer:
         """Submit an order to S&S Activewear."""
-        response_data = self._make_request(
-            method="POST",
-            path="/orders",
-            json=order_request.model_dump(mode="json", exclude_none=True, by_alias=True, exclude_unset=True),
+        with self._measure("submit_order") as metrics:
+            request = self._build_request(
+                "POST",
+                "/orders",
+                content=dump_order_request(order_request),
+                headers=_JSON_HEADERS,
+            )
+            response = self._send(request)
+            return self._order_response(order_request, response.content, metrics)
+
+    def submit_orders(
+        self,
+        order_requests: Iterable[OrderRequest],
+        max_concurrency: int = 8,
+        *,
+        ordered: bool = True,
+    ) -> Iterator[tuple[OrderRequest, OrderOutcome]]:
+        """Submit many orders concurrently, sharing the client's connection pool.
+
+        At most ``max_concurrency`` orders are in flight at once, and ``order_requests`` is only consumed as
+        submissions complete, so it may be a lazy iterable of any size. Each order is yielded together with
+        its response, or with the :class:`SSActivewearBadRequestError` it was rejected with; any other error
+        is raised. Results are yielded in input order when ``ordered``, otherwise as each one completes.
+        """
+        for order_request, future in bounded_map(self.submit_order, order_requests, max_concurrency, ordered=ordered):
+            yield order_request, self._order_outcome(future)
+
+
+class AsyncSSActivewear(_BaseSSActivewear):
+    """A class wrapping S&S' API for use with asyncio.
+
+    The connection pool, catalog cache, retries, rate limiting and instrumentation are configured as for
+    :class:`SSActivewear`.
+    Use the client as an async context manager, or call :meth:`aclose`, to release pooled connections.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        account_number: str,
+        token: str,
+        base_url: str = "https://api.ssactivewear.com/v2",
+        *,
+        http_client: AsyncClient | None = None,
+        limits: Limits | None = None,
+        http2: bool = False,
+        transport: AsyncBaseTransport | None = None,
+        catalog_cache: CatalogCache | None = None,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        rate_limiter: TokenBucket | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        super().__init__(
+            account_number,
+            token,
+            base_url,
+            shared_http_client=http_client is not None,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            catalog_cache=catalog_cache,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            instrumentation=instrumentation,
         )
 
-        if order_request.reject_line_errors:
-            response_data = {
-                "lineErrors": [],
-                "orders": response_data,
-            }
+        if http_client is None:
+            http_client = AsyncClient(
+                base_url=base_url,
+                auth=self._auth,
+                limits=limits or DEFAULT_LIMITS,
+                http2=http2,
+                transport=transport,
+            )
+        self.http_client = http_client
+        self._products_in_flight: AsyncSingleFlight[_ProductsKey, tuple[Product | PartialProduct, ...]] = (
+            AsyncSingleFlight()
+        )
+
+    async def __aenter__(self) -> Self:
+        """Enter the client's context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client on leaving its context."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pool, unless it was supplied by the caller."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def _send(self, request: Request, *, stream: bool = False) -> Response:
+        """Send a request, retrying failures as the retry policy allows, and raise if it was unsuccessful.
+
+        With ``stream``, the body of a successful response is left unread for the caller to stream and close.
+        """
+        metrics = self._request_metrics(request)
+        if metrics is None:
+            return await self._send_attempts(request, None, stream=stream)
+
+        request.extensions["trace"] = PhaseTracer(metrics).atrace
+        started = time.perf_counter()
+        try:
+            response = await self._send_attempts(request, metrics, stream=stream)
+        except BaseException:
+            self._request_completed(metrics, started)
+            raise
+
+        # Bodies loaded before sending (e.g. by mock transports) are complete already.
+        if stream and not response.is_closed:
+            response.stream = AsyncMeteredStream(
+                cast("AsyncByteStream", response.stream),
+                lambda: self._request_completed(metrics, started, response),
+            )
+        else:
+            self._request_completed(metrics, started, response)
+        return response
+
+    async def _send_attempts(self, request: Request, metrics: RequestMetrics | None, *, stream: bool) -> Response:
+        """Send a request until it succeeds or may no longer be retried, recording each attempt."""
+        attempt = 1
+        while True:
+            await asyncio.sleep(self._throttle_delay())
+            try:
+                response = await self.http_client.send(request, auth=self._auth, stream=stream)
+            except TransportError as exception:
+                self._record_attempt(metrics, attempt, None)
+                delay = self._retry_delay(request, attempt, exception=exception)
+                if delay is None:
+                    raise
+            else:
+                self._record_attempt(metrics, attempt, response)
+                delay = self._retry_delay(request, attempt, response=response)
+                if delay is None:
+                    break
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        if response.is_error:
+            try:
+                await response.aread()
+                self._record_attempt(metrics, attempt, response)
+                self._raise_for_status(response)
+            finally:
+                await response.aclose()
+        return response
+
+    async def _stream_array(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,  # noqa: ASYNC109 - Passed through to httpx
+        metrics: OperationMetrics | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Make a request to SSActivewear, yielding the elements of the JSON array body as they arrive."""
+        request = self._build_request(method, path, params=params, timeout=timeout)
+        async for item in self._iter_array(await self._send(request, stream=True), metrics):
+            yield item
+
+    @staticmethod
+    async def _iter_array(response: Response, metrics: OperationMetrics | None = None) -> AsyncIterator[dict[str, Any]]:
+        """Yield the elements of a streamed response's JSON array body, closing it once done."""
+        parser = JSONArrayParser()
+        parse = 0.0
+        try:
+            async for chunk in response.aiter_text():
+                started = time.perf_counter()
+                items = parser.feed(chunk)
+                parse += time.perf_counter() - started
+                for item in items:
+                    yield item
+            parser.close()
+        finally:
+            await response.aclose()
+            if metrics is not None:
+                metrics.parse += parse
+
+    def _build_request(  # noqa: PLR0913
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> Request:
+        """Build a request to SSActivewear."""
+        return self.http_client.build_request(
+            method=method,
+            url=f"{self.base_url}{path}",
+            params=params,
+            json=json,
+            content=content,
+            headers=headers,
+            timeout=timeout,
+        )
+
+    @overload
+    async def products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: None = None,
+    ) -> list[Product]: ...
+
+    @overload
+    async def products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: Iterable[str],
+    ) -> list[PartialProduct]: ...
+
+    async def products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> list[Product] | list[PartialProduct]:
+        """Get all products, or those matching the given filters.
+
+        See :meth:`iter_products` for the meaning of the arguments. Concurrent calls with the same arguments share
+        a single download, and get lists of the same (immutable) products.
+        """
+        query = self._products_key(trusted, style_ids, skus, warehouses, fields)
+        trusted, style_ids, skus, warehouses, fields = query
+
+        async def download() -> tuple[Product | PartialProduct, ...]:
+            products = self.iter_products(
+                trusted=trusted,
+                style_ids=style_ids,
+                skus=skus,
+                warehouses=warehouses,
+                fields=fields,
+            )
+            return tuple([product async for product in products])
+
+        return list(await self._products_in_flight.do(query, download))  # type: ignore[return-value]
+
+    @overload
+    def iter_products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: None = None,
+    ) -> AsyncIterator[Product]: ...
+
+    @overload
+    def iter_products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: Iterable[str],
+    ) -> AsyncIterator[PartialProduct]: ...
+
+    async def iter_products(
+        self,
+        *,
+        trusted: bool = False,
+        style_ids: Iterable[int] | None = None,
+        skus: Iterable[str] | None = None,
+        warehouses: Iterable[str] | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncIterator[Product | PartialProduct]:
+        """Get all products, or those matching the given filters, yielding each one as soon as it has been received.
+
+        See :meth:`SSActivewear.iter_products` for the meaning of the arguments.
+        """
+        query = self._product_query(style_ids, skus, warehouses, fields)
+        model: type[Product | PartialProduct] = Product if fields is None else PartialProduct
+        with self._measure("products") as metrics:
+            if query is None and self.catalog_cache is not None:
+                async for product in self._iter_cached_products(self.catalog_cache, metrics):
+                    yield product
+                return
+
+            for shard in query or [_CATALOG]:
+                params = dict(shard.params)
+                if trusted:
+                    request = self._build_request("GET", shard.path, params=params, timeout=500)
+                    for item in self._validate_products(metrics, (await self._send(request)).content, model):
+                        yield item
+                    continue
+
+                async for dict_ in self._stream_array("GET", shard.path, params=params, timeout=500, metrics=metrics):
+                    yield self._validate_model(metrics, dict_, model)
+
+    async def iter_products_sharded(
+        self,
+        shards: Iterable[CatalogShard],
+        max_concurrency: int = 8,
+        *,
+        completed: set[CatalogShard] | None = None,
+        ordered: bool = False,
+    ) -> AsyncIterator[Product]:
+        """Get the products of many catalog shards, downloading them concurrently over the connection pool.
+
+        See :meth:`SSActivewear.iter_products_sharded`.
+        """
+        done = set() if completed is None else completed
+        remaining = (shard for shard in shards if shard not in done)
+        with self._measure("products") as metrics:
+            shard_tasks = abounded_map(self._fetch_shard, remaining, max_concurrency, ordered=ordered)
+            async with aclosing(shard_tasks):
+                async for shard, task in shard_tasks:
+                    for product in self._validate_products(metrics, task.result(), Product):
+                        yield product
+                    done.add(shard)
+
+    async def _fetch_shard(self, shard: CatalogShard) -> bytes:
+        """Download the raw body of a catalog shard."""
+        request = self._build_request("GET", shard.path, params=dict(shard.params), timeout=_SHARD_TIMEOUT)
+        return (await self._send(request)).content
+
+    async def _iter_cached_products(self, cache: CatalogCache, metrics: OperationMetrics) -> AsyncIterator[Product]:
+        """Get all products through the catalog cache, refreshing it if it is stale.
+
+        SQLite is only used from worker threads, a batch of products at a time, so the event loop never blocks on
+        the disk.
+        """
+        if not await asyncio.to_thread(cache.is_fresh):
+            headers = await asyncio.to_thread(cache.conditional_headers)
+            request = self._build_request("GET", "/products", headers=headers, timeout=500)
+            response = await self._send(request, stream=True)
+            if response.status_code != HTTPStatus.NOT_MODIFIED:
+                writer = await asyncio.to_thread(cache.refresh, response.headers)
+                await asyncio.to_thread(writer.__enter__)
+                batch: list[dict[str, Any]] = []
+                try:
+                    async for dict_ in self._iter_array(response, metrics):
+                        product = self._validate_model(metrics, dict_, Product)
+                        batch.append(dict_)
+                        if len(batch) == _CACHE_BATCH_SIZE:
+                            await asyncio.to_thread(writer.write_many, batch)
+                            batch = []
+                        yield product
+                    await asyncio.to_thread(writer.write_many, batch)
+                except BaseException as exception:
+                    await asyncio.to_thread(writer.__exit__, type(exception), exception, exception.__traceback__)
+                    raise
+                await asyncio.to_thread(writer.__exit__, None, None, None)
+                return
+
+            await response.aclose()
+            await asyncio.to_thread(cache.mark_not_modified)
+
+        batches = cache.iter_batches(_CACHE_BATCH_SIZE)
+        while products := await asyncio.to_thread(next, batches, None):
+            metrics.validated += len(products)
+            for product in products:
+                yield product
+
+    async def iter_orders(
+        self,
+        identifiers: Iterable[str] | None = None,
+        *,
+        open_only: bool = False,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> AsyncIterator[OrderResponse]:
+        """Get orders with their lines, yielding each one as soon as it has been received.
+
+        See :meth:`SSActivewear.iter_orders` for the meaning of the arguments.
+        """
+        with self._measure("orders") as metrics:
+            for path, params in self._order_queries(identifiers, open_only=open_only):
+                async for dict_ in self._stream_array("GET", path, params=params, timeout=500, metrics=metrics):
+                    if self._placed_within(dict_, since, until):
+                        yield self._validate_model(metrics, dict_, OrderResponse)
+
+    async def submit_order(self, order_request: OrderRequest) -> OrderResponseContainer:
+        """Submit an order to S&S Activewear."""
+        with self._measure("submit_order") as metrics:
+            request = self._build_request(
+                "POST",
+                "/orders",
+                content=dump_order_request(order_request),
+                headers=_JSON_HEADERS,
+            )
+            response = await self._send(request)
+            return self._order_response(order_request, response.content, metrics)
+
+    async def submit_orders(
+        self,
+        order_requests: Iterable[OrderRequest],
+        max_concurrency: int = 8,
+        *,
+        ordered: bool = True,
+    ) -> AsyncIterator[tuple[OrderRequest, OrderOutcome]]:
+        """Submit many orders concurrently, sharing the client's connection pool.
 
-        return OrderResponseContainer.model_validate(response_data)
+        At most ``max_concurrency`` orders are in flight at once, and ``order_requests`` is only consumed as
+        submissions complete, so it may be a lazy iterable of any size. Each order is yielded together with
+        its response, or with the :class:`SSActivewearBadRequestError` it was rejected with; any other error
+        is raised. Results are yielded in input order when ``ordered``, otherwise as each one completes.
+        """
+        # Closed as soon as the consumer stops, so that the submissions in flight are awaited right away.
+        submissions = abounded_map(self.submit_order, order_requests, max_concurrency, ordered=ordered)
+        async with aclosing(submissions):
+            async for order_request, task in submissions:
+                yield order_request, self._order_outcome(task)
@@ -0,0 +1,25 @@
+"""Encoding order requests as JSON."""
+
+from collections.abc import Sequence
+
+from pydantic import ConfigDict, TypeAdapter
+
+from .models import OrderRequest
+
+# Order requests are serialized by adapters built once and reused for every order, only when first used.
+_ORDER_REQUEST = TypeAdapter(OrderRequest)
+_ORDER_REQUESTS = TypeAdapter(list[OrderRequest], config=ConfigDict(defer_build=True))
+
+
+def dump_order_request(order_request: OrderRequest) -> bytes:
+    """Serialize an order request straight to the JSON body of `POST /orders`.
+
+    Fields are written by alias, and fields left unset or ``None`` are omitted, in a single pydantic-core pass
+    producing bytes, without building an intermediate dict or string.
+    """
+    return _ORDER_REQUEST.dump_json(order_request, by_alias=True, exclude_none=True, exclude_unset=True)
+
+
+def dump_order_requests(order_requests: Sequence[OrderRequest]) -> bytes:
+    """Serialize a batch of order requests to a JSON array in a single pass, e.g. to queue or archive them."""
+    return _ORDER_REQUESTS.dump_json(list(order_requests), by_alias=True, exclude_none=True, exclude_unset=True)
@@ -0,0 +1,214 @@
+"""Exporting the catalog to files, e.g. to mirror it into a data warehouse."""
+
+import argparse
+import os
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Literal
+
+from pydantic import BaseModel, TypeAdapter
+
+from ._files import replacing, utc
+from .client import SSActivewear
+from .models import Product, Warehouse
+
+ExportFormat = Literal["ndjson", "arrow", "parquet"]
+
+_EXTENSIONS: dict[ExportFormat, str] = {"ndjson": ".ndjson", "arrow": ".arrow", "parquet": ".parquet"}
+
+DEFAULT_BATCH_SIZE = 2_000
+
+
+@dataclass(frozen=True, slots=True)
+class ExportResult:
+    """The files written by an export, and the number of rows written to each."""
+
+    products_path: Path
+    warehouses_path: Path
+    products: int
+    warehouses: int
+
+
+class _Writer(ABC):
+    """Writes the rows of a model to a file, a batch at a time."""
+
+    def __init__(self, model: type[BaseModel], path: Path, exclude: frozenset[str]) -> None:
+        self.path = path
+        self.names = [name for name in model.model_fields if name not in exclude]
+
+    @abstractmethod
+    def write(self, rows: Sequence[BaseModel]) -> None:
+        """Write a batch of rows."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finish the file."""
+
+
+class _NDJSONWriter(_Writer):
+    """Writes one JSON object per line, serialized by pydantic-core straight to bytes."""
+
+    def __init__(self, model: type[BaseModel], path: Path, exclude: frozenset[str]) -> None:
+        super().__init__(model, path, exclude)
+        self._adapter = TypeAdapter(model)
+        self._exclude = set(exclude) or None
+        self._file = path.open("wb")
+
+    def write(self, rows: Sequence[BaseModel]) -> None:
+        """Write a batch of rows."""
+        dump_json = self._adapter.dump_json
+        self._file.write(b"\n".join(dump_json(row, exclude=self._exclude) for row in rows) + b"\n")
+
+    def close(self) -> None:
+        """Finish the file."""
+        self._file.close()
+
+
+class _ArrowWriter(_Writer):
+    """Writes an Arrow IPC or a Parquet file, each batch becoming a record batch or a row group."""
+
+    def __init__(self, model: type[BaseModel], path: Path, exclude: frozenset[str], *, parquet: bool) -> None:
+        super().__init__(model, path, exclude)
+        try:
+            import pyarrow as pa  # noqa: PLC0415 - Optional dependency
+            import pyarrow.parquet as pq  # noqa: PLC0415 - Optional dependency
+        except ImportError as exception:
+            msg = "Arrow and Parquet exports require pyarrow; install the idi-ssactivewear-sdk[arrow] extra"
+            raise ImportError(msg) from exception
+
+        self._record_batch = pa.RecordBatch.from_pydict
+        self._schema = pa.schema([(name, _arrow_type(pa, model.model_fields[name].annotation)) for name in self.names])
+        self._datetimes = [name for name in self.names if model.model_fields[name].annotation == datetime | None]
+        self._writer = pq.ParquetWriter(path, self._schema) if parquet else pa.ipc.new_file(path, self._schema)
+
+    def write(self, rows: Sequence[BaseModel]) -> None:
+        """Write a batch of rows."""
+        columns = {name: [getattr(row, name) for row in rows] for name in self.names}
+        for name in self._datetimes:
+            columns[name] = [None if value is None else utc(value) for value in columns[name]]
+        self._writer.write_batch(self._record_batch(columns, schema=self._schema))
+
+    def close(self) -> None:
+        """Finish the file."""
+        self._writer.close()
+
+
+def _arrow_type(pa: Any, annotation: Any) -> Any:  # noqa: ANN401
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation is float:
+        return pa.float64()
+    if annotation in {str, str | None}:
+        return pa.string()
+    if annotation == datetime | None:
+        return pa.timestamp("us", tz="UTC")
+    msg = f"Unsupported column type {annotation!r}"
+    raise TypeError(msg)
+
+
+def _writer(file_format: ExportFormat, model: type[BaseModel], path: Path, exclude: frozenset[str]) -> _Writer:
+    if file_format == "ndjson":
+        return _NDJSONWriter(model, path, exclude)
+    return _ArrowWriter(model, path, exclude, parquet=file_format == "parquet")
+
+
+def export_products(
+    products: Iterable[Product],
+    directory: str | os.PathLike[str],
+    *,
+    file_format: ExportFormat = "ndjson",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> ExportResult:
+    """Export products, such as :meth:`SSActivewear.iter_products`, to a products file and a warehouses file.
+
+    The products file holds every :class:`Product` field but ``warehouses``, which are flattened into the
+    warehouses file, one row per product and warehouse keyed by ``sku_id``. Both are written to ``directory`` as
+    ``products`` and ``warehouses`` with the extension of ``file_format``: newline-delimited JSON, an Arrow IPC
+    file or a Parquet file, the latter two requiring the ``arrow`` extra.
+
+    Products are consumed as they arrive and written ``batch_size`` products at a time, as one Arrow record batch
+    or Parquet row group, so memory use is bounded by the batch size rather than the catalog size. Both files are
+    written under temporary names and only replace any previous export once complete.
+    """
+    if batch_size < 1:
+        msg = "batch_size must be at least 1"
+        raise ValueError(msg)
+
+    directory = Path(directory)
+    extension = _EXTENSIONS[file_format]
+    targets = [directory / f"products{extension}", directory / f"warehouses{extension}"]
+    with ExitStack() as stack:
+        temporary = [stack.enter_context(replacing(target)) for target in targets]
+        writers: list[_Writer] = []
+        try:
+            writers.append(_writer(file_format, Product, temporary[0], frozenset({"warehouses"})))
+            writers.append(_writer(file_format, Warehouse, temporary[1], frozenset()))
+            counts = _write(products, writers[0], writers[1], batch_size)
+        finally:
+            for writer in writers:
+                writer.close()
+    return ExportResult(targets[0], targets[1], *counts)
+
+
+def _write(
+    products: Iterable[Product],
+    products_writer: _Writer,
+    warehouses_writer: _Writer,
+    batch_size: int,
+) -> tuple[int, int]:
+    """Write products and their warehouses in batches, returning the number of rows written to each file."""
+    batch: list[Product] = []
+    counts = [0, 0]
+
+    def flush() -> None:
+        warehouses = [warehouse for product in batch for warehouse in product.warehouses]
+        products_writer.write(batch)
+        if warehouses:
+            warehouses_writer.write(warehouses)
+        counts[0] += len(batch)
+        counts[1] += len(warehouses)
+        batch.clear()
+
+    for product in products:
+        batch.append(product)
+        if len(batch) == batch_size:
+            flush()
+    if batch:
+        flush()
+    return counts[0], counts[1]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Export the catalog from the command line, e.g. in a scheduled sync.
+
+    Credentials are read from the ``SSACTIVEWEAR_ACCOUNT_NUMBER`` and ``SSACTIVEWEAR_TOKEN`` environment variables.
+    """
+    parser = argparse.ArgumentParser(prog="ssactivewear-export", description="Export the S&S Activewear catalog.")
+    parser.add_argument("directory", type=Path, help="directory to write the products and warehouses files to")
+    parser.add_argument("--format", choices=list(_EXTENSIONS), default="ndjson", help="file format to write")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="products written at a time")
+    parser.add_argument("--base-url", default="https://api.ssactivewear.com/v2", help="S&S API to export from")
+    arguments = parser.parse_args(argv)
+
+    account_number = os.environ.get("SSACTIVEWEAR_ACCOUNT_NUMBER")
+    token = os.environ.get("SSACTIVEWEAR_TOKEN")
+    if not account_number or not token:
+        parser.error("set SSACTIVEWEAR_ACCOUNT_NUMBER and SSACTIVEWEAR_TOKEN")
+
+    arguments.directory.mkdir(parents=True, exist_ok=True)
+    with SSActivewear(account_number, token, arguments.base_url) as client:
+        result = export_products(
+            client.iter_products(),
+            arguments.directory,
+            file_format=arguments.format,
+            batch_size=arguments.batch_size,
+        )
+    sys.stdout.write(f"Exported {result.products} products and {result.warehouses} warehouse rows\n")
+    return 0
@@ -0,0 +1,281 @@
+"""Observing the client's requests and operations."""
+
+import bisect
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from httpx import AsyncByteStream, SyncByteStream
+
+# httpcore trace steps, grouped into the phases reported in `RequestMetrics.phases`.
+_PHASES = {
+    "connect_tcp": "connect",
+    "connect_unix_socket": "connect",
+    "start_tls": "tls",
+    "send_connection_init": "send",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "wait",
+    "receive_response_body": "download",
+}
+
+
+@dataclass(kw_only=True)
+class RequestMetrics:
+    """Measurements of one logical request, across all of its attempts.
+
+    ``phases`` holds the seconds spent connecting (``connect``), negotiating TLS (``tls``), sending the request
+    (``send``), waiting for the first byte of the response (``wait``) and downloading its body (``download``).
+    Phases are reported by httpx's default transports; custom transports may report none.
+
+    ``route`` is ``path`` with the identifiers it holds replaced by ``{identifiers}``, such as
+    ``/v2/products/{identifiers}`` for a SKU lookup, so that it takes few distinct values; it defaults to ``path``.
+    """
+
+    method: str
+    path: str
+    route: str = ""
+    status_code: int | None = None
+    attempts: int = 0
+    elapsed: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+    def __post_init__(self) -> None:
+        """Default the route to the path."""
+        self.route = self.route or self.path
+
+    @property
+    def retries(self) -> int:
+        """The number of attempts after the first."""
+        return max(0, self.attempts - 1)
+
+
+@dataclass(kw_only=True)
+class OperationMetrics:
+    """Measurements of one SDK operation, such as a catalog download or an order submission.
+
+    ``parse`` and ``validation`` are the seconds spent decoding JSON and validating models, and ``validated``
+    the number of models validated.
+    """
+
+    operation: str
+    elapsed: float = 0.0
+    parse: float = 0.0
+    validation: float = 0.0
+    validated: int = 0
+
+
+class Instrumentation:
+    """Receives metrics from a client, passed to it as ``instrumentation``.
+
+    Subclass and override the hooks of interest; both do nothing by default. Hooks run synchronously on the
+    thread or event loop making the request, so they should be fast.
+    """
+
+    def request_completed(self, metrics: RequestMetrics) -> None:
+        """Handle the metrics of a request, once its response has been read or it has failed."""
+
+    def operation_completed(self, metrics: OperationMetrics) -> None:
+        """Handle the metrics of an operation, once it has finished or failed."""
+
+
+class LoggingInstrumentation(Instrumentation):
+    """Logs every request and operation."""
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.DEBUG) -> None:
+        self.logger = logger or logging.getLogger("ssactivewear_sdk")
+        self.level = level
+
+    def request_completed(self, metrics: RequestMetrics) -> None:
+        """Log a request."""
+        phases = " ".join(f"{phase}={seconds:.3f}s" for phase, seconds in metrics.phases.items())
+        self.logger.log(
+            self.level,
+            "%s %s -> %s in %.3fs (%d attempts, %d bytes sent, %d bytes received) %s",
+            metrics.method,
+            metrics.path,
+            metrics.status_code,
+            metrics.elapsed,
+            metrics.attempts,
+            metrics.request_bytes,
+            metrics.response_bytes,
+            phases,
+        )
+
+    def operation_completed(self, metrics: OperationMetrics) -> None:
+        """Log an operation."""
+        self.logger.log(
+            self.level,
+            "%s in %.3fs (parse=%.3fs, validation=%.3fs, %d models)",
+            metrics.operation,
+            metrics.elapsed,
+            metrics.parse,
+            metrics.validation,
+            metrics.validated,
+        )
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+
+class Histogram:
+    """A thread-safe histogram with fixed bucket upper bounds."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket containing it (or the maximum, past the last)."""
+        with self._lock:
+            if self.count == 0:
+                return float("nan")
+            rank = q * self.count
+            seen = 0
+            for bound, count in zip(self.buckets, self.counts, strict=False):
+                seen += count
+                if seen >= rank:
+                    return min(bound, self.max)
+            return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        """Summarize the histogram as plain data."""
+        with self._lock:
+            return {
+                "count": self.count,
+                "sum": self.sum,
+                "min": self.min if self.count else None,
+                "max": self.max if self.count else None,
+                "buckets": dict(zip((*self.buckets, float("inf")), self.counts, strict=True)),
+            }
+
+
+class HistogramRegistry(Instrumentation):
+    """Aggregates metrics into in-process histograms, keyed by metric name and labels.
+
+    Request metrics are recorded as ``request.elapsed``, ``request.phase.<phase>``, ``request.request_bytes``,
+    ``request.response_bytes`` and ``request.retries``, labelled with the method, route and status code. Operation
+    metrics are recorded as ``operation.elapsed``, ``operation.parse``, ``operation.validation`` and
+    ``operation.validated``, labelled with the operation.
+    """
+
+    def __init__(self, buckets: Mapping[str, tuple[float, ...]] | None = None) -> None:
+        self._buckets = dict(buckets or {})
+        self._histograms: dict[tuple[str, tuple[tuple[str, str], ...]], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        """Get (or create) the histogram for a metric name and labels."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self._buckets.get(name, DEFAULT_BUCKETS))
+            return histogram
+
+    def __iter__(self) -> Iterator[tuple[str, dict[str, str], Histogram]]:
+        """Iterate over every histogram with its name and labels."""
+        with self._lock:
+            items = list(self._histograms.items())
+        for (name, labels), histogram in items:
+            yield name, dict(labels), histogram
+
+    def request_completed(self, metrics: RequestMetrics) -> None:
+        """Record a request."""
+        labels = {"method": metrics.method, "route": metrics.route, "status_code": str(metrics.status_code)}
+        self.histogram("request.elapsed", **labels).observe(metrics.elapsed)
+        for phase, seconds in metrics.phases.items():
+            self.histogram(f"request.phase.{phase}", **labels).observe(seconds)
+        self.histogram("request.request_bytes", **labels).observe(metrics.request_bytes)
+        self.histogram("request.response_bytes", **labels).observe(metrics.response_bytes)
+        self.histogram("request.retries", **labels).observe(metrics.retries)
+
+    def operation_completed(self, metrics: OperationMetrics) -> None:
+        """Record an operation."""
+        labels = {"operation": metrics.operation}
+        self.histogram("operation.elapsed", **labels).observe(metrics.elapsed)
+        self.histogram("operation.parse", **labels).observe(metrics.parse)
+        self.histogram("operation.validation", **labels).observe(metrics.validation)
+        self.histogram("operation.validated", **labels).observe(metrics.validated)
+
+
+class PhaseTracer:
+    """An httpx ``trace`` extension accumulating the time spent in each phase of a request."""
+
+    def __init__(self, metrics: RequestMetrics) -> None:
+        self.metrics = metrics
+        self._started: dict[str, float] = {}
+
+    def trace(self, event_name: str, info: dict[str, Any]) -> None:  # noqa: ARG002 - Required by httpx
+        """Handle a trace event from a synchronous transport."""
+        step, _, event = event_name.partition(".")[2].rpartition(".")
+        phase = _PHASES.get(step)
+        if phase is None:
+            return
+        if event == "started":
+            self._started[step] = time.perf_counter()
+        elif step in self._started:
+            phases = self.metrics.phases
+            phases[phase] = phases.get(phase, 0.0) + time.perf_counter() - self._started.pop(step)
+
+    async def atrace(self, event_name: str, info: dict[str, Any]) -> None:
+        """Handle a trace event from an asynchronous transport."""
+        self.trace(event_name, info)
+
+
+class MeteredStream(SyncByteStream):
+    """Wraps a response stream, calling ``on_close`` once the caller has finished with it."""
+
+    def __init__(self, stream: SyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the wrapped stream."""
+        yield from self._stream
+
+    def close(self) -> None:
+        """Close the wrapped stream."""
+        try:
+            self._stream.close()
+        finally:
+            self._on_close()
+
+
+class AsyncMeteredStream(AsyncByteStream):
+    """Wraps an async response stream, calling ``on_close`` once the caller has finished with it."""
+
+    def __init__(self, stream: AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Iterate over the wrapped stream."""
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        """Close the wrapped stream."""
+        try:
+            await self._stream.aclose()
+        finally:
+            self._on_close()
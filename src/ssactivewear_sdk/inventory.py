@@ -0,0 +1,160 @@
+"""Tracking inventory and price changes between catalog refreshes."""
+
+from collections.abc import AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Literal
+
+from .client import AsyncSSActivewear, SSActivewear
+from .models import PartialProduct, Product
+
+InventoryEventKind = Literal["stock_out", "restock", "qty_change", "closeout_change", "price_change"]
+
+# The only fields an inventory refresh needs, requested through a projection.
+INVENTORY_FIELDS = (
+    "sku_id_master",
+    "warehouses",
+    "piece_price",
+    "dozen_price",
+    "case_price",
+    "sale_price",
+    "customer_price",
+)
+
+_PRICE_FIELDS = INVENTORY_FIELDS[2:]
+
+# A product's prices, in the order of `_PRICE_FIELDS`.
+_Prices = tuple[float | None, ...]
+# A warehouse's quantity and closeout flag for a SKU, keyed by SKU ID and warehouse abbreviation.
+_StockKey = tuple[int, str]
+_Stock = tuple[int, bool]
+
+
+@dataclass(frozen=True, slots=True)
+class InventoryEvent:
+    """A change to a SKU's stock in a warehouse, or to its prices.
+
+    Stock events (``stock_out``, ``restock`` and ``qty_change``) carry the previous and current quantity,
+    ``closeout_change`` the previous and current closeout flag, and ``price_change`` the previous and current
+    prices as a mapping of field name to price, with ``warehouse_abbr`` unset. SKUs and warehouses appearing or
+    disappearing count as stock moving from or to zero.
+    """
+
+    kind: InventoryEventKind
+    sku_id: int
+    warehouse_abbr: str | None
+    previous: object
+    current: object
+
+
+class InventoryTracker:
+    """Keeps the last inventory snapshot and turns each refresh into a stream of change events.
+
+    The snapshot only holds each warehouse's quantity and closeout flag, keyed by ``(sku_id, warehouse_abbr)``,
+    and each SKU's prices, so it stays small however large the catalog is. The first refresh only records the
+    snapshot; every later one yields the changes since the previous refresh.
+    """
+
+    def __init__(self) -> None:
+        self.stock: dict[_StockKey, _Stock] = {}
+        self.prices: dict[int, _Prices] = {}
+        self._initialized = False
+        # The warehouses of each SKU seen so far in the current refresh.
+        self._warehouses_seen: dict[int, set[str]] = {}
+
+    def qty(self, sku_id: int, warehouse_abbr: str) -> int:
+        """Get a warehouse's stock of a SKU as of the last refresh; SKUs and warehouses not seen have none."""
+        qty, _ = self.stock.get((sku_id, warehouse_abbr), (0, False))
+        return qty
+
+    def refresh(self, client: SSActivewear) -> Iterator[InventoryEvent]:
+        """Download the inventory of the whole catalog and yield what changed."""
+        yield from self.update(client.iter_products(fields=INVENTORY_FIELDS))
+
+    async def arefresh(self, client: AsyncSSActivewear) -> AsyncIterator[InventoryEvent]:
+        """Download the inventory of the whole catalog with an asynchronous client and yield what changed."""
+        async for product in client.iter_products(fields=INVENTORY_FIELDS):
+            for event in self._update_product(product):
+                yield event
+        for event in self._finish():
+            yield event
+
+    def update(
+        self,
+        products: Iterable[Product | PartialProduct],
+        *,
+        complete: bool = True,
+    ) -> Iterator[InventoryEvent]:
+        """Apply a refresh of ``products``, yielding events as soon as each product has been compared.
+
+        Products need at least the fields in :data:`INVENTORY_FIELDS`. Unless the refresh is ``complete``, SKUs
+        missing from it are left untouched rather than treated as removed. The snapshot is only fully updated
+        once the iterator is exhausted.
+        """
+        for product in products:
+            yield from self._update_product(product)
+        yield from self._finish(complete=complete)
+
+    def _update_product(self, product: Product | PartialProduct) -> Iterator[InventoryEvent]:
+        sku_id = product.sku_id_master
+        if sku_id is None:
+            msg = "Inventory refreshes need each product's sku_id_master"
+            raise ValueError(msg)
+
+        prices = tuple(getattr(product, field) for field in _PRICE_FIELDS)
+        previous_prices = self.prices.get(sku_id)
+        if self._initialized and previous_prices is not None and previous_prices != prices:
+            yield InventoryEvent(
+                "price_change",
+                sku_id,
+                None,
+                dict(zip(_PRICE_FIELDS, previous_prices, strict=True)),
+                dict(zip(_PRICE_FIELDS, prices, strict=True)),
+            )
+        self.prices[sku_id] = prices
+
+        seen_warehouses: set[str] = set()
+        for warehouse in product.warehouses or ():
+            key = (sku_id, warehouse.warehouse_abbr)
+            seen_warehouses.add(warehouse.warehouse_abbr)
+            previous = self.stock.get(key)
+            self.stock[key] = (warehouse.qty, warehouse.closeout)
+            if self._initialized:
+                yield from _stock_events(key, previous, (warehouse.qty, warehouse.closeout))
+        self._warehouses_seen[sku_id] = seen_warehouses
+
+    def _finish(self, *, complete: bool = True) -> Iterator[InventoryEvent]:
+        """Drop the rows missing from the refresh, yielding their stock going to zero, and reset for the next one."""
+        for key in [key for key in self.stock if self._is_missing(key, complete=complete)]:
+            previous = self.stock.pop(key)
+            if self._initialized:
+                yield from _stock_events(key, previous, None)
+        if complete:
+            for sku_id in self.prices.keys() - self._warehouses_seen.keys():
+                del self.prices[sku_id]
+        self._initialized = True
+        self._warehouses_seen = {}
+
+    def _is_missing(self, key: _StockKey, *, complete: bool) -> bool:
+        """Check whether a snapshot row was missing from the refresh."""
+        sku_id, warehouse_abbr = key
+        warehouses = self._warehouses_seen.get(sku_id)
+        if warehouses is None:
+            return complete
+        return warehouse_abbr not in warehouses
+
+
+def _stock_events(key: _StockKey, previous: _Stock | None, current: _Stock | None) -> Iterator[InventoryEvent]:
+    """Compare a warehouse's stock of a SKU between refreshes; a missing row counts as no stock, closeout or not."""
+    sku_id, warehouse_abbr = key
+    previous_qty, previous_closeout = previous or (0, False)
+    qty, closeout = current or (0, False)
+    if previous_qty != qty:
+        if qty <= 0 < previous_qty:
+            kind: InventoryEventKind = "stock_out"
+        elif previous_qty <= 0 < qty:
+            kind = "restock"
+        else:
+            kind = "qty_change"
+        yield InventoryEvent(kind, sku_id, warehouse_abbr, previous_qty, qty)
+    if previous is not None and current is not None and previous_closeout != closeout:
+        yield InventoryEvent("closeout_change", sku_id, warehouse_abbr, previous_closeout, closeout)
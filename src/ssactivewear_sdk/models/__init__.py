@@ -1,17 +1,38 @@
 """SDK models."""
 
-from .errors import ErrorDetail, ErrorResponse
-from .orders import (
-    OrderRequest,
-    OrderRequestOrderLine,
-    OrderRequestPaymentProfile,
-    OrderRequestShippingAddress,
-    OrderResponse,
-    OrderResponseContainer,
-    OrderResponseLine,
-    OrderResponseShippingAddress,
-)
-from .products import Product, Warehouse
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .errors import ErrorDetail, ErrorResponse
+    from .orders import (
+        OrderRequest,
+        OrderRequestOrderLine,
+        OrderRequestPaymentProfile,
+        OrderRequestShippingAddress,
+        OrderResponse,
+        OrderResponseContainer,
+        OrderResponseLine,
+        OrderResponseShippingAddress,
+    )
+    from .products import PartialProduct, Product, Warehouse
+
+# Order models pull in email validation, so each module is only imported when one of its models is first used.
+_LAZY_IMPORTS = {
+    "ErrorDetail": ".errors",
+    "ErrorResponse": ".errors",
+    "OrderRequest": ".orders",
+    "OrderRequestOrderLine": ".orders",
+    "OrderRequestPaymentProfile": ".orders",
+    "OrderRequestShippingAddress": ".orders",
+    "OrderResponse": ".orders",
+    "OrderResponseContainer": ".orders",
+    "OrderResponseLine": ".orders",
+    "OrderResponseShippingAddress": ".orders",
+    "PartialProduct": ".products",
+    "Product": ".products",
+    "Warehouse": ".products",
+}
 
 __all__ = [
     "ErrorDetail",
@@ -24,6 +45,23 @@ __all__ = [
     "OrderResponseContainer",
     "OrderResponseLine",
     "OrderResponseShippingAddress",
+    "PartialProduct",
     "Product",
     "Warehouse",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import models on first access."""
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *__all__]
@@ -8,5 +8,9 @@ class SSActivewearBaseModel(
     strict=True,
     extra="forbid",
     frozen=True,
+    defer_build=True,
 ):
-    """Custom base model for global settings."""
+    """Custom base model for global settings.
+
+    Schemas are only built when a model is first used, so importing the models stays cheap.
+    """
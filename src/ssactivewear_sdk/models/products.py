@@ -1,8 +1,9 @@
 """Product models."""
 
 from datetime import datetime
+from typing import Any
 
-from pydantic import Field
+from pydantic import Field, Strict
 
 from ._base import SSActivewearBaseModel
 
@@ -286,3 +287,69 @@ class Product(SSActivewearBaseModel):
         description="Sale expiration date",
         strict=False,
     )
+
+
+def _optional(name: str) -> Any:  # noqa: ANN401
+    """Get an optional copy of a :class:`Product` field, defaulting to ``None``."""
+    field = Product.model_fields[name]
+    strict = next((item.strict for item in field.metadata if isinstance(item, Strict)), None)
+    return Field(default=None, alias=field.alias, description=field.description, strict=strict)
+
+
+class PartialProduct(SSActivewearBaseModel):
+    """A product holding only the fields requested through a projection.
+
+    Every field of :class:`Product` is optional, and ``None`` when it was not requested; see the ``fields``
+    argument of :meth:`SSActivewear.products`. Fields take their alias, description and strictness from
+    :class:`Product`, so only their types are repeated here.
+    """
+
+    sku_id_master: int | None = _optional("sku_id_master")
+    sku: str | None = _optional("sku")
+    gtin: str | None = _optional("gtin")
+    your_sku: str | None = _optional("your_sku")
+    base_category_id: str | None = _optional("base_category_id")
+    brand_id: str | None = _optional("brand_id")
+    brand_name: str | None = _optional("brand_name")
+    style_id: int | None = _optional("style_id")
+    style_name: str | None = _optional("style_name")
+    color_name: str | None = _optional("color_name")
+    color_code: str | None = _optional("color_code")
+    color_price_code_name: str | None = _optional("color_price_code_name")
+    color_group: str | None = _optional("color_group")
+    color_group_name: str | None = _optional("color_group_name")
+    color_family_id: str | None = _optional("color_family_id")
+    color_family: str | None = _optional("color_family")
+    color_swatch_image: str | None = _optional("color_swatch_image")
+    color_swatch_text_color: str | None = _optional("color_swatch_text_color")
+    color_front_image: str | None = _optional("color_front_image")
+    color_side_image: str | None = _optional("color_side_image")
+    color_back_image: str | None = _optional("color_back_image")
+    color_direct_side_image: str | None = _optional("color_direct_side_image")
+    color_on_model_front_image: str | None = _optional("color_on_model_front_image")
+    color_on_model_side_image: str | None = _optional("color_on_model_side_image")
+    color_on_model_back_image: str | None = _optional("color_on_model_back_image")
+    color1: str | None = _optional("color1")
+    color2: str | None = _optional("color2")
+    size_name: str | None = _optional("size_name")
+    size_code: str | None = _optional("size_code")
+    size_order: str | None = _optional("size_order")
+    size_price_code_name: str | None = _optional("size_price_code_name")
+    case_qty: int | None = _optional("case_qty")
+    unit_weight: float | None = _optional("unit_weight")
+    map_price: float | None = _optional("map_price")
+    piece_price: float | None = _optional("piece_price")
+    dozen_price: float | None = _optional("dozen_price")
+    case_price: float | None = _optional("case_price")
+    sale_price: float | None = _optional("sale_price")
+    customer_price: float | None = _optional("customer_price")
+    no_eretailing: bool | None = _optional("no_eretailing")
+    case_weight: float | None = _optional("case_weight")
+    case_width: float | None = _optional("case_width")
+    case_length: float | None = _optional("case_length")
+    case_height: float | None = _optional("case_height")
+    poly_pack_quantity: int | None = _optional("poly_pack_quantity")
+    quantity: int | None = _optional("quantity")
+    country_of_origin: str | None = _optional("country_of_origin")
+    warehouses: list[Warehouse] | None = _optional("warehouses")
+    sale_expiration: datetime | None = _optional("sale_expiration")
@@ -0,0 +1,151 @@
+"""Checking orders against the local catalog before they are submitted."""
+
+from dataclasses import dataclass
+from typing import Literal
+
+from .catalog import Catalog
+from .exceptions import SSActivewearError
+from .inventory import InventoryTracker
+from .models import OrderRequest, OrderRequestOrderLine, Product, Warehouse
+
+PreflightIssueKind = Literal[
+    "invalid_quantity",
+    "unknown_identifier",
+    "unknown_warehouse",
+    "full_case_only",
+    "out_of_stock",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class PreflightIssue:
+    """An order line the API would reject, found before submitting the order.
+
+    ``line`` is the index of the line in :attr:`OrderRequest.lines`.
+    """
+
+    line: int
+    identifier: str
+    kind: PreflightIssueKind
+    message: str
+
+
+class SSActivewearPreflightError(SSActivewearError):
+    """Exception raised for orders failing their preflight checks, before they are submitted."""
+
+    def __init__(self, issues: list[PreflightIssue]) -> None:
+        super().__init__("; ".join(f"Line {issue.line}: {issue.message}" for issue in issues))
+
+        self.issues = issues
+
+
+class OrderPreflight:
+    """Checks order lines against a local catalog, catching the lines the API would reject without a round trip.
+
+    Lines are checked for a positive quantity, an identifier (master SKU ID, SKU or GTIN) known to the
+    ``catalog``, a warehouse carrying the SKU, full case quantities where a warehouse only sells full cases, and
+    enough stock. Stock comes from the catalog, or from ``inventory`` when given, since a tracker refreshed more
+    often than the catalog knows fresher quantities; SKUs missing from the tracker count as out of stock.
+
+    Lines without a warehouse need a single warehouse able to fill them, or enough stock across the warehouses
+    autoselect may pick from when the order allows S&S to split it. Lines are filled in order from the stock left by
+    the lines before them: a line naming a warehouse takes from that warehouse, and one without takes from the
+    warehouse with the most left, or from the fullest warehouses first when split, so pinned and unpinned lines
+    for the same SKU share its stock. The checks only use local data, so a line passing them may still be
+    rejected, e.g. once stock has moved since the last refresh.
+    """
+
+    def __init__(self, catalog: Catalog, inventory: InventoryTracker | None = None) -> None:
+        self.catalog = catalog
+        self.inventory = inventory
+
+    def check(self, order_request: OrderRequest) -> list[PreflightIssue]:
+        """Get the issues with an order's lines, in line order."""
+        allowed = None
+        if order_request.autoselect_warehouse and order_request.autoselect_warehouse_warehouses:
+            allowed = frozenset(abbr.strip() for abbr in order_request.autoselect_warehouse_warehouses.split(","))
+
+        remaining: dict[tuple[int, str], int] = {}
+        issues = []
+        for index, line in enumerate(order_request.lines):
+            issue = self._check_line(index, line, remaining, split=order_request.autoselect_warehouse, allowed=allowed)
+            if issue is not None:
+                issues.append(issue)
+        return issues
+
+    def validate(self, order_request: OrderRequest) -> None:
+        """Raise a :class:`SSActivewearPreflightError` listing the issues with an order's lines, if any."""
+        issues = self.check(order_request)
+        if issues:
+            raise SSActivewearPreflightError(issues)
+
+    def _check_line(
+        self,
+        index: int,
+        line: OrderRequestOrderLine,
+        remaining: dict[tuple[int, str], int],
+        *,
+        split: bool,
+        allowed: frozenset[str] | None,
+    ) -> PreflightIssue | None:
+        """Check a line, taking its quantity from the ``remaining`` stock of its SKU's warehouses once it passes."""
+        quantity = line.quantity
+        if quantity <= 0:
+            return PreflightIssue(index, line.identifier, "invalid_quantity", f"Quantity {quantity} is not positive")
+
+        product = self.catalog.lookup(line.identifier)
+        if product is None:
+            message = f"{line.identifier!r} is not a known SKU, master SKU ID or GTIN"
+            return PreflightIssue(index, line.identifier, "unknown_identifier", message)
+
+        warehouse_abbr = line.warehouse_abbreviation
+        candidates = _warehouses(product, warehouse_abbr, allowed)
+        if not candidates:
+            if warehouse_abbr is not None:
+                kind: PreflightIssueKind = "unknown_warehouse"
+                message = f"{product.sku} is not carried by warehouse {warehouse_abbr}"
+            else:
+                kind = "out_of_stock"
+                message = f"{product.sku} is not carried by any warehouse the order may ship from"
+            return PreflightIssue(index, line.identifier, kind, message)
+
+        partial_case = product.case_qty > 0 and quantity % product.case_qty != 0
+        candidates = [warehouse for warehouse in candidates if not (partial_case and warehouse.full_case_only)]
+        if not candidates:
+            message = f"{product.sku} must be ordered in multiples of its case quantity of {product.case_qty}"
+            return PreflightIssue(index, line.identifier, "full_case_only", message)
+
+        keys = [(product.sku_id_master, warehouse.warehouse_abbr) for warehouse in candidates]
+        touched = any(key in remaining for key in keys)
+        for key, warehouse in zip(keys, candidates, strict=True):
+            remaining.setdefault(key, self._qty(product, warehouse))
+
+        # The fullest warehouses first, as the ones a line without a warehouse is filled from.
+        keys.sort(key=remaining.__getitem__, reverse=True)
+        available = sum(remaining[key] for key in keys) if split and warehouse_abbr is None else remaining[keys[0]]
+        if available < quantity:
+            left = "left after the order's earlier lines" if touched else "available"
+            message = f"{quantity} of {product.sku} ordered, but only {available} {left}"
+            return PreflightIssue(index, line.identifier, "out_of_stock", message)
+
+        unfilled = quantity
+        for key in keys:
+            taken = min(unfilled, remaining[key])
+            remaining[key] -= taken
+            unfilled -= taken
+            if not unfilled:
+                break
+        return None
+
+    def _qty(self, product: Product, warehouse: Warehouse) -> int:
+        """Get a warehouse's stock of a product, preferring the inventory tracker's."""
+        if self.inventory is None:
+            return warehouse.qty
+        return self.inventory.qty(product.sku_id_master, warehouse.warehouse_abbr)
+
+
+def _warehouses(product: Product, warehouse_abbr: str | None, allowed: frozenset[str] | None) -> list[Warehouse]:
+    """Get the warehouses a line may ship from: the one it names, or any the order allows."""
+    if warehouse_abbr is not None:
+        return [warehouse for warehouse in product.warehouses if warehouse.warehouse_abbr == warehouse_abbr]
+    return [warehouse for warehouse in product.warehouses if allowed is None or warehouse.warehouse_abbr in allowed]
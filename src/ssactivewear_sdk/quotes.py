@@ -0,0 +1,232 @@
+"""Pricing order lines in batches, straight from a product table's columns."""
+
+import itertools
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from .table import DictionaryColumn, ProductTable
+
+PriceTier = Literal["piece", "dozen", "case", "customer", "sale"]
+
+# Quantities from which the dozen price applies; the case price applies from the product's case quantity.
+DOZEN = 12
+
+# A quote line: an identifier (master SKU ID, SKU or GTIN) and a quantity.
+QuoteLine = tuple[str, int]
+
+# Price tiers by the codes the vectorized pricing computes, unknown lines being coded -1.
+_TIERS: tuple[PriceTier | None, ...] = ("piece", "dozen", "case", "customer", "sale", None)
+
+_PRICING_COLUMNS = (
+    "piece_price",
+    "dozen_price",
+    "case_price",
+    "customer_price",
+    "sale_price",
+    "sale_expiration",
+    "case_qty",
+    "unit_weight",
+    "case_weight",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Quote:
+    """The prices and weights of a set of lines, held column by column in line order.
+
+    Lines whose identifier is not in the table are listed in ``unknown`` by index, and priced at NaN with no
+    weight; they are left out of ``subtotal``. Weights are in pounds.
+    """
+
+    identifiers: tuple[str, ...]
+    quantities: tuple[int, ...]
+    unit_prices: tuple[float, ...]
+    tiers: tuple[PriceTier | None, ...]
+    line_totals: tuple[float, ...]
+    weights: tuple[float, ...]
+    unknown: tuple[int, ...]
+
+    @property
+    def subtotal(self) -> float:
+        """Get the total price of the lines that were priced."""
+        return round(math.fsum(total for total in self.line_totals if not math.isnan(total)), 2)
+
+    @property
+    def weight(self) -> float:
+        """Get the total weight of the lines."""
+        return math.fsum(self.weights)
+
+
+class QuoteEngine:
+    """Prices many lines at once from a :class:`ProductTable`, without materializing any product.
+
+    A line's unit price is the lowest applicable one of: its quantity break (``piece_price``; ``dozen_price``
+    from a dozen; ``case_price`` from ``case_qty``), ``customer_price``, and ``sale_price`` until
+    ``sale_expiration``. Zero prices are treated as unset. Line weights count full cases at ``case_weight`` and
+    the remaining pieces at ``unit_weight``.
+
+    Identifiers resolve like :meth:`Catalog.lookup`. With the ``numpy`` extra installed, each batch is priced
+    with array operations over the table's column buffers, which tables opened from a file share zero-copy; the
+    columns of in-memory tables are copied once, so that the table can still grow. Without NumPy, lines are
+    priced one by one in Python, with the same results. Either way, pricing many carts with :meth:`quote_many`
+    costs about as much as one large quote.
+    """
+
+    def __init__(self, table: ProductTable) -> None:
+        self.table = table
+        self._rows: dict[str, int] = {}
+        for name in ("sku", "gtin"):
+            for row, value in enumerate(table.column(name)):
+                if value:
+                    self._rows.setdefault(value, row)
+        for row, sku_id in enumerate(_numeric_column(table, "sku_id_master")):
+            self._rows.setdefault(str(sku_id), row)
+
+        self._columns = {name: _numeric_column(table, name) for name in _PRICING_COLUMNS}
+        try:
+            import numpy as np  # noqa: PLC0415 - Optional dependency
+        except ImportError:
+            self._np: Any = None
+        else:
+            self._np = np
+            self._arrays = {
+                name: np.asarray(column) if isinstance(column, memoryview) else np.array(column)
+                for name, column in self._columns.items()
+            }
+
+    def quote(self, lines: Iterable[QuoteLine], at: datetime | None = None) -> Quote:
+        """Price lines, applying the sales running at ``at``, or now."""
+        return self.quote_many([lines], at)[0]
+
+    def quote_many(self, carts: Iterable[Iterable[QuoteLine]], at: datetime | None = None) -> list[Quote]:
+        """Price the lines of many carts in a single batch, applying the sales running at ``at``, or now."""
+        identifiers: list[str] = []
+        quantities: list[int] = []
+        bounds = [0]
+        for cart in carts:
+            for identifier, quantity in cart:
+                identifiers.append(identifier)
+                quantities.append(quantity)
+            bounds.append(len(identifiers))
+
+        if at is None:
+            at = datetime.now(UTC)
+        # Sale expirations are stored like this, naive datetimes being taken as UTC.
+        timestamp = (at if at.tzinfo is not None else at.replace(tzinfo=UTC)).timestamp()
+        unit_prices, tiers, weights = self._price(identifiers, quantities, timestamp)
+        line_totals = [round(price * quantity, 2) for price, quantity in zip(unit_prices, quantities, strict=True)]
+
+        quotes = []
+        for start, stop in itertools.pairwise(bounds):
+            quotes.append(
+                Quote(
+                    tuple(identifiers[start:stop]),
+                    tuple(quantities[start:stop]),
+                    tuple(unit_prices[start:stop]),
+                    tuple(tiers[start:stop]),
+                    tuple(line_totals[start:stop]),
+                    tuple(weights[start:stop]),
+                    tuple(index - start for index in range(start, stop) if tiers[index] is None),
+                ),
+            )
+        return quotes
+
+    def _price(
+        self,
+        identifiers: Sequence[str],
+        quantities: Sequence[int],
+        timestamp: float,
+    ) -> tuple[list[float], list[PriceTier | None], list[float]]:
+        """Get the unit prices, price tiers and weights of a batch of lines."""
+        if self._np is not None and len(self.table):
+            return self._price_arrays(identifiers, quantities, timestamp)
+
+        rows = self._rows
+        columns = self._columns
+        piece, dozen, case = columns["piece_price"], columns["dozen_price"], columns["case_price"]
+        customer, sale, expiration = columns["customer_price"], columns["sale_price"], columns["sale_expiration"]
+        case_qty, unit_weight, case_weight = columns["case_qty"], columns["unit_weight"], columns["case_weight"]
+
+        unit_prices: list[float] = []
+        tiers: list[PriceTier | None] = []
+        weights: list[float] = []
+        for identifier, quantity in zip(identifiers, quantities, strict=True):
+            row = rows.get(identifier)
+            if row is None:
+                unit_prices.append(math.nan)
+                tiers.append(None)
+                weights.append(0.0)
+                continue
+
+            per_case = case_qty[row]
+            tier: PriceTier
+            if 0 < per_case <= quantity and case[row] > 0:
+                price, tier = case[row], "case"
+            elif quantity >= DOZEN and dozen[row] > 0:
+                price, tier = dozen[row], "dozen"
+            else:
+                price, tier = piece[row], "piece"
+            if 0 < customer[row] < price:
+                price, tier = customer[row], "customer"
+            sale_price = sale[row]
+            if 0 < sale_price < price and not expiration[row] <= timestamp:
+                price, tier = sale_price, "sale"
+            unit_prices.append(price)
+            tiers.append(tier)
+
+            full_cases, pieces = divmod(quantity, per_case) if per_case > 0 else (0, quantity)
+            weights.append(full_cases * case_weight[row] + pieces * unit_weight[row])
+        return unit_prices, tiers, weights
+
+    def _price_arrays(
+        self,
+        identifiers: Sequence[str],
+        quantities: Sequence[int],
+        timestamp: float,
+    ) -> tuple[list[float], list[PriceTier | None], list[float]]:
+        """Get the unit prices, price tiers and weights of a batch of lines with NumPy, like :meth:`_price`."""
+        np = self._np
+        found = np.fromiter(map(self._rows.get, identifiers, itertools.repeat(-1)), np.int64, len(identifiers))
+        known = found >= 0
+        # Unknown lines are priced from the first row, then masked out.
+        selected = np.where(known, found, 0)
+        columns = {name: array[selected] for name, array in self._arrays.items()}
+        quantity = np.asarray(quantities, dtype=np.int64)
+
+        per_case = columns["case_qty"]
+        case = (per_case > 0) & (per_case <= quantity) & (columns["case_price"] > 0)
+        dozen = ~case & (quantity >= DOZEN) & (columns["dozen_price"] > 0)
+        price = np.select([case, dozen], [columns["case_price"], columns["dozen_price"]], columns["piece_price"])
+        tier = np.select([case, dozen], [2, 1], 0)
+        customer = columns["customer_price"]
+        customer_applies = (customer > 0) & (customer < price)
+        price = np.where(customer_applies, customer, price)
+        tier = np.where(customer_applies, 3, tier)
+        sale = columns["sale_price"]
+        # Negated so that sales without an expiration, stored as NaN, never expire.
+        sale_applies = (sale > 0) & (sale < price) & ~(columns["sale_expiration"] <= timestamp)
+        price = np.where(sale_applies, sale, price)
+        tier = np.where(sale_applies, 4, tier)
+
+        cased = per_case > 0
+        divisor = np.where(cased, per_case, 1)
+        full_cases = np.where(cased, quantity // divisor, 0)
+        pieces = np.where(cased, quantity % divisor, quantity)
+        weight = full_cases * columns["case_weight"] + pieces * columns["unit_weight"]
+
+        price = np.where(known, price, np.nan)
+        tier = np.where(known, tier, -1)
+        weight = np.where(known, weight, 0.0)
+        return price.tolist(), list(map(_TIERS.__getitem__, tier.tolist())), weight.tolist()
+
+
+def _numeric_column(table: ProductTable, name: str) -> Sequence[Any]:
+    """Get a numeric column of a table."""
+    column = table.column(name)
+    if isinstance(column, DictionaryColumn):
+        msg = f"{name!r} is not a numeric column"
+        raise TypeError(msg)
+    return column
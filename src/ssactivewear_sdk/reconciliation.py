@@ -0,0 +1,121 @@
+"""Reconciling orders incrementally, only fetching the orders that changed since the previous run."""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+from httpx import HTTPStatusError
+
+from ._files import replacing
+from .client import SSActivewear
+from .models import OrderResponse
+
+_VERSION = 1
+
+
+class OrderSync:
+    """Tracks the open orders of an account in a state file, so that each sync only yields what changed.
+
+    Each :meth:`sync` lists the open orders, a single small request, and yields those that are new or changed
+    since the previous sync, e.g. whose ``order_status``, ``delivery_status`` or ``expected_delivery_date``
+    moved. Orders that left the open list since (shipped, invoiced or cancelled) are fetched by GUID and yielded
+    in their final state; those S&S no longer finds, e.g. purged ones, are dropped. Orders the sync never saw open,
+    e.g. placed and shipped between two nightly runs, can be tracked from submission with :meth:`watch`.
+
+    The first sync also yields the history placed since ``history_since``, if given. The state at ``path`` is
+    only updated once a sync has been fully consumed, so an interrupted sync is repeated by the next one and every
+    change is yielded at least once.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], history_since: datetime | None = None) -> None:
+        self.path = Path(path)
+        self.history_since = history_since
+
+    @property
+    def synced_at(self) -> datetime | None:
+        """Get when the last complete sync started, or ``None`` if there was none yet."""
+        state = self._load()
+        if state is None or state["synced_at"] is None:
+            return None
+        return datetime.fromisoformat(state["synced_at"])
+
+    def watch(self, orders: Iterable[OrderResponse]) -> None:
+        """Track orders from now on, e.g. from :meth:`SSActivewear.submit_order`, so the next sync yields them."""
+        state = self._load() or {"synced_at": None, "open": {}}
+        for order in orders:
+            state["open"].setdefault(str(order.guid), "")
+        self._save(state)
+
+    def sync(self, client: SSActivewear) -> Iterator[OrderResponse]:
+        """Yield the orders that changed since the previous sync, in their current state."""
+        started_at = datetime.now(UTC)
+        state = self._load()
+        tracked: dict[str, str] = {} if state is None else state["open"]
+
+        open_orders: dict[str, str] = {}
+        for order in client.iter_orders(open_only=True):
+            guid = str(order.guid)
+            open_orders[guid] = _fingerprint(order)
+            if tracked.get(guid) != open_orders[guid]:
+                yield order
+
+        closed = [guid for guid in tracked if guid not in open_orders]
+        if closed:
+            yield from _closed_orders(client, closed)
+
+        if (state is None or state["synced_at"] is None) and self.history_since is not None:
+            for order in client.iter_orders(since=self.history_since):
+                guid = str(order.guid)
+                if guid not in open_orders and guid not in tracked:
+                    yield order
+
+        self._save({"synced_at": started_at.isoformat(), "open": open_orders})
+
+    def _load(self) -> dict[str, Any] | None:
+        try:
+            state: dict[str, Any] = json.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return None
+        if state.get("version") != _VERSION:
+            msg = f"{self.path} is not an order sync state file, or was written by another version"
+            raise ValueError(msg)
+        return state
+
+    def _save(self, state: dict[str, Any]) -> None:
+        """Write the state to a temporary file and rename it over the previous state."""
+        with replacing(self.path) as temporary, temporary.open("w", encoding="utf-8") as file:
+            json.dump({"version": _VERSION, **state}, file)
+
+
+def _closed_orders(client: SSActivewear, guids: list[str]) -> Iterator[OrderResponse]:
+    """Look up orders by GUID, skipping those that are not found rather than failing every later sync."""
+    found: set[str] = set()
+    try:
+        for order in client.iter_orders(guids):
+            found.add(str(order.guid))
+            yield order
+    except HTTPStatusError as error:
+        if error.response.status_code != HTTPStatus.NOT_FOUND:
+            raise
+    else:
+        return
+
+    # A batch failed on a missing order, so look up the rest one by one to tell which.
+    for guid in guids:
+        if guid in found:
+            continue
+        try:
+            yield from client.iter_orders([guid])
+        except HTTPStatusError as error:
+            if error.response.status_code != HTTPStatus.NOT_FOUND:
+                raise
+
+
+def _fingerprint(order: OrderResponse) -> str:
+    """Get a digest telling apart any two states of an order."""
+    return hashlib.blake2b(order.model_dump_json().encode(), digest_size=16).hexdigest()
@@ -0,0 +1,274 @@
+"""Recording traffic with the API, and replaying it offline.
+
+Recordings are gzip-compressed JSON lines, one per request/response pair. Only the method, path and query of a
+request are kept, never its headers or body, so credentials are not recorded; response headers that could carry
+credentials are dropped too.
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from http import HTTPStatus
+from os import PathLike
+from typing import Any, Self
+
+from httpx import (
+    AsyncBaseTransport,
+    AsyncByteStream,
+    AsyncHTTPTransport,
+    BaseTransport,
+    HTTPTransport,
+    Request,
+    Response,
+    SyncByteStream,
+    TransportError,
+)
+
+# Response headers never recorded: credentials, and framing that no longer applies to the decoded body.
+SCRUBBED_HEADERS = frozenset(
+    {
+        "authorization",
+        "proxy-authorization",
+        "cookie",
+        "set-cookie",
+        "content-encoding",
+        "content-length",
+        "transfer-encoding",
+    },
+)
+
+# Replayed bodies are streamed in chunks of this size, like a body arriving over the network.
+_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class Interaction:
+    """A recorded request and the response it got."""
+
+    method: str
+    url: str
+    status_code: int
+    headers: tuple[tuple[str, str], ...]
+    content: bytes
+
+    @classmethod
+    def from_response(cls, request: Request, response: Response) -> Self:
+        """Record a request and its fully read response."""
+        return cls(
+            request.method,
+            request.url.raw_path.decode("ascii"),
+            response.status_code,
+            tuple((name, value) for name, value in response.headers.items() if name not in SCRUBBED_HEADERS),
+            response.content,
+        )
+
+    @classmethod
+    def from_json(cls, line: str | bytes) -> Self:
+        """Load an interaction from a line of a recording."""
+        data = json.loads(line)
+        content = data["text"].encode() if "text" in data else base64.b64decode(data["base64"])
+        return cls(
+            data["method"],
+            data["url"],
+            data["status_code"],
+            tuple((name, value) for name, value in data["headers"]),
+            content,
+        )
+
+    def to_json(self) -> str:
+        """Dump the interaction as a line of a recording."""
+        data: dict[str, Any] = {
+            "method": self.method,
+            "url": self.url,
+            "status_code": self.status_code,
+            "headers": self.headers,
+        }
+        try:
+            data["text"] = self.content.decode()
+        except UnicodeDecodeError:
+            data["base64"] = base64.b64encode(self.content).decode("ascii")
+        return json.dumps(data, separators=(",", ":"))
+
+
+def load_interactions(path: str | PathLike[str]) -> list[Interaction]:
+    """Load the interactions of a recording."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [Interaction.from_json(line) for line in file]
+
+
+class _Recorder:
+    """Writes interactions to a recording as they happen, from any thread."""
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        self._file = gzip.open(path, "wt", encoding="utf-8")  # noqa: SIM115 - Closed with the transport
+        self._lock = threading.Lock()
+
+    def record(self, request: Request, response: Response) -> None:
+        line = Interaction.from_response(request, response).to_json()
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class RecordingTransport(BaseTransport):
+    """Sends requests through ``transport`` and records every response to the file at ``path``.
+
+    Pass it as a client's ``transport``; the recording is complete once the client is closed. Responses are read
+    in full before being returned, so they are no longer streamed.
+    """
+
+    def __init__(self, path: str | PathLike[str], transport: BaseTransport | None = None) -> None:
+        self._transport = transport or HTTPTransport()
+        self._recorder = _Recorder(path)
+
+    def handle_request(self, request: Request) -> Response:
+        """Send a request and record its response."""
+        response = self._transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        self._recorder.record(request, response)
+        return response
+
+    def close(self) -> None:
+        """Close the wrapped transport and finish the recording."""
+        self._transport.close()
+        self._recorder.close()
+
+
+class AsyncRecordingTransport(AsyncBaseTransport):
+    """Sends requests through ``transport`` and records every response, like :class:`RecordingTransport`."""
+
+    def __init__(self, path: str | PathLike[str], transport: AsyncBaseTransport | None = None) -> None:
+        self._transport = transport or AsyncHTTPTransport()
+        self._recorder = _Recorder(path)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        """Send a request and record its response."""
+        response = await self._transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        self._recorder.record(request, response)
+        return response
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport and finish the recording."""
+        await self._transport.aclose()
+        self._recorder.close()
+
+
+class ReplayTransport(BaseTransport, AsyncBaseTransport):
+    """Answers requests with recorded responses, for either client, without any network access.
+
+    Requests are matched on their method, path and query. Requests recorded several times get their responses
+    in the order they were recorded, starting over once all were replayed, so a short recording can be replayed
+    at any request rate.
+
+    Each response is delayed by ``latency`` seconds, plus up to ``jitter`` seconds at random. A random
+    ``error_rate`` share of requests fail instead, with one of ``errors``: either a status code answered with an
+    empty body, or a transport error raised. Pass a ``seed`` to make jitter and failures reproducible.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        interactions: str | PathLike[str] | Iterable[Interaction],
+        *,
+        latency: float = 0,
+        jitter: float = 0,
+        error_rate: float = 0,
+        errors: Sequence[int | type[TransportError]] = (HTTPStatus.SERVICE_UNAVAILABLE,),
+        seed: int | None = None,
+    ) -> None:
+        if not 0 <= error_rate <= 1:
+            msg = "error_rate must be between 0 and 1"
+            raise ValueError(msg)
+        if error_rate and not errors:
+            msg = "errors cannot be empty when error_rate is set"
+            raise ValueError(msg)
+
+        if isinstance(interactions, (str, PathLike)):
+            interactions = load_interactions(interactions)
+        self._responses: dict[tuple[str, str], list[Interaction]] = {}
+        for interaction in interactions:
+            self._responses.setdefault((interaction.method, interaction.url), []).append(interaction)
+        self._replayed: dict[tuple[str, str], int] = {}
+
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.errors = errors
+        self._random = random.Random(seed)  # noqa: S311 - Not cryptographic
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: Request) -> Response:
+        """Answer a request with its recorded response, after the configured latency."""
+        delay, interaction, error = self._next(request)
+        time.sleep(delay)
+        return self._response(request, interaction, error)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        """Answer a request with its recorded response, after the configured latency."""
+        delay, interaction, error = self._next(request)
+        await asyncio.sleep(delay)
+        return self._response(request, interaction, error)
+
+    def _next(self, request: Request) -> tuple[float, Interaction, int | type[TransportError] | None]:
+        """Pick the response to a request, its delay, and whether it fails instead."""
+        key = (request.method, request.url.raw_path.decode("ascii"))
+        try:
+            recorded = self._responses[key]
+        except KeyError:
+            msg = f"No response to {request.method} {key[1]} was recorded"
+            raise LookupError(msg) from None
+
+        with self._lock:
+            index = self._replayed.get(key, 0)
+            self._replayed[key] = index + 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            error = self._random.choice(self.errors) if self._random.random() < self.error_rate else None
+        return delay, recorded[index % len(recorded)], error
+
+    @staticmethod
+    def _response(
+        request: Request,
+        interaction: Interaction,
+        error: int | type[TransportError] | None,
+    ) -> Response:
+        if isinstance(error, int):
+            return Response(error, request=request)
+        if error is not None:
+            msg = "Injected failure"
+            raise error(msg, request=request)
+        return Response(
+            interaction.status_code,
+            headers=interaction.headers,
+            stream=_ChunkedStream(interaction.content),
+            request=request,
+        )
+
+
+class _ChunkedStream(SyncByteStream, AsyncByteStream):
+    """Streams a replayed body in chunks, synchronously or asynchronously."""
+
+    def __init__(self, content: bytes) -> None:
+        self._content = content
+
+    def __iter__(self) -> Iterator[bytes]:
+        for start in range(0, len(self._content), _CHUNK_SIZE):
+            yield self._content[start : start + _CHUNK_SIZE]
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
@@ -0,0 +1,150 @@
+"""Retrying failed requests and staying within S&S' rate limit."""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+from httpx import ConnectError, ConnectTimeout, PoolTimeout, Response, TransportError
+
+# Failures where the request is known not to have been processed, so even non-idempotent requests may be retried.
+_UNPROCESSED_STATUSES = frozenset({HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE})
+_UNPROCESSED_EXCEPTIONS = (ConnectError, ConnectTimeout, PoolTimeout)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RetryPolicy:
+    """How failed requests are retried.
+
+    Requests are retried on transport errors and on ``retry_statuses``, up to ``max_attempts`` attempts in total,
+    waiting an exponentially growing, jittered backoff between attempts. A ``Retry-After`` header on the
+    response takes precedence over the backoff; when it asks for longer than ``max_backoff``, the request is not
+    retried at all rather than retried early.
+
+    Idempotent requests (catalog reads) are retried on any of these failures. Order submissions are only retried
+    when the request cannot have been processed, i.e. the connection was never established or the API answered
+    429 or 503, so an order is never placed twice.
+    """
+
+    max_attempts: int = 4
+    backoff_factor: float = 0.5
+    max_backoff: float = 60.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset(
+        {
+            HTTPStatus.TOO_MANY_REQUESTS,
+            HTTPStatus.INTERNAL_SERVER_ERROR,
+            HTTPStatus.BAD_GATEWAY,
+            HTTPStatus.SERVICE_UNAVAILABLE,
+            HTTPStatus.GATEWAY_TIMEOUT,
+        },
+    )
+
+    def backoff(self, attempt: int) -> float:
+        """Get the delay before retrying after the given (1-based) attempt failed."""
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay  # noqa: S311 - Not cryptographic
+
+    def retry_delay(
+        self,
+        attempt: int,
+        *,
+        idempotent: bool,
+        response: Response | None = None,
+        exception: TransportError | None = None,
+    ) -> float | None:
+        """Get the delay before retrying a failed attempt, or ``None`` if it should not be retried."""
+        retryable = self._is_retryable(idempotent=idempotent, response=response, exception=exception)
+        if attempt >= self.max_attempts or not retryable:
+            return None
+
+        retry_after = None if response is None else parse_retry_after(response)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_backoff else None
+        return self.backoff(attempt)
+
+    def _is_retryable(
+        self,
+        *,
+        idempotent: bool,
+        response: Response | None,
+        exception: TransportError | None,
+    ) -> bool:
+        if exception is not None:
+            return idempotent or isinstance(exception, _UNPROCESSED_EXCEPTIONS)
+        if response is None or response.status_code not in self.retry_statuses:
+            return False
+        return idempotent or response.status_code in _UNPROCESSED_STATUSES
+
+
+def parse_retry_after(response: Response) -> float | None:
+    """Get the number of seconds a response's ``Retry-After`` header asks to wait, if it has one."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except ValueError:
+        return None
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+class TokenBucket:
+    """A thread-safe token bucket limiting the client's request rate.
+
+    Each request takes a token; tokens refill at ``rate`` per second up to ``capacity``, allowing short bursts.
+    Requests that find the bucket empty wait for their token rather than failing. When a response reports the
+    quota is exhausted, through S&S' ``X-Rate-Limit-Remaining``/``X-Rate-Limit-Reset`` headers, requests are
+    paused until it resets.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            msg = "rate must be positive"
+            raise ValueError(msg)
+
+        self.rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before it may be used."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(delay, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for the given number of seconds."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def observe(self, response: Response) -> None:
+        """Pause requests if the response reports the rate limit quota is exhausted."""
+        remaining = response.headers.get("X-Rate-Limit-Remaining")
+        reset = response.headers.get("X-Rate-Limit-Reset")
+        try:
+            if remaining is not None and reset is not None and float(remaining) <= 0:
+                self.pause(float(reset))
+        except ValueError:
+            return
@@ -0,0 +1,132 @@
+"""Splitting the product catalog into shards that can be downloaded concurrently."""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, replace
+from itertools import batched
+from typing import Self
+from urllib.parse import quote
+
+from .models import Product
+
+# Keeps the identifier list of a `GET /products/{identifiers}` URL well within the common 2,048 character limit,
+# leaving room for the base URL and query string.
+MAX_IDENTIFIERS_LENGTH = 1800
+
+
+@dataclass(frozen=True)
+class CatalogShard:
+    """A slice of the product catalog, fetched by a single request.
+
+    Shards are hashable, so the shards already downloaded can be kept in a set to resume an interrupted sync;
+    see :meth:`SSActivewear.iter_products_sharded`.
+    """
+
+    path: str
+    params: tuple[tuple[str, str], ...] = ()
+
+    @classmethod
+    def for_styles(cls, style_ids: Iterable[int]) -> Self:
+        """Get the shard holding every product of the given styles."""
+        return cls("/products/", (("styleid", ",".join(str(style_id) for style_id in style_ids)),))
+
+    @classmethod
+    def for_skus(cls, identifiers: Iterable[str]) -> Self:
+        """Get the shard holding the products with the given SKUs, master SKU IDs or GTINs."""
+        return cls(f"/products/{','.join(quote(identifier, safe='') for identifier in identifiers)}")
+
+    def with_params(self, **params: str) -> Self:
+        """Get a copy of the shard with extra query parameters, e.g. filters or a field projection."""
+        return replace(self, params=self.params + tuple(params.items()))
+
+
+def style_shards(style_ids: Iterable[int], per_shard: int = 25) -> Iterator[CatalogShard]:
+    """Split styles into shards of at most ``per_shard`` styles each."""
+    for chunk in batched(style_ids, per_shard, strict=False):
+        yield CatalogShard.for_styles(chunk)
+
+
+def sku_shards(
+    identifiers: Iterable[str],
+    per_shard: int = 100,
+    max_length: int = MAX_IDENTIFIERS_LENGTH,
+) -> Iterator[CatalogShard]:
+    """Split SKUs, master SKU IDs or GTINs into shards of at most ``per_shard`` products each.
+
+    Shards are also cut short once their URL-encoded identifier list would exceed ``max_length`` characters.
+    """
+    for chunk in identifier_chunks(identifiers, per_shard, max_length):
+        yield CatalogShard.for_skus(chunk)
+
+
+def identifier_chunks(
+    identifiers: Iterable[str],
+    per_chunk: int = 100,
+    max_length: int = MAX_IDENTIFIERS_LENGTH,
+) -> Iterator[list[str]]:
+    """Split identifiers into chunks of at most ``per_chunk``, each fitting in a URL path of ``max_length``."""
+    chunk: list[str] = []
+    length = -1
+    for identifier in identifiers:
+        encoded_length = len(quote(identifier, safe="")) + 1
+        if chunk and (len(chunk) == per_chunk or length + encoded_length > max_length):
+            yield chunk
+            chunk, length = [], -1
+        chunk.append(identifier)
+        length += encoded_length
+    if chunk:
+        yield chunk
+
+
+def brand_shards(products: Iterable[Product], per_shard: int = 25) -> Iterator[CatalogShard]:
+    """Split the styles of a previously downloaded catalog into shards, never mixing brands within a shard.
+
+    The products endpoint cannot be filtered by brand, so brands are sharded by their styles, as known from an
+    earlier sync (e.g. a :class:`~ssactivewear_sdk.cache.CatalogCache` or :class:`~ssactivewear_sdk.Catalog`).
+    Styles introduced since are only picked up by a full download.
+    """
+    styles_by_brand: dict[str, dict[int, None]] = {}
+    for product in products:
+        styles_by_brand.setdefault(product.brand_id, {})[product.style_id] = None
+    for style_ids in styles_by_brand.values():
+        yield from style_shards(style_ids, per_shard)
+
+
+def query_shards(
+    *,
+    style_ids: Iterable[int] | None = None,
+    skus: Iterable[str] | None = None,
+    warehouses: Iterable[str] | None = None,
+    fields: Iterable[str] | None = None,
+) -> list[CatalogShard]:
+    """Get the shards answering a filtered and projected product query.
+
+    Products are selected by ``style_ids`` or by ``skus`` (SKUs, master SKU IDs or GTINs), but not both, and
+    their warehouses narrowed to the ``warehouses`` abbreviations. ``fields`` names the :class:`Product` fields
+    to return. Long style and SKU lists are split over several shards to keep URLs short.
+    """
+    if style_ids is not None and skus is not None:
+        msg = "style_ids and skus cannot be combined"
+        raise ValueError(msg)
+
+    params: dict[str, str] = {}
+    if warehouses is not None:
+        params["warehouses"] = ",".join(warehouses)
+    if fields is not None:
+        params["fields"] = ",".join(_field_alias(name) for name in fields)
+
+    if style_ids is not None:
+        shards = list(style_shards(style_ids))
+    elif skus is not None:
+        shards = list(sku_shards(skus))
+    else:
+        shards = [CatalogShard("/products/")]
+    return [shard.with_params(**params) for shard in shards]
+
+
+def _field_alias(name: str) -> str:
+    try:
+        field = Product.model_fields[name]
+    except KeyError:
+        msg = f"Product has no field {name!r}"
+        raise ValueError(msg) from None
+    return field.alias or name
@@ -0,0 +1,135 @@
+"""Sharing one catalog between the threads, or the processes, of a service."""
+
+import os
+import threading
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+from pathlib import Path
+
+from ._concurrency import SingleFlight
+from .catalog import Catalog
+from .client import SSActivewear
+from .models import Product
+from .table import ProductTable
+
+
+class CatalogSnapshot:
+    """An immutable catalog shared by every thread of a process, reloaded through ``client`` once it is stale.
+
+    :meth:`get` returns the current :class:`Catalog`, loading it on first use and reloading it ``ttl`` after it
+    was loaded. Threads needing a load at the same time share a single download. With ``background_refresh``, a
+    stale catalog keeps being served while its replacement downloads in a background thread; otherwise callers
+    wait for the reload. Products are frozen models and a snapshot is never modified once loaded, so it is safe
+    to share without copying.
+
+    A failed background refresh leaves the previous catalog in place and keeps its error as :attr:`refresh_error`.
+    It is retried by the first :meth:`get` at least ``retry_interval`` after the failure, so that an unavailable
+    API is not asked for the catalog on every read.
+    """
+
+    def __init__(
+        self,
+        client: SSActivewear,
+        ttl: timedelta = timedelta(hours=1),
+        *,
+        background_refresh: bool = False,
+        retry_interval: timedelta = timedelta(minutes=1),
+    ) -> None:
+        self.client = client
+        self.ttl = ttl
+        self.background_refresh = background_refresh
+        self.retry_interval = retry_interval
+        self.refresh_error: BaseException | None = None
+        self._failed_at = -float("inf")
+
+        # The catalog and when it was loaded, swapped together so readers never see one without the other.
+        self._current: tuple[Catalog, float] | None = None
+        self._load = SingleFlight[None, Catalog]()
+
+    @property
+    def age(self) -> timedelta | None:
+        """Get how long ago the current catalog was loaded, or ``None`` if none is loaded yet."""
+        current = self._current
+        if current is None:
+            return None
+        return timedelta(seconds=time.monotonic() - current[1])
+
+    def get(self) -> Catalog:
+        """Get the current catalog, first loading it if there is none, or if it is stale without background refresh."""
+        current = self._current
+        if current is None:
+            return self.refresh()
+        catalog, loaded_at = current
+        now = time.monotonic()
+        if now - loaded_at >= self.ttl.total_seconds():
+            if not self.background_refresh:
+                return self.refresh()
+            if now - self._failed_at >= self.retry_interval.total_seconds():
+                self._load.submit(None, self._download)
+        return catalog
+
+    def refresh(self) -> Catalog:
+        """Load a new catalog, or wait for the load in flight, and return it."""
+        return self._load.do(None, self._download)
+
+    def _download(self) -> Catalog:
+        """Download the catalog and make it the current one."""
+        try:
+            catalog = Catalog(self.client.iter_products())
+        except BaseException as exception:
+            self.refresh_error = exception
+            self._failed_at = time.monotonic()
+            raise
+        self._current = (catalog, time.monotonic())
+        self.refresh_error = None
+        return catalog
+
+
+class SharedProductTable:
+    """A :class:`ProductTable` file shared by several processes, e.g. the workers of a web server.
+
+    One process publishes each new catalog with :meth:`publish`, writing it to ``path`` and atomically replacing
+    the previous file. Every process reads the latest catalog with :meth:`get`, which memory-maps the file, so all
+    of them share a single copy of the catalog in the page cache. :meth:`get` checks whether the file was replaced
+    at most once every ``check_interval``, and swaps to the new file when it was; tables already handed out keep
+    reading the file they were opened from.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], check_interval: timedelta = timedelta(seconds=5)) -> None:
+        self.path = Path(path)
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._checked_at = -float("inf")
+        # The table and the identity of the file it was opened from, swapped together.
+        self._current: tuple[ProductTable, tuple[int, int, int]] | None = None
+
+    def publish(self, products: Iterable[Product]) -> ProductTable:
+        """Replace the shared catalog with ``products``, such as :meth:`SSActivewear.iter_products`, and open it."""
+        ProductTable.from_products(products).write(self.path)
+        with self._lock:
+            return self._open()
+
+    def get(self) -> ProductTable:
+        """Get the latest published catalog, raising :class:`FileNotFoundError` if none was published yet."""
+        with self._lock:
+            current = self._current
+            if current is not None and time.monotonic() - self._checked_at < self.check_interval.total_seconds():
+                return current[0]
+            self._checked_at = time.monotonic()
+            if current is not None and current[1] == self._identity():
+                return current[0]
+            return self._open()
+
+    def _identity(self) -> tuple[int, int, int]:
+        """Get what tells the file at ``path`` apart from the files it replaced or will be replaced by."""
+        stat = self.path.stat()
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _open(self) -> ProductTable:
+        # The file is identified before being opened, so a file replaced in between is only opened again.
+        identity = self._identity()
+        table = ProductTable.open(self.path)
+        self._current = (table, identity)
+        return table
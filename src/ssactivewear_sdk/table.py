@@ -0,0 +1,404 @@
+"""Compact, columnar product catalog."""
+
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Buffer, Callable, Iterable, Iterator, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal, Self, overload
+
+from pydantic import BaseModel
+
+from ._files import replacing
+from .models import Product, Warehouse
+
+# Table files start with this magic number and the length of their JSON header.
+_MAGIC = b"SSATABLE"
+_PREAMBLE = struct.Struct(f"<{len(_MAGIC)}sQ")
+_FORMAT_VERSION = 1
+# Sections are aligned for their widest items.
+_ALIGNMENT = 8
+
+# A section of a table file, by its offset from the start of the data and its size in bytes.
+_Section = tuple[int, int]
+
+
+class DictionaryColumn:
+    """A dictionary-encoded string column.
+
+    Each distinct value is stored once in :attr:`categories`; rows hold a 32-bit index into it in :attr:`codes`.
+    ``None`` is stored as its own category, for optional fields. Columns of a table opened with
+    :meth:`ProductTable.open` read both from the mapped file, and cannot be appended to.
+    """
+
+    def __init__(self) -> None:
+        self._codes = array("I")
+        self._categories: list[str | None] = []
+        self.codes: array[int] | memoryview = self._codes
+        self.categories: Sequence[str | None] = self._categories
+        self._lookup: dict[str | None, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str | None:
+        """Decode the value of a row."""
+        return self.categories[self.codes[index]]
+
+    def __iter__(self) -> Iterator[str | None]:
+        """Decode every row."""
+        categories = self.categories
+        return (categories[code] for code in self.codes)
+
+    def append(self, value: str | None) -> None:
+        """Append a row."""
+        if self.codes is not self._codes:
+            msg = "Mapped columns are read-only"
+            raise TypeError(msg)
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self._categories)
+            self._categories.append(value)
+        self._codes.append(code)
+
+    def code_of(self, value: str | None) -> int | None:
+        """Get the code a value is stored as, or ``None`` if no row holds it; handy for scanning :attr:`codes`."""
+        if not self._lookup and self.categories:
+            # Mapped columns only index their categories once looked up.
+            self._lookup = {category: code for code, category in enumerate(self.categories)}
+        return self._lookup.get(value)
+
+
+class _StringTable(Sequence[str | None]):
+    """Strings stored back to back as UTF-8, string ``i`` spanning ``data[offsets[i]:offsets[i + 1]]``.
+
+    Strings are decoded on access, straight from the (mapped) buffer; the string at index ``none`` stands for
+    ``None``.
+    """
+
+    def __init__(self, offsets: memoryview, data: memoryview, none: int | None) -> None:
+        self._offsets = offsets
+        self._data = data
+        self._none = none
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str | None: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str | None]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str | None] | None:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "String table index out of range"
+            raise IndexError(msg)
+        if index == self._none:
+            return None
+        return str(self._data[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+
+
+class _NumericColumn:
+    """A column of machine-typed numbers, whose decoded values are converted with ``convert``."""
+
+    def __init__(self, typecode: Literal["b", "q", "d"], convert: type[int | float | bool]) -> None:
+        self.typecode = typecode
+        self._array: array[Any] = array(typecode)
+        self.values: array[Any] | memoryview[Any] = self._array
+        self._convert = convert
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> int | float | bool:
+        return self._convert(self.values[index])
+
+    def append(self, value: float) -> None:
+        self._array.append(value)
+
+
+class _DatetimeColumn:
+    """A column of optional datetimes, stored as POSIX timestamps with NaN for ``None``.
+
+    Naive datetimes are treated as UTC for storage and decoded back to naive values; aware ones decode in UTC.
+    """
+
+    def __init__(self) -> None:
+        self._array = array("d")
+        self._aware_array = array("b")
+        self.values: array[float] | memoryview[float] = self._array
+        self.aware: array[int] | memoryview = self._aware_array
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> datetime | None:
+        timestamp = self.values[index]
+        if math.isnan(timestamp):
+            return None
+        value = datetime.fromtimestamp(timestamp, UTC)
+        return value if self.aware[index] else value.replace(tzinfo=None)
+
+    def append(self, value: datetime | None) -> None:
+        if value is None:
+            self._array.append(math.nan)
+            self._aware_array.append(False)
+            return
+        aware = value.tzinfo is not None
+        self._array.append((value if aware else value.replace(tzinfo=UTC)).timestamp())
+        self._aware_array.append(aware)
+
+
+_Column = DictionaryColumn | _NumericColumn | _DatetimeColumn
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _column_for(annotation: Any) -> _Column:  # noqa: ANN401
+    if annotation is bool:
+        return _NumericColumn("b", bool)
+    if annotation is int:
+        return _NumericColumn("q", int)
+    if annotation is float:
+        return _NumericColumn("d", float)
+    if annotation in {str, str | None}:
+        return DictionaryColumn()
+    if annotation == datetime | None:
+        return _DatetimeColumn()
+    msg = f"Unsupported column type {annotation!r}"
+    raise TypeError(msg)
+
+
+class _ColumnSet:
+    """The columns of a flat model, with helpers to append and materialize rows."""
+
+    def __init__(self, model: type[BaseModel], exclude: frozenset[str] = frozenset()) -> None:
+        self.model = model
+        self.columns: dict[str, _Column] = {
+            name: _column_for(field.annotation) for name, field in model.model_fields.items() if name not in exclude
+        }
+        self.aliases = {name: model.model_fields[name].alias or name for name in self.columns}
+
+    def append(self, instance: BaseModel) -> None:
+        for name, column in self.columns.items():
+            column.append(getattr(instance, name))
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Decode a row into a dict keyed by alias, ready for validation."""
+        return {self.aliases[name]: column[index] for name, column in self.columns.items()}
+
+    def dump(self, add: Callable[[Buffer], _Section]) -> dict[str, dict[str, Any]]:
+        """Add every column's buffers as sections of a table file, getting the layout of the columns."""
+        layout: dict[str, dict[str, Any]] = {}
+        for name, column in self.columns.items():
+            if isinstance(column, DictionaryColumn):
+                encoded = [b"" if category is None else category.encode() for category in column.categories]
+                offsets = array("Q", [0])
+                for value in encoded:
+                    offsets.append(offsets[-1] + len(value))
+                layout[name] = {
+                    "codes": add(column.codes),
+                    "offsets": add(offsets),
+                    "data": add(b"".join(encoded)),
+                    "none": next((code for code, value in enumerate(column.categories) if value is None), None),
+                }
+            elif isinstance(column, _DatetimeColumn):
+                layout[name] = {"values": add(column.values), "aware": add(column.aware)}
+            else:
+                layout[name] = {"values": add(column.values)}
+        return layout
+
+    def load(self, layout: dict[str, dict[str, Any]], view: Callable[[_Section], memoryview]) -> None:
+        """Point every column at its sections of a mapped table file."""
+        if layout.keys() != self.columns.keys():
+            msg = f"The table file's {self.model.__name__} columns do not match this version of the SDK"
+            raise ValueError(msg)
+        for name, column in self.columns.items():
+            sections = layout[name]
+            if isinstance(column, DictionaryColumn):
+                mapped = self.columns[name] = DictionaryColumn()
+                mapped.codes = view(sections["codes"]).cast("I")
+                mapped.categories = _StringTable(
+                    view(sections["offsets"]).cast("Q"),
+                    view(sections["data"]),
+                    sections["none"],
+                )
+            elif isinstance(column, _DatetimeColumn):
+                column.values, column.aware = view(sections["values"]).cast("d"), view(sections["aware"]).cast("b")
+            else:
+                column.values = view(sections["values"]).cast(column.typecode)
+
+
+class ProductTable:
+    """A columnar, memory-compact representation of the product catalog.
+
+    Numeric and boolean fields are held in typed :class:`array.array` columns and string fields are
+    dictionary-encoded, so repeated values such as ``brand_name`` or ``country_of_origin`` are stored once.
+    Each product's warehouses are flattened into a child table: product ``i`` owns the warehouse rows from
+    ``warehouse_offsets[i]`` up to ``warehouse_offsets[i + 1]``. :class:`Product` rows are only materialized
+    on access.
+
+    Numeric columns expose the buffer protocol, so they can be scanned in bulk without boxing each value, or
+    wrapped zero-copy with ``numpy.frombuffer`` when NumPy is available.
+
+    :meth:`write` saves a table to a single file of fixed-width column buffers and UTF-8 string tables, which any
+    number of processes can :meth:`open` as memory-mapped, read-only tables sharing the same pages.
+    """
+
+    def __init__(self) -> None:
+        self._products = _ColumnSet(Product, exclude=frozenset({"warehouses"}))
+        self._warehouses = _ColumnSet(Warehouse)
+        self._offsets = array("Q", [0])
+        self.warehouse_offsets: array[int] | memoryview = self._offsets
+
+    @classmethod
+    def from_products(cls, products: Iterable[Product]) -> Self:
+        """Build a table from any product iterable, such as :meth:`SSActivewear.iter_products`.
+
+        Products are encoded one at a time, so a streamed catalog is never fully materialized.
+        """
+        table = cls()
+        for product in products:
+            table.append(product)
+        return table
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str]) -> Self:
+        """Open a table file written by :meth:`write`, memory-mapped and read-only.
+
+        Columns are read straight from the mapped file, which the operating system shares between every process
+        opening it; only the rows accessed are decoded. The file is unmapped once the table and its columns are
+        garbage collected, and may be replaced by a new one in the meantime.
+        """
+        with Path(path).open("rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        buffer = memoryview(mapped)
+        if len(buffer) < _PREAMBLE.size or _PREAMBLE.unpack_from(buffer)[0] != _MAGIC:
+            msg = f"{path} is not a product table file"
+            raise ValueError(msg)
+        header_size = _PREAMBLE.unpack_from(buffer)[1]
+        header = json.loads(bytes(buffer[_PREAMBLE.size : _PREAMBLE.size + header_size]))
+        if header["version"] != _FORMAT_VERSION or header["byteorder"] != sys.byteorder:
+            msg = f"{path} was written in an unsupported format or byte order"
+            raise ValueError(msg)
+        start = _align(_PREAMBLE.size + header_size)
+
+        def view(section: _Section) -> memoryview:
+            offset, size = section
+            return buffer[start + offset : start + offset + size]
+
+        table = cls()
+        table._products.load(header["products"], view)
+        table._warehouses.load(header["warehouses"], view)
+        table.warehouse_offsets = view(header["warehouse_offsets"]).cast("Q")
+        return table
+
+    def write(self, path: str | os.PathLike[str]) -> None:
+        """Save the table to a file for :meth:`open`.
+
+        The file is written under a temporary name and then renamed over ``path``, so processes opening ``path``
+        get either the previous table or the new one in full. Tables opened from the previous file keep reading it.
+        """
+        sections: list[Buffer] = []
+        size = 0
+
+        def add(buffer: Buffer) -> _Section:
+            nonlocal size
+            offset = size
+            sections.append(buffer)
+            size = _align(size + memoryview(buffer).nbytes)
+            return offset, memoryview(buffer).nbytes
+
+        header = json.dumps(
+            {
+                "version": _FORMAT_VERSION,
+                "byteorder": sys.byteorder,
+                "products": self._products.dump(add),
+                "warehouses": self._warehouses.dump(add),
+                "warehouse_offsets": add(self.warehouse_offsets),
+            },
+        ).encode()
+
+        with replacing(Path(path)) as temporary, temporary.open("wb") as file:
+            file.write(_PREAMBLE.pack(_MAGIC, len(header)) + header)
+            file.write(bytes(_align(file.tell()) - file.tell()))
+            for buffer in sections:
+                file.write(buffer)
+                file.write(bytes(_align(file.tell()) - file.tell()))
+
+    def append(self, product: Product) -> None:
+        """Append a product to the table; tables opened from a file are read-only."""
+        if self.warehouse_offsets is not self._offsets:
+            msg = "Tables opened from a file are read-only"
+            raise TypeError(msg)
+        self._products.append(product)
+        for warehouse in product.warehouses:
+            self._warehouses.append(warehouse)
+        self._offsets.append(self._offsets[-1] + len(product.warehouses))
+
+    def __len__(self) -> int:
+        """Return the number of products."""
+        return len(self.warehouse_offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> Product: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Product]: ...
+
+    def __getitem__(self, index: int | slice) -> Product | list[Product]:
+        """Materialize the product(s) at an index or slice."""
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = "ProductTable index out of range"
+            raise IndexError(msg)
+
+        data = self._products.row(index)
+        data["warehouses"] = [
+            self._warehouses.row(position)
+            for position in range(self.warehouse_offsets[index], self.warehouse_offsets[index + 1])
+        ]
+        return Product.model_validate(data)
+
+    def __iter__(self) -> Iterator[Product]:
+        """Materialize every product, in catalog order."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def column(self, name: str) -> Sequence[Any] | DictionaryColumn:
+        """Get a product column by field name.
+
+        Numeric, boolean and datetime fields are returned as :class:`array.array` columns, or :class:`memoryview`
+        columns for tables opened from a file (datetimes as POSIX timestamps with NaN for ``None``); string fields
+        as a :class:`DictionaryColumn`.
+        """
+        return self._column(self._products, name)
+
+    def warehouse_column(self, name: str) -> Sequence[Any] | DictionaryColumn:
+        """Get a column of the flattened warehouse child table by field name; see :attr:`warehouse_offsets`."""
+        return self._column(self._warehouses, name)
+
+    @staticmethod
+    def _column(columns: _ColumnSet, name: str) -> Sequence[Any] | DictionaryColumn:
+        try:
+            column = columns.columns[name]
+        except KeyError:
+            msg = f"{columns.model.__name__} has no column {name!r}"
+            raise KeyError(msg) from None
+        return column if isinstance(column, DictionaryColumn) else column.values
@@ -0,0 +1,199 @@
+"""Shared test fixtures."""
+
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from ssactivewear_sdk import AsyncSSActivewear, OrderRequest, SSActivewear
+
+ACCOUNT_NUMBER = "12345"
+TOKEN = "8b0b7c2e-3f6a-4c1d-9a0e-2d5f4b6c7e8f"  # noqa: S105 - Not a real token
+
+
+def _warehouse(sku_id: int, warehouse_abbr: str, qty: int) -> dict[str, Any]:
+    return {
+        "warehouseAbbr": warehouse_abbr,
+        "skuID": sku_id,
+        "qty": qty,
+        "closeout": False,
+        "dropship": False,
+        "excludeFreeFreight": False,
+        "fullCaseOnly": False,
+        "returnable": True,
+    }
+
+
+@pytest.fixture
+def make_client() -> Callable[..., SSActivewear]:
+    """Return a factory building a client whose requests are answered by the given handler."""
+
+    def factory(handler: Callable[[httpx.Request], httpx.Response], **kwargs: Any) -> SSActivewear:  # noqa: ANN401
+        return SSActivewear(
+            account_number=ACCOUNT_NUMBER,
+            token=TOKEN,
+            base_url="https://api.test/v2",
+            transport=httpx.MockTransport(handler),
+            **kwargs,
+        )
+
+    return factory
+
+
+@pytest.fixture
+def make_async_client() -> Callable[..., AsyncSSActivewear]:
+    """Return a factory building an asynchronous client whose requests are answered by the given handler."""
+
+    def factory(handler: Callable[[httpx.Request], httpx.Response], **kwargs: Any) -> AsyncSSActivewear:  # noqa: ANN401
+        return AsyncSSActivewear(
+            account_number=ACCOUNT_NUMBER,
+            token=TOKEN,
+            base_url="https://api.test/v2",
+            transport=httpx.MockTransport(handler),
+            **kwargs,
+        )
+
+    return factory
+
+
+@pytest.fixture
+def make_product() -> Callable[..., dict[str, Any]]:
+    """Return a factory building raw `/products` entries, as returned by the API."""
+
+    def factory(sku_id: int = 1, **overrides: Any) -> dict[str, Any]:  # noqa: ANN401
+        product: dict[str, Any] = {
+            "skuID_Master": sku_id,
+            "sku": f"B{sku_id:08d}",
+            "gtin": f"{sku_id:014d}",
+            "yourSku": "",
+            "baseCategoryID": "1",
+            "brandID": "5",
+            "brandName": "Gildan",
+            "styleID": 39,
+            "styleName": "5000",
+            "colorName": "Black",
+            "colorCode": "02",
+            "colorPriceCodeName": "Colors",
+            "colorGroup": "1",
+            "colorGroupName": "Black",
+            "colorFamilyID": "1",
+            "colorFamily": "Black",
+            "colorSwatchImage": "Images/ColorSwatch/1_fm.jpg",
+            "colorSwatchTextColor": "#FFFFFF",
+            "colorFrontImage": "Images/Color/1_f_fm.jpg",
+            "colorSideImage": "Images/Color/1_s_fm.jpg",
+            "colorBackImage": "Images/Color/1_b_fm.jpg",
+            "colorDirectSideImage": "Images/Color/1_d_fm.jpg",
+            "colorOnModelFrontImage": "Images/Model/1_f_fm.jpg",
+            "colorOnModelSideImage": "Images/Model/1_s_fm.jpg",
+            "colorOnModelBackImage": "Images/Model/1_b_fm.jpg",
+            "color1": "#000000",
+            "color2": "",
+            "sizeName": "L",
+            "sizeCode": "5",
+            "sizeOrder": "B4",
+            "sizePriceCodeName": "S-XL",
+            "caseQty": 72,
+            "unitWeight": 0.44,
+            "mapPrice": 0.0,
+            "piecePrice": 3.5,
+            "dozenPrice": 3.0,
+            "casePrice": 2.5,
+            "salePrice": 0.0,
+            "customerPrice": 3.5,
+            "noeRetailing": False,
+            "caseWeight": 32.0,
+            "caseWidth": 12.0,
+            "caseLength": 24.0,
+            "caseHeight": 12.0,
+            "polyPackQty": 12,
+            "qty": 150,
+            "countryOfOrigin": "HN",
+            "warehouses": [_warehouse(sku_id, "IL", 100), _warehouse(sku_id, "KS", 50)],
+        }
+        product.update(overrides)
+        return product
+
+    return factory
+
+
+@pytest.fixture
+def make_order_request() -> Callable[..., OrderRequest]:
+    """Return a factory building order requests."""
+
+    def factory(po_number: str = "PO-1", lines: list[dict[str, Any]] | None = None, **fields: Any) -> OrderRequest:  # noqa: ANN401
+        return OrderRequest.model_validate(
+            {
+                "shippingAddress": {
+                    "customer": "Impress Designs",
+                    "attn": "Receiving",
+                    "address": "1 Main St",
+                    "city": "Chicago",
+                    "state": "IL",
+                    "zip": "60601",
+                },
+                "lines": lines if lines is not None else [{"identifier": "B00000001", "qty": 12}],
+                "poNumber": po_number,
+                **fields,
+            },
+        )
+
+    return factory
+
+
+@pytest.fixture
+def make_order_response() -> Callable[..., dict[str, Any]]:
+    """Return a factory building raw `/orders` entries, as returned by the API."""
+
+    def factory(po_number: str = "PO-1", **overrides: Any) -> dict[str, Any]:  # noqa: ANN401
+        order: dict[str, Any] = {
+            "guid": "a4f0e1c2-9b8d-4e7f-a6b5-c4d3e2f1a0b9",
+            "companyName": "Impress Designs",
+            "warehouseAbbr": "IL",
+            "orderNumber": "1234567",
+            "invoiceNumber": "",
+            "poNumber": po_number,
+            "customerNumber": "12345",
+            "orderDate": "2026-10-01T09:30:00",
+            "expectedDeliveryDate": "2026-10-03",
+            "orderType": "API",
+            "terms": "Net 30",
+            "orderStatus": "In Progress",
+            "dropship": False,
+            "shippingCarrier": "UPS",
+            "shippingMethod": "UPS Ground",
+            "shipBlind": False,
+            "shippingCollectNumber": "",
+            "shippingAddress": {
+                "customer": "Impress Designs",
+                "attn": "Receiving",
+                "address": "1 Main St",
+                "city": "Chicago",
+                "state": "IL",
+                "zip": "60601",
+            },
+            "subtotal": 42.0,
+            "shipping": 0.0,
+            "cod": 0.0,
+            "tax": 0.0,
+            "smallOrderFee": 0.0,
+            "cuponDiscount": 0.0,
+            "sampleDiscount": 0.0,
+            "setUpFee": 0.0,
+            "restockFee": 0.0,
+            "debitCredit": 0.0,
+            "total": 42.0,
+            "totalPieces": 12,
+            "totalLines": 1,
+            "totalWeight": 5.28,
+            "totalBoxes": 1,
+            "deliveryStatus": "",
+            "conveyorLane": "",
+            "lines": [],
+            "shippingSaved": 0.0,
+        }
+        order.update(overrides)
+        return order
+
+    return factory
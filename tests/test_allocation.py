@@ -0,0 +1,75 @@
+"""Testing warehouse allocation."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from ssactivewear_sdk import AllocationPlan, Catalog, OrderRequest, Product, WarehouseAllocator
+
+TRANSIT_DAYS = {"IL": 1, "KS": 3}
+
+
+@pytest.fixture
+def allocator(make_product: Callable[..., dict[str, Any]]) -> WarehouseAllocator:
+    """Return an allocator whose second product is mostly stocked in KS, and third only sold by the case."""
+    mostly_ks = make_product(2)
+    mostly_ks["warehouses"][0]["qty"] = 10
+    mostly_ks["warehouses"][1]["qty"] = 100
+    case_only = make_product(3)
+    case_only["warehouses"] = [case_only["warehouses"][1] | {"qty": 200, "fullCaseOnly": True}]
+    catalog = Catalog(Product.model_validate(product) for product in (make_product(1), mostly_ks, case_only))
+    return WarehouseAllocator(catalog, TRANSIT_DAYS)
+
+
+def _split(plan: AllocationPlan) -> list[tuple[int, str, int]]:
+    return [(allocation.line, allocation.warehouse_abbr, allocation.quantity) for allocation in plan.allocations]
+
+
+def test_allocates_orders(allocator: WarehouseAllocator, make_order_request: Callable[..., OrderRequest]) -> None:
+    """Test that orders are split for the fewest shipments or the fastest delivery, as they ask."""
+    lines = [{"identifier": "B00000001", "qty": 40}, {"identifier": "B00000002", "qty": 40}]
+
+    def order(**fields: Any) -> OrderRequest:  # noqa: ANN401
+        return make_order_request(lines=lines, autoselectWarehouse=True, **fields)
+
+    fewest = allocator.allocate(order())
+    assert fewest.preference == "fewest"
+    assert _split(fewest) == [(0, "KS", 40), (1, "KS", 40)]
+    assert (fewest.shipments, fewest.max_transit_days, fewest.complete) == (1, 3, True)
+    assert [line.warehouse_abbreviation for line in fewest.order_lines()] == ["KS", "KS"]
+
+    fastest = allocator.allocate(order(AutoSelectWarehouse_Preference="fastest"))
+    assert _split(fastest) == [(0, "IL", 40), (1, "IL", 10), (1, "KS", 30)]
+    assert fastest.warehouses == ("IL", "KS")
+
+    too_slow = allocator.allocate(order(AutoSelectWarehouse_Fewest_MaxDIT=2))
+    assert too_slow.preference == "fastest"
+    assert _split(too_slow) == _split(fastest)
+
+    restricted = allocator.allocate(order(autoselectWarehouse_Warehouses="IL"))
+    assert _split(restricted) == [(0, "IL", 40), (1, "IL", 10)]
+    assert restricted.unfilled == {1: 30}
+
+    with pytest.raises(ValueError, match="autoselect_warehouse"):
+        allocator.allocate(make_order_request(lines=lines))
+
+
+def test_respects_cases_and_pins(
+    allocator: WarehouseAllocator,
+    make_order_request: Callable[..., OrderRequest],
+) -> None:
+    """Test that full-case warehouses only ship whole cases, pinned lines stay put, and unknown SKUs are unfilled."""
+    plan = allocator.allocate(
+        make_order_request(
+            lines=[
+                {"identifier": "B00000003", "qty": 100},
+                {"identifier": "B00000001", "qty": 20, "warehouseAbbr": "KS"},
+                {"identifier": "B00000009", "qty": 5},
+            ],
+            autoselectWarehouse=True,
+            AutoSelectWarehouse_Preference="fastest",
+        ),
+    )
+    assert _split(plan) == [(0, "KS", 72), (1, "KS", 20)]
+    assert plan.unfilled == {0: 28, 2: 5}
@@ -0,0 +1,153 @@
+"""Testing the asynchronous client."""
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator, Callable
+from typing import Any, cast
+
+import httpx
+import pytest
+
+from ssactivewear_sdk import AsyncSSActivewear, OrderRequest, Product, SSActivewearBadRequestError
+from ssactivewear_sdk.models import OrderResponseContainer
+
+AsyncClientFactory = Callable[..., AsyncSSActivewear]
+
+
+def test_rejects_invalid_auth() -> None:
+    """Test that the client will recognize invalid auth."""
+    with pytest.raises(TypeError) as excinfo:
+        AsyncSSActivewear(base_url="", account_number="", token="")
+    assert "Account number" in str(excinfo.value)
+    with pytest.raises(TypeError) as excinfo:
+        AsyncSSActivewear(base_url="", account_number="2", token="")
+    assert "Token" in str(excinfo.value)
+
+
+def test_products(make_async_client: AsyncClientFactory, make_product: Callable[..., dict[str, Any]]) -> None:
+    """Test that products are streamed and validated."""
+    body = json.dumps([make_product(sku_id) for sku_id in range(1, 4)]).encode()
+    client = make_async_client(lambda _: httpx.Response(200, content=body))
+
+    products = asyncio.run(client.products())
+
+    assert [product.sku_id_master for product in products] == [1, 2, 3]
+
+
+def test_products_coalesces_concurrent_calls(
+    make_async_client: AsyncClientFactory,
+    make_product: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that concurrent identical product queries share one download."""
+    requests = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        return httpx.Response(200, json=[make_product()])
+
+    client = make_async_client(handler)
+
+    async def load() -> list[list[Product]]:
+        return await asyncio.gather(*(client.products() for _ in range(3)))
+
+    results = asyncio.run(load())
+
+    assert requests == 1
+    assert results[0][0] is results[2][0]
+
+
+def test_submit_order(
+    make_async_client: AsyncClientFactory,
+    make_order_request: Callable[..., OrderRequest],
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that orders are submitted and the response wrapped."""
+    requests: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, json=[make_order_response()])
+
+    client = make_async_client(handler)
+    container = asyncio.run(client.submit_order(make_order_request()))
+
+    assert requests[0]["poNumber"] == "PO-1"
+    assert container.line_errors == []
+    assert container.orders[0].order_number == "1234567"
+
+
+def test_submit_order_raises_bad_request(
+    make_async_client: AsyncClientFactory,
+    make_order_request: Callable[..., OrderRequest],
+) -> None:
+    """Test that a 400 response is mapped to the SDK error."""
+    error = {"code": "400", "message": "Bad things", "errors": [{"field": "lines", "message": "Empty"}]}
+    client = make_async_client(lambda _: httpx.Response(400, json=error))
+
+    with pytest.raises(SSActivewearBadRequestError) as excinfo:
+        asyncio.run(client.submit_order(make_order_request()))
+    assert excinfo.value.response.errors[0].field == "lines"
+
+
+def test_submit_orders_as_completed(
+    make_async_client: AsyncClientFactory,
+    make_order_request: Callable[..., OrderRequest],
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that bulk submission yields every order when results are unordered."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[make_order_response(json.loads(request.content)["poNumber"])])
+
+    async def submit() -> list[str]:
+        client = make_async_client(handler)
+        order_requests = [make_order_request(f"PO-{index}") for index in range(20)]
+        return [
+            container.orders[0].po_number
+            async for order_request, container in client.submit_orders(order_requests, 4, ordered=False)
+            if isinstance(container, OrderResponseContainer) and order_request.po_number
+        ]
+
+    assert sorted(asyncio.run(submit())) == sorted(f"PO-{index}" for index in range(20))
+
+
+def test_submit_orders_completes_in_flight_orders(
+    make_async_client: AsyncClientFactory,
+    make_order_request: Callable[..., OrderRequest],
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that orders already submitted when the consumer stops early still complete, and no others start."""
+    started: list[str] = []
+    completed: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        po_number = json.loads(request.content)["poNumber"]
+        started.append(po_number)
+        await asyncio.sleep(0.01)
+        completed.append(po_number)
+        return httpx.Response(200, json=[make_order_response(po_number)])
+
+    async def submit() -> None:
+        client = make_async_client(handler)
+        order_requests = (make_order_request(f"PO-{index}") for index in range(10))
+        results = cast("AsyncGenerator[object]", client.submit_orders(order_requests, 3))
+        async for _ in results:
+            break
+        await results.aclose()
+
+    asyncio.run(submit())
+    assert sorted(completed) == sorted(started) == ["PO-0", "PO-1", "PO-2", "PO-3"]
+
+
+def test_iter_orders(
+    make_async_client: AsyncClientFactory,
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that open orders are streamed and validated."""
+    client = make_async_client(lambda _: httpx.Response(200, json=[make_order_response("PO-1")]))
+
+    async def collect() -> list[str]:
+        return [order.po_number async for order in client.iter_orders(open_only=True)]
+
+    assert asyncio.run(collect()) == ["PO-1"]
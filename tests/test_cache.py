@@ -0,0 +1,117 @@
+"""Testing the on-disk catalog cache."""
+
+import asyncio
+import sqlite3
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from ssactivewear_sdk import AsyncSSActivewear, Product, SSActivewear
+from ssactivewear_sdk.cache import CatalogCache
+
+
+def test_serves_and_revalidates_catalog(
+    tmp_path: Path,
+    make_client: Callable[..., SSActivewear],
+    make_product: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that a fresh cache skips the API and a stale one is revalidated with its ETag."""
+    requests: list[httpx.Request] = []
+    catalog = [make_product(1), make_product(2)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=catalog, headers={"ETag": '"v1"'})
+
+    def client(cache: CatalogCache) -> SSActivewear:
+        return make_client(handler, catalog_cache=cache)
+
+    path = tmp_path / "catalog.sqlite3"
+    downloaded = client(CatalogCache(path)).products()
+    cached = client(CatalogCache(path)).products()
+    assert len(requests) == 1
+    assert cached == downloaded
+
+    revalidated = client(CatalogCache(path, ttl=timedelta(0))).products()
+    assert len(requests) == 2  # noqa: PLR2004
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert revalidated == downloaded
+
+
+def test_refresh_replaces_catalog(tmp_path: Path, make_product: Callable[..., dict[str, Any]]) -> None:
+    """Test that a completed download replaces the catalog and an abandoned one does not."""
+    cache = CatalogCache(tmp_path / "catalog.sqlite3")
+    with cache.refresh({}) as writer:
+        writer.write(make_product(1))
+        writer.write(make_product(2))
+
+    try:
+        with cache.refresh({}) as writer:
+            writer.write(make_product(3))
+            raise KeyboardInterrupt  # noqa: TRY301
+    except KeyboardInterrupt:
+        pass
+    assert [product.sku_id_master for product in cache.iter_products()] == [1, 2]
+
+    with cache.refresh({}) as writer:
+        writer.write(make_product(2, qty=0))
+        writer.write(make_product(3))
+    products = list(cache.iter_products())
+    assert [product.sku_id_master for product in products] == [2, 3]
+    assert products[0].quantity == 0
+
+
+def test_refresh_does_not_lock_cache(
+    tmp_path: Path,
+    make_client: Callable[..., SSActivewear],
+    make_product: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that other writers are not locked out of the cache while a download is paused part way."""
+    path = tmp_path / "catalog.sqlite3"
+    catalog = [make_product(sku_id) for sku_id in range(1, 2502)]
+    client = make_client(lambda _: httpx.Response(200, json=catalog), catalog_cache=CatalogCache(path))
+
+    def assert_unlocked() -> None:
+        connection = sqlite3.connect(path, timeout=0)
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.rollback()
+        finally:
+            connection.close()
+
+    products = client.iter_products()
+    for _ in range(1500):
+        next(products)
+    assert_unlocked()
+
+    assert len(list(products)) == len(catalog) - 1500
+    assert [product.sku_id_master for product in CatalogCache(path).iter_products()] == list(range(1, 2502))
+
+
+def test_async_client_uses_cache(
+    tmp_path: Path,
+    make_async_client: Callable[..., AsyncSSActivewear],
+    make_product: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that the asynchronous client fills and then serves the cache, reading and writing it off the loop."""
+    requests: list[httpx.Request] = []
+    catalog = [make_product(sku_id) for sku_id in range(1, 2502)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=catalog)
+
+    async def read() -> list[Product]:
+        client = make_async_client(handler, catalog_cache=CatalogCache(tmp_path / "catalog.sqlite3"))
+        return [product async for product in client.iter_products()]
+
+    downloaded = asyncio.run(read())
+    cached = asyncio.run(read())
+    assert len(requests) == 1
+    assert cached == downloaded
+    assert [product.sku_id_master for product in cached] == list(range(1, 2502))
@@ -0,0 +1,35 @@
+"""Testing the indexed catalog."""
+
+from collections.abc import Callable
+from typing import Any
+
+from ssactivewear_sdk import Catalog, Product
+
+
+def test_indexes(make_product: Callable[..., dict[str, Any]]) -> None:
+    """Test unique and grouped lookups."""
+    catalog = Catalog(
+        Product.model_validate(make_product(sku_id, styleID=style_id, sizeCode=size_code, yourSku=your_sku))
+        for sku_id, style_id, size_code, your_sku in [(1, 10, "3", "MY-1"), (2, 10, "4", ""), (3, 20, "3", "")]
+    )
+
+    assert len(catalog) == 3  # noqa: PLR2004
+    assert catalog.by_sku("B00000002") is catalog.by_sku_id_master(2)
+    assert catalog.by_gtin("00000000000003") is catalog.by_sku_id_master(3)
+    assert catalog.by_your_sku("MY-1") is catalog.by_sku_id_master(1)
+    assert catalog.by_your_sku("") is None
+    assert [product.sku_id_master for product in catalog.by_style_id(10)] == [1, 2]
+    assert [product.sku_id_master for product in catalog.by_size_code("3")] == [1, 3]
+    assert len(catalog.by_brand_id("5")) == 3  # noqa: PLR2004
+    assert catalog.by_color_code("99") == ()
+
+
+def test_lookup_order_line_identifiers(make_product: Callable[..., dict[str, Any]]) -> None:
+    """Test that any identifier accepted on an order line resolves to its product."""
+    product = Product.model_validate(make_product(7))
+    catalog = Catalog([product])
+
+    assert catalog.lookup("7") is product
+    assert catalog.lookup("B00000007") is product
+    assert catalog.lookup("00000000000007") is product
+    assert catalog.lookup("8") is None
@@ -1,8 +1,21 @@
 """Testing the client."""
 
+import json
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
 import pytest
+from conftest import ACCOUNT_NUMBER, TOKEN
+
+from ssactivewear_sdk import OrderRequest, PartialProduct, Product, SSActivewear, SSActivewearBadRequestError
+from ssactivewear_sdk.models import OrderResponseContainer
 
-from ssactivewear_sdk import SSActivewear
+ClientFactory = Callable[..., SSActivewear]
+ProductFactory = Callable[..., dict[str, Any]]
 
 
 def test_rejects_invalid_auth() -> None:
@@ -13,3 +26,217 @@ def test_rejects_invalid_auth() -> None:
     with pytest.raises(TypeError) as excinfo:
         SSActivewear(base_url="", account_number="2", token="")
     assert "Token" in str(excinfo.value)
+
+
+def test_iter_products_streams_catalog(make_client: ClientFactory, make_product: ProductFactory) -> None:
+    """Test that products are parsed from a chunked body."""
+    body = json.dumps([make_product(sku_id) for sku_id in range(1, 4)]).encode()
+    chunks = [body[index : index + 7] for index in range(0, len(body), 7)]
+
+    client = make_client(lambda _: httpx.Response(200, stream=httpx.ByteStream(b"".join(chunks))))
+    products = list(client.iter_products())
+
+    assert [product.sku_id_master for product in products] == [1, 2, 3]
+    assert products[0].warehouses[0].warehouse_abbr == "IL"
+    assert client.products() == products
+
+
+def test_products_coalesces_concurrent_calls(make_client: ClientFactory, make_product: ProductFactory) -> None:
+    """Test that threads asking for the same products at once share one download, and later calls download again."""
+    requests = 0
+    barrier = threading.Barrier(4)
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        time.sleep(0.1)
+        return httpx.Response(200, json=[make_product(requests)])
+
+    client = make_client(handler)
+    results: list[list[Product]] = []
+
+    def load() -> None:
+        barrier.wait()
+        results.append(client.products())
+
+    threads = [threading.Thread(target=load) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert requests == 1
+    assert results[0] is not results[1]
+    assert results[0][0] is results[1][0]
+    assert client.products()[0].sku_id_master == 2  # noqa: PLR2004
+
+
+def test_iter_products_raises_bad_request(make_client: ClientFactory) -> None:
+    """Test that a streamed 400 response is mapped to the SDK error."""
+    error = {"code": "400", "message": "Bad things", "errors": []}
+    client = make_client(lambda _: httpx.Response(400, json=error))
+
+    with pytest.raises(SSActivewearBadRequestError) as excinfo:
+        list(client.iter_products())
+    assert excinfo.value.response.message == "Bad things"
+
+
+def test_submit_orders_bounds_concurrency(
+    make_client: ClientFactory,
+    make_order_request: Callable[..., OrderRequest],
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that bulk submission keeps input order, bounds concurrency and returns rejections."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        po_number = json.loads(request.content)["poNumber"]
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        if po_number == "PO-3":
+            return httpx.Response(400, json={"code": "400", "message": "Rejected", "errors": []})
+        return httpx.Response(200, json=[make_order_response(po_number)])
+
+    client = make_client(handler)
+    order_requests = (make_order_request(f"PO-{index}") for index in range(10))
+    results = list(client.submit_orders(order_requests, max_concurrency=3))
+
+    assert [order_request.po_number for order_request, _ in results] == [f"PO-{index}" for index in range(10)]
+    assert isinstance(results[3][1], SSActivewearBadRequestError)
+    assert isinstance(results[4][1], OrderResponseContainer)
+    assert results[4][1].orders[0].po_number == "PO-4"
+    assert peak <= 3  # noqa: PLR2004
+
+
+def test_shares_http_client(make_product: ProductFactory) -> None:
+    """Test that instances can share a pool while keeping their own credentials and base URL."""
+    seen: list[tuple[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((str(request.url), request.headers["Authorization"]))
+        return httpx.Response(200, json=[make_product()])
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler))
+    with (
+        SSActivewear("1", TOKEN, "https://api.test/v2", http_client=http_client) as first,
+        SSActivewear("2", TOKEN, "https://api.test/v2/", http_client=http_client) as second,
+    ):
+        first.products()
+        second.products()
+
+    assert not http_client.is_closed
+    assert seen[0][0] == seen[1][0] == "https://api.test/v2/products"
+    assert seen[0][1] != seen[1][1]
+
+
+def test_closes_owned_http_client() -> None:
+    """Test that the context manager closes a pool the client created itself."""
+    with SSActivewear(ACCOUNT_NUMBER, TOKEN, limits=httpx.Limits(max_connections=4)) as client:
+        pass
+    assert client.http_client.is_closed
+
+
+def test_rejects_pool_options_with_http_client() -> None:
+    """Test that pool options cannot be combined with a supplied client."""
+    with pytest.raises(TypeError):
+        SSActivewear(ACCOUNT_NUMBER, TOKEN, http_client=httpx.Client(), http2=True)
+
+
+def test_trusted_products_match_strict(make_client: ClientFactory, make_product: ProductFactory) -> None:
+    """Test that the trusted fast path builds the same products as strict validation."""
+    catalog = [make_product(1), make_product(2, saleExpiration="2026-12-31T00:00:00", salePrice=2.0)]
+    client = make_client(lambda _: httpx.Response(200, json=catalog))
+
+    assert client.products(trusted=True) == client.products()
+    assert list(client.iter_products(trusted=True)) == client.products()
+
+
+def test_filters_and_projects_products(make_client: ClientFactory) -> None:
+    """Test that filters and projections are sent to the API and projected products validate as partial."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[{"sku": "B00000001", "qty": 150}])
+
+    client = make_client(handler)
+    [product] = client.products(style_ids=[1, 2], warehouses=["IL"], fields=["sku", "quantity"])
+
+    assert (product.sku, product.quantity, product.warehouses) == ("B00000001", 150, None)
+    assert requests[0].url.path == "/v2/products/"
+    assert dict(requests[0].url.params) == {"styleid": "1,2", "warehouses": "IL", "fields": "sku,qty"}
+
+    with pytest.raises(ValueError, match="no field"):
+        client.products(fields=["nope"])
+    with pytest.raises(ValueError, match="cannot be combined"):
+        client.products(style_ids=[1], skus=["B1"])
+
+
+def test_partial_products_mirror_products() -> None:
+    """Test that partial products have every product field, made optional but otherwise alike."""
+    assert list(PartialProduct.model_fields) == list(Product.model_fields)
+    for name, field in Product.model_fields.items():
+        partial = PartialProduct.model_fields[name]
+        assert field.annotation is not None
+        assert partial.annotation == field.annotation | None, name
+        assert (partial.alias, partial.description, partial.metadata) == (
+            field.alias,
+            field.description,
+            field.metadata,
+        )
+        assert partial.default is None
+
+
+def test_chunks_sku_lookups(make_client: ClientFactory, make_product: ProductFactory) -> None:
+    """Test that long SKU lists are split over requests with short URLs."""
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.raw_path.decode())
+        skus = request.url.path.rsplit("/", 1)[1].split(",")
+        return httpx.Response(200, json=[make_product(int(sku.removeprefix("B"))) for sku in skus])
+
+    products = make_client(handler).products(skus=[f"B{sku_id:08}" for sku_id in range(1, 501)], trusted=True)
+
+    assert [product.sku_id_master for product in products] == list(range(1, 501))
+    assert len(paths) > 1
+    assert all(len(path) < 2000 for path in paths)  # noqa: PLR2004
+
+
+def test_iter_orders_filters_by_date(
+    make_client: ClientFactory,
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that order history is listed with lines, and narrowed to a window before validation."""
+    requests: list[httpx.Request] = []
+    orders = [
+        make_order_response("PO-1", orderDate="2026-09-30T23:59:59"),
+        make_order_response("PO-2", orderDate="2026-10-01T00:00:00"),
+        make_order_response("PO-3", orderDate="2026-10-15T12:00:00"),
+        {"orderDate": "2026-11-01T00:00:00"},  # Invalid, but outside of the window so never validated
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=orders)
+
+    client = make_client(handler)
+    window = client.iter_orders(since=datetime(2026, 10, 1, tzinfo=UTC), until=datetime(2026, 11, 1, tzinfo=UTC))
+
+    assert [order.po_number for order in window] == ["PO-2", "PO-3"]
+    assert dict(requests[0].url.params) == {"All": "true", "lines": "true"}
+
+    list(client.iter_orders(open_only=True, until=datetime(2026, 10, 1, tzinfo=UTC)))
+    assert dict(requests[1].url.params) == {"lines": "true"}
+
+    list(client.iter_orders(["1234567", "PO 8"], until=datetime(2026, 10, 1, tzinfo=UTC)))
+    assert requests[2].url.raw_path == b"/v2/orders/1234567,PO%208?lines=true"
+    with pytest.raises(ValueError, match="cannot be combined"):
+        list(client.iter_orders(["1234567"], open_only=True))
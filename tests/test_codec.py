@@ -0,0 +1,51 @@
+"""Testing the JSON encoding of order requests."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from ssactivewear_sdk import OrderRequest, SSActivewear
+from ssactivewear_sdk.codec import dump_order_request, dump_order_requests
+
+
+def test_encodes_orders(
+    make_client: Callable[..., SSActivewear],
+    make_order_request: Callable[..., OrderRequest],
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that order bodies are encoded from the model, and their responses decoded."""
+    order_request = make_order_request()
+    sent: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(200, json=[make_order_response()])
+
+    response = make_client(handler).submit_order(order_request)
+
+    assert json.loads(sent[0].content) == order_request.model_dump(
+        mode="json",
+        exclude_none=True,
+        by_alias=True,
+        exclude_unset=True,
+    )
+    assert sent[0].headers["Content-Type"] == "application/json"
+    assert response.orders[0].po_number == "PO-1"
+
+
+def test_dumps_order_requests(make_order_request: Callable[..., OrderRequest]) -> None:
+    """Test that order requests are serialized by alias, leaving out unset and ``None`` fields, alone or in batches."""
+    order_requests = [
+        make_order_request("PO-1"),
+        make_order_request("PO-2", [{"identifier": "B00000001", "qty": 6, "warehouseAbbr": None}], testOrder=True),
+    ]
+    expected = [
+        order_request.model_dump(mode="json", exclude_none=True, by_alias=True, exclude_unset=True)
+        for order_request in order_requests
+    ]
+
+    assert [json.loads(dump_order_request(order_request)) for order_request in order_requests] == expected
+    assert json.loads(dump_order_requests(order_requests)) == expected
+    assert expected[1]["lines"] == [{"identifier": "B00000001", "qty": 6}]
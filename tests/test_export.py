@@ -0,0 +1,100 @@
+"""Testing catalog exports."""
+
+import json
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from conftest import ACCOUNT_NUMBER, TOKEN
+
+from ssactivewear_sdk import Product, SSActivewear, export
+from ssactivewear_sdk.export import ExportFormat, export_products, main
+
+
+@pytest.fixture
+def products(make_product: Callable[..., dict[str, Any]]) -> list[Product]:
+    """Return products, the second on sale and without warehouses."""
+    return [
+        Product.model_validate(make_product(1)),
+        Product.model_validate(make_product(2, saleExpiration="2026-12-31T00:00:00", warehouses=[])),
+        Product.model_validate(make_product(3)),
+    ]
+
+
+def test_exports_ndjson(products: list[Product], tmp_path: Path) -> None:
+    """Test that products and their flattened warehouses are written in batches, replacing earlier exports."""
+    (tmp_path / "products.ndjson").write_text("stale\n")
+
+    result = export_products(iter(products), tmp_path, batch_size=2)
+
+    assert (result.products, result.warehouses) == (3, 4)
+    rows = [json.loads(line) for line in result.products_path.read_text().splitlines()]
+    assert [row["sku_id_master"] for row in rows] == [1, 2, 3]
+    assert "warehouses" not in rows[0]
+    warehouses = [json.loads(line) for line in result.warehouses_path.read_text().splitlines()]
+    assert [(row["sku_id"], row["warehouse_abbr"]) for row in warehouses] == [
+        (1, "IL"),
+        (1, "KS"),
+        (3, "IL"),
+        (3, "KS"),
+    ]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["products.ndjson", "warehouses.ndjson"]
+
+
+def test_keeps_previous_export_on_failure(products: list[Product], tmp_path: Path) -> None:
+    """Test that an interrupted export leaves the previous files untouched."""
+
+    def interrupted() -> Iterator[Product]:
+        yield products[0]
+        msg = "Connection lost"
+        raise RuntimeError(msg)
+
+    export_products(products, tmp_path)
+    with pytest.raises(RuntimeError, match="Connection lost"):
+        export_products(interrupted(), tmp_path, batch_size=1)
+
+    assert len((tmp_path / "products.ndjson").read_text().splitlines()) == 3  # noqa: PLR2004
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["products.ndjson", "warehouses.ndjson"]
+
+
+@pytest.mark.parametrize("file_format", ["arrow", "parquet"])
+def test_exports_arrow(products: list[Product], tmp_path: Path, file_format: ExportFormat) -> None:
+    """Test that Arrow and Parquet files hold typed columns, one batch per ``batch_size`` products."""
+    pyarrow = pytest.importorskip("pyarrow")
+    pytest.importorskip("pyarrow.parquet")
+
+    result = export_products(products, tmp_path, file_format=file_format, batch_size=2)
+
+    if file_format == "parquet":
+        table = pyarrow.parquet.read_table(result.products_path)
+        assert pyarrow.parquet.ParquetFile(result.products_path).num_row_groups == 2  # noqa: PLR2004
+    else:
+        table = pyarrow.ipc.open_file(result.products_path).read_all()
+    assert table.column("sku_id_master").to_pylist() == [1, 2, 3]
+    assert table.schema.field("sale_expiration").type == pyarrow.timestamp("us", tz="UTC")
+    assert table.column("sale_expiration").to_pylist()[1].year == 2026  # noqa: PLR2004
+
+
+def test_main(
+    products: list[Product],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    make_client: Callable[..., SSActivewear],
+) -> None:
+    """Test that the console script exports the catalog with the credentials from the environment."""
+    body = json.dumps([product.model_dump(mode="json", by_alias=True) for product in products]).encode()
+
+    def client(account_number: str, token: str, _base_url: str) -> SSActivewear:
+        assert (account_number, token) == (ACCOUNT_NUMBER, TOKEN)
+        return make_client(lambda _: httpx.Response(200, content=body))
+
+    monkeypatch.setattr(export, "SSActivewear", client)
+    monkeypatch.setenv("SSACTIVEWEAR_ACCOUNT_NUMBER", ACCOUNT_NUMBER)
+    monkeypatch.setenv("SSACTIVEWEAR_TOKEN", TOKEN)
+
+    assert main([str(tmp_path / "export")]) == 0
+    assert capsys.readouterr().out == "Exported 3 products and 4 warehouse rows\n"
+    assert len((tmp_path / "export" / "warehouses.ndjson").read_text().splitlines()) == 4  # noqa: PLR2004
@@ -0,0 +1,41 @@
+"""Testing lazy imports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import ssactivewear_sdk
+from ssactivewear_sdk import models
+
+
+def _modules_loaded(code: str) -> set[str]:
+    """Run ``code`` in a fresh interpreter and get the modules it loaded."""
+    result = subprocess.run(  # noqa: S603 - Runs the test interpreter
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_import_is_lazy() -> None:
+    """Test that importing the package, or only its product models, imports neither httpx nor email validation."""
+    assert not {"httpx", "email_validator", "ssactivewear_sdk.models"} & _modules_loaded("import ssactivewear_sdk")
+
+    loaded = _modules_loaded(
+        "from ssactivewear_sdk import Product\nassert not Product.__pydantic_complete__",
+    )
+    assert "ssactivewear_sdk.models.products" in loaded
+    assert not {"httpx", "email_validator", "ssactivewear_sdk.client", "ssactivewear_sdk.models.orders"} & loaded
+
+
+@pytest.mark.parametrize("module", [ssactivewear_sdk, models])
+def test_exports_resolve(module: object) -> None:
+    """Test that every exported name resolves, and that unknown names still raise."""
+    exported = module.__all__  # type: ignore[attr-defined]
+    assert all(getattr(module, name) is not None for name in exported)
+    assert set(exported) <= set(dir(module))
+    with pytest.raises(AttributeError):
+        _ = module.Missing  # type: ignore[attr-defined]
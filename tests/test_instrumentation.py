@@ -0,0 +1,179 @@
+"""Testing request and operation instrumentation."""
+
+import asyncio
+import json
+import logging
+import math
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from ssactivewear_sdk import AsyncSSActivewear, OrderRequest, SSActivewear
+from ssactivewear_sdk.instrumentation import (
+    Histogram,
+    HistogramRegistry,
+    Instrumentation,
+    LoggingInstrumentation,
+    OperationMetrics,
+    PhaseTracer,
+    RequestMetrics,
+)
+from ssactivewear_sdk.retry import RetryPolicy
+
+
+class Recorder(Instrumentation):
+    """Keeps every metric it receives."""
+
+    def __init__(self) -> None:
+        self.requests: list[RequestMetrics] = []
+        self.operations: list[OperationMetrics] = []
+
+    def request_completed(self, metrics: RequestMetrics) -> None:
+        """Keep a request's metrics."""
+        self.requests.append(metrics)
+
+    def operation_completed(self, metrics: OperationMetrics) -> None:
+        """Keep an operation's metrics."""
+        self.operations.append(metrics)
+
+
+def test_measures_streamed_products(
+    make_client: Callable[..., SSActivewear],
+    make_product: Callable[..., Any],
+) -> None:
+    """Test that a streamed catalog reports its request once the body is read, and its validation counts."""
+    attempts = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            return httpx.Response(503)
+        # An iterator body is streamed rather than loaded up front.
+        return httpx.Response(200, content=iter([json.dumps([make_product(1), make_product(2)]).encode()]))
+
+    recorder = Recorder()
+    client = make_client(handler, instrumentation=recorder, retry_policy=RetryPolicy(backoff_factor=0))
+    products = client.iter_products()
+    next(products)
+    assert recorder.requests == []
+
+    list(products)
+    [request] = recorder.requests
+    assert (request.method, request.path, request.status_code) == ("GET", "/v2/products", 200)
+    assert (request.attempts, request.retries) == (2, 1)
+    assert request.response_bytes > 0
+    assert request.elapsed > 0
+
+    [operation] = recorder.operations
+    assert operation.operation == "products"
+    assert operation.validated == 2  # noqa: PLR2004
+    assert operation.parse > 0
+    assert operation.validation > 0
+
+
+def test_measures_failed_orders(
+    make_client: Callable[..., SSActivewear],
+    make_order_request: Callable[..., OrderRequest],
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that order submissions report their metrics whether they succeed or fail."""
+    statuses = [200, 500]
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), json=[make_order_response()])
+
+    recorder = Recorder()
+    client = make_client(handler, instrumentation=recorder, retry_policy=RetryPolicy(max_attempts=1))
+    client.submit_order(make_order_request())
+    with pytest.raises(httpx.HTTPStatusError):
+        client.submit_order(make_order_request())
+
+    assert [request.status_code for request in recorder.requests] == [200, 500]
+    assert all(request.request_bytes > 0 and request.response_bytes > 0 for request in recorder.requests)
+    assert [(operation.operation, operation.validated) for operation in recorder.operations] == [
+        ("submit_order", 1),
+        ("submit_order", 0),
+    ]
+
+
+def test_measures_async_trusted_products(
+    make_async_client: Callable[..., AsyncSSActivewear],
+    make_product: Callable[..., Any],
+) -> None:
+    """Test that the asynchronous client reports the same metrics."""
+    recorder = Recorder()
+    client = make_async_client(lambda _: httpx.Response(200, json=[make_product()]), instrumentation=recorder)
+
+    assert len(asyncio.run(client.products(trusted=True))) == 1
+    assert [request.status_code for request in recorder.requests] == [200]
+    assert [operation.validated for operation in recorder.operations] == [1]
+
+
+def test_phase_tracer() -> None:
+    """Test that httpcore trace events are summed into phases, ignoring unknown ones."""
+    metrics = RequestMetrics(method="GET", path="/")
+    tracer = PhaseTracer(metrics)
+    for event in (
+        "connection.connect_tcp.started",
+        "connection.connect_tcp.complete",
+        "http11.send_request_headers.started",
+        "http11.send_request_headers.complete",
+        "http11.receive_response_headers.started",
+        "http11.receive_response_headers.complete",
+        "http11.response_closed.started",
+    ):
+        tracer.trace(event, {})
+
+    assert set(metrics.phases) == {"connect", "send", "wait"}
+
+
+def test_histogram_registry() -> None:
+    """Test that the registry aggregates metrics by name and labels."""
+    registry = HistogramRegistry()
+    for elapsed in (0.02, 0.2, 2):
+        registry.request_completed(RequestMetrics(method="GET", path="/v2/products", status_code=200, elapsed=elapsed))
+
+    histogram = registry.histogram("request.elapsed", method="GET", route="/v2/products", status_code="200")
+    assert histogram.count == 3  # noqa: PLR2004
+    assert histogram.quantile(0.5) == 0.25  # noqa: PLR2004
+    assert histogram.quantile(1) == 2  # noqa: PLR2004
+    assert {name for name, _, _ in registry} == {
+        "request.elapsed",
+        "request.request_bytes",
+        "request.response_bytes",
+        "request.retries",
+    }
+    assert math.isnan(Histogram().quantile(0.5))
+
+
+def test_labels_requests_by_route(
+    make_client: Callable[..., SSActivewear],
+    make_product: Callable[..., Any],
+) -> None:
+    """Test that requests for different identifiers share a route, so that histograms stay few."""
+    registry = HistogramRegistry()
+    client = make_client(lambda _: httpx.Response(200, json=[make_product()]), instrumentation=registry)
+    client.products(skus=["B00000001"])
+    client.products(skus=["B00000002", "B00000003"])
+    client.products()
+
+    assert {labels["route"] for name, labels, _ in registry if name == "request.elapsed"} == {
+        "/v2/products/{identifiers}",
+        "/v2/products",
+    }
+    lookups = registry.histogram("request.elapsed", method="GET", route="/v2/products/{identifiers}", status_code="200")
+    assert lookups.count == 2  # noqa: PLR2004
+
+
+def test_logging_instrumentation(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that requests and operations are logged."""
+    instrumentation = LoggingInstrumentation(level=logging.INFO)
+    with caplog.at_level(logging.INFO, logger="ssactivewear_sdk"):
+        instrumentation.request_completed(RequestMetrics(method="GET", path="/v2/products", status_code=200))
+        instrumentation.operation_completed(OperationMetrics(operation="products", validated=3))
+
+    assert "GET /v2/products -> 200" in caplog.messages[0]
+    assert "3 models" in caplog.messages[1]
@@ -0,0 +1,101 @@
+"""Testing inventory change tracking."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from ssactivewear_sdk import AsyncSSActivewear, InventoryEvent, InventoryTracker, Product, SSActivewear
+from ssactivewear_sdk.inventory import INVENTORY_FIELDS
+
+ProductFactory = Callable[..., dict[str, Any]]
+
+
+def _events(
+    tracker: InventoryTracker,
+    products: list[dict[str, Any]],
+    *,
+    complete: bool = True,
+) -> list[tuple[Any, ...]]:
+    events = tracker.update((Product.model_validate(product) for product in products), complete=complete)
+    return [(event.kind, event.sku_id, event.warehouse_abbr, event.previous, event.current) for event in events]
+
+
+def test_emits_changes(make_product: ProductFactory) -> None:
+    """Test that each kind of change is detected between refreshes, and nothing on the first one."""
+    tracker = InventoryTracker()
+    assert _events(tracker, [make_product(1), make_product(2), make_product(3)]) == []
+
+    first = make_product(1)
+    first["warehouses"][0]["qty"] = 0
+    first["warehouses"][1]["qty"] = 60
+    first["warehouses"][1]["closeout"] = True
+    second = make_product(2, piecePrice=4.0)
+    second["warehouses"].pop()
+
+    assert _events(tracker, [first, second]) == [
+        ("stock_out", 1, "IL", 100, 0),
+        ("qty_change", 1, "KS", 50, 60),
+        ("closeout_change", 1, "KS", False, True),
+        ("price_change", 2, None, _prices(make_product(2)), _prices(second)),
+        ("stock_out", 2, "KS", 50, 0),
+        ("stock_out", 3, "IL", 100, 0),
+        ("stock_out", 3, "KS", 50, 0),
+    ]
+    assert (3, "IL") not in tracker.stock
+    assert _events(tracker, [make_product(3)], complete=False) == [
+        ("restock", 3, "IL", 0, 100),
+        ("restock", 3, "KS", 0, 50),
+    ]
+
+
+def _prices(product: dict[str, Any]) -> dict[str, float]:
+    return {
+        "piece_price": product["piecePrice"],
+        "dozen_price": product["dozenPrice"],
+        "case_price": product["casePrice"],
+        "sale_price": product["salePrice"],
+        "customer_price": product["customerPrice"],
+    }
+
+
+def test_partial_refresh_keeps_unseen_skus(make_product: ProductFactory) -> None:
+    """Test that SKUs missing from an incomplete refresh are not treated as removed."""
+    tracker = InventoryTracker()
+    list(tracker.update([Product.model_validate(make_product(1)), Product.model_validate(make_product(2))]))
+
+    assert list(tracker.update([Product.model_validate(make_product(1))], complete=False)) == []
+    assert len(tracker.stock) == 4  # noqa: PLR2004
+
+
+def test_refresh_requests_projection(
+    make_client: Callable[..., SSActivewear],
+    make_async_client: Callable[..., AsyncSSActivewear],
+) -> None:
+    """Test that refreshes only request the inventory fields."""
+    quantities = [10, 0]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["fields"].split(",") == [
+            Product.model_fields[name].alias or name for name in INVENTORY_FIELDS
+        ]
+        warehouse = {
+            "warehouseAbbr": "IL",
+            "skuID": 1,
+            "qty": quantities.pop(0),
+            "closeout": False,
+            "dropship": False,
+            "excludeFreeFreight": False,
+            "fullCaseOnly": False,
+            "returnable": True,
+        }
+        return httpx.Response(200, json=[{"skuID_Master": 1, "warehouses": [warehouse]}])
+
+    tracker = InventoryTracker()
+    assert list(tracker.refresh(make_client(handler))) == []
+
+    async def arefresh() -> list[InventoryEvent]:
+        return [event async for event in tracker.arefresh(make_async_client(handler))]
+
+    assert asyncio.run(arefresh()) == [InventoryEvent("stock_out", 1, "IL", 10, 0)]
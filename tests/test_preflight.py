@@ -0,0 +1,100 @@
+"""Testing order preflight checks."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from ssactivewear_sdk import (
+    Catalog,
+    InventoryTracker,
+    OrderPreflight,
+    OrderRequest,
+    Product,
+    SSActivewearPreflightError,
+)
+
+
+@pytest.fixture
+def catalog(make_product: Callable[..., dict[str, Any]]) -> Catalog:
+    """Return a catalog whose second product is only sold by the case in KS."""
+    case_only = make_product(2)
+    case_only["warehouses"][1].update(fullCaseOnly=True, qty=144)
+    return Catalog(Product.model_validate(product) for product in (make_product(1), case_only))
+
+
+def test_checks_lines(catalog: Catalog, make_order_request: Callable[..., OrderRequest]) -> None:
+    """Test that lines the API would reject are reported, and that valid lines pass."""
+    order_request = make_order_request(
+        lines=[
+            {"identifier": "B00000001", "qty": 100},
+            {"identifier": "B00000001", "qty": 51},
+            {"identifier": "B00000009", "qty": 1},
+            {"identifier": "1", "qty": 0},
+            {"identifier": "1", "qty": 1, "warehouseAbbr": "TX"},
+            {"identifier": "00000000000002", "qty": 10, "warehouseAbbr": "KS"},
+            {"identifier": "00000000000002", "qty": 144, "warehouseAbbr": "IL"},
+        ],
+    )
+
+    preflight = OrderPreflight(catalog)
+    assert [(issue.line, issue.kind) for issue in preflight.check(order_request)] == [
+        (1, "out_of_stock"),
+        (2, "unknown_identifier"),
+        (3, "invalid_quantity"),
+        (4, "unknown_warehouse"),
+        (5, "full_case_only"),
+        (6, "out_of_stock"),
+    ]
+    with pytest.raises(SSActivewearPreflightError, match="Line 1: 51 of B00000001") as exception_info:
+        preflight.validate(order_request)
+    assert exception_info.value.issues == preflight.check(order_request)
+    assert exception_info.value.issues[0].message.endswith("only 50 left after the order's earlier lines")
+
+    preflight.validate(make_order_request(lines=[{"identifier": "2", "qty": 72, "warehouseAbbr": "KS"}]))
+
+
+def test_autoselect_splits_stock(catalog: Catalog, make_order_request: Callable[..., OrderRequest]) -> None:
+    """Test that autoselected lines may be filled from several warehouses, but only those the order allows."""
+    lines = [{"identifier": "B00000001", "qty": 120}]
+    preflight = OrderPreflight(catalog)
+
+    assert [issue.kind for issue in preflight.check(make_order_request(lines=lines))] == ["out_of_stock"]
+    assert not preflight.check(make_order_request(lines=lines, autoselectWarehouse=True))
+    restricted = make_order_request(lines=lines, autoselectWarehouse=True, autoselectWarehouse_Warehouses="IL")
+    assert [issue.kind for issue in preflight.check(restricted)] == ["out_of_stock"]
+
+
+def test_pinned_and_unpinned_lines_share_stock(
+    catalog: Catalog,
+    make_order_request: Callable[..., OrderRequest],
+) -> None:
+    """Test that lines naming a warehouse and lines without one draw from the same stock, in line order."""
+    pinned = {"identifier": "B00000001", "qty": 100, "warehouseAbbr": "IL"}
+    unpinned = {"identifier": "B00000001", "qty": 100}
+    preflight = OrderPreflight(catalog)
+
+    assert [issue.line for issue in preflight.check(make_order_request(lines=[pinned, unpinned]))] == [1]
+    assert [issue.line for issue in preflight.check(make_order_request(lines=[unpinned, pinned]))] == [1]
+    assert not preflight.check(make_order_request(lines=[pinned, unpinned | {"qty": 50}]))
+
+    split = [pinned | {"qty": 60}, unpinned | {"qty": 90}]
+    assert not preflight.check(make_order_request(lines=split, autoselectWarehouse=True))
+    split.append(unpinned | {"qty": 1})
+    assert [issue.line for issue in preflight.check(make_order_request(lines=split, autoselectWarehouse=True))] == [2]
+
+
+def test_uses_inventory(
+    catalog: Catalog,
+    make_product: Callable[..., dict[str, Any]],
+    make_order_request: Callable[..., OrderRequest],
+) -> None:
+    """Test that the inventory tracker's stock takes precedence over the catalog's."""
+    restocked = make_product(1)
+    restocked["warehouses"][0]["qty"] = 500
+    inventory = InventoryTracker()
+    list(inventory.update([Product.model_validate(restocked)]))
+
+    order_request = make_order_request(lines=[{"identifier": "B00000001", "qty": 300, "warehouseAbbr": "IL"}])
+    assert OrderPreflight(catalog).check(order_request)
+    assert not OrderPreflight(catalog, inventory).check(order_request)
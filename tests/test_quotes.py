@@ -0,0 +1,81 @@
+"""Testing batched quotes."""
+
+import math
+import sys
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ssactivewear_sdk import Product, ProductTable, QuoteEngine
+
+
+@pytest.fixture
+def table(make_product: Callable[..., dict[str, Any]]) -> ProductTable:
+    """Return a table whose second product has a customer price, and third a sale ending in 2026."""
+    products = [
+        make_product(1),
+        make_product(2, customerPrice=2.75),
+        make_product(3, salePrice=2.0, saleExpiration="2026-12-31T00:00:00Z"),
+    ]
+    return ProductTable.from_products(Product.model_validate(product) for product in products)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request: pytest.FixtureRequest, table: ProductTable, monkeypatch: pytest.MonkeyPatch) -> QuoteEngine:
+    """Return an engine over the table, pricing with NumPy or, as without the extra, in Python."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    return QuoteEngine(table)
+
+
+def test_prices_quantity_breaks(engine: QuoteEngine) -> None:
+    """Test that lines get their quantity break, customer or sale price, whichever is lowest."""
+    quote = engine.quote(
+        [("B00000001", 11), ("1", 12), ("00000000000001", 80), ("B00000002", 12), ("3", 1), ("B00000009", 5)],
+        at=datetime(2026, 6, 1, tzinfo=UTC),
+    )
+
+    assert quote.tiers == ("piece", "dozen", "case", "customer", "sale", None)
+    assert quote.unit_prices[:5] == (3.5, 3.0, 2.5, 2.75, 2.0)
+    assert quote.line_totals[:5] == (38.5, 36.0, 200.0, 33.0, 2.0)
+    assert quote.unknown == (5,)
+    assert math.isnan(quote.unit_prices[5])
+    assert quote.subtotal == 309.5  # noqa: PLR2004
+    assert quote.weights[2] == pytest.approx(32.0 + 8 * 0.44)
+    assert quote.weight == pytest.approx(32.0 + (11 + 12 + 8 + 12 + 1) * 0.44)
+
+    expired = engine.quote([("3", 1)], at=datetime(2027, 1, 1, tzinfo=UTC))
+    assert (expired.tiers, expired.subtotal) == (("piece",), 3.5)
+
+
+def test_quotes_many_carts(engine: QuoteEngine) -> None:
+    """Test that carts priced in one batch are priced as they would be one by one."""
+    carts = [[("B00000001", 12), ("B00000009", 1)], [], [("2", 100)]]
+    at = datetime(2026, 6, 1, tzinfo=UTC)
+
+    quotes = engine.quote_many(carts, at=at)
+    assert [quote.unknown for quote in quotes] == [(1,), (), ()]
+    assert [quote.subtotal for quote in quotes] == [engine.quote(cart, at=at).subtotal for cart in carts]
+
+
+def test_prices_mapped_tables(
+    table: ProductTable,
+    tmp_path: Path,
+    make_product: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that tables opened from a file price alike, and in-memory tables can still grow once quoted from."""
+    pytest.importorskip("numpy")
+    lines = [("B00000001", 30), ("2", 12), ("3", 100)]
+    at = datetime(2026, 6, 1, tzinfo=UTC)
+    quote = QuoteEngine(table).quote(lines, at=at)
+
+    table.write(tmp_path / "catalog.table")
+    assert QuoteEngine(ProductTable.open(tmp_path / "catalog.table")).quote(lines, at=at) == quote
+
+    table.append(Product.model_validate(make_product(4)))
+    assert QuoteEngine(table).quote([*lines, ("4", 1)], at=at).unit_prices[:3] == quote.unit_prices
@@ -0,0 +1,109 @@
+"""Testing incremental order syncs."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from ssactivewear_sdk import OrderResponse, OrderSync, SSActivewear
+
+ClientFactory = Callable[..., SSActivewear]
+
+
+def test_syncs_changed_orders(
+    tmp_path: Path,
+    make_client: ClientFactory,
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that each sync only yields new, changed and closed orders, and the first one the recent history."""
+    orders = {
+        po_number: make_order_response(po_number, guid=f"00000000-0000-0000-0000-00000000000{index}", **fields)
+        for index, (po_number, fields) in enumerate(
+            [
+                ("PO-1", {"orderDate": "2026-10-10T09:00:00"}),
+                ("PO-2", {"orderDate": "2026-10-01T09:00:00", "orderStatus": "Shipped"}),
+                ("PO-3", {"orderDate": "2026-01-01T09:00:00", "orderStatus": "Shipped"}),
+                ("PO-4", {"orderDate": "2026-10-12T09:00:00", "orderStatus": "Shipped"}),
+            ],
+        )
+    }
+    open_orders = ["PO-1"]
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/v2/orders/":
+            listed = orders if "All" in request.url.params else open_orders
+            return httpx.Response(200, json=[orders[po_number] for po_number in listed])
+        guids = request.url.path.rsplit("/", 1)[1].split(",")
+        return httpx.Response(200, json=[order for order in orders.values() if order["guid"] in guids])
+
+    client = make_client(handler)
+    sync = OrderSync(tmp_path / "orders.json", history_since=datetime(2026, 9, 1, tzinfo=UTC))
+
+    def po_numbers() -> list[str]:
+        return [order.po_number for order in sync.sync(client)]
+
+    assert sync.synced_at is None
+    assert po_numbers() == ["PO-1", "PO-2", "PO-4"]
+    assert sync.synced_at is not None
+    assert po_numbers() == []
+    assert paths[-1] == "/v2/orders/"
+
+    orders["PO-1"]["deliveryStatus"] = "Label Created"
+    assert po_numbers() == ["PO-1"]
+
+    open_orders.clear()
+    orders["PO-1"]["orderStatus"] = "Shipped"
+    sync.watch([OrderResponse.model_validate(orders["PO-3"])])
+    assert po_numbers() == ["PO-1", "PO-3"]
+    assert po_numbers() == []
+
+
+def test_repeats_interrupted_syncs(
+    tmp_path: Path,
+    make_client: ClientFactory,
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that a sync abandoned part way leaves the state untouched."""
+    client = make_client(lambda _: httpx.Response(200, json=[make_order_response("PO-1")]))
+    sync = OrderSync(tmp_path / "orders.json")
+
+    assert next(sync.sync(client)).po_number == "PO-1"
+
+    assert sync.synced_at is None
+    assert [order.po_number for order in sync.sync(client)] == ["PO-1"]
+
+
+def test_drops_orders_no_longer_found(
+    tmp_path: Path,
+    make_client: ClientFactory,
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that closed orders S&S no longer finds are dropped, rather than failing every later sync."""
+    orders = [
+        make_order_response("PO-1", guid="00000000-0000-0000-0000-000000000001", orderStatus="Shipped"),
+        make_order_response("PO-2", guid="00000000-0000-0000-0000-000000000002"),
+    ]
+    purged = "00000000-0000-0000-0000-000000000002"
+    lookups: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v2/orders/":
+            return httpx.Response(200, json=[])
+        guids = request.url.path.rsplit("/", 1)[1]
+        lookups.append(guids)
+        if purged in guids:
+            return httpx.Response(404)
+        return httpx.Response(200, json=[order for order in orders if order["guid"] in guids.split(",")])
+
+    client = make_client(handler)
+    sync = OrderSync(tmp_path / "orders.json")
+    sync.watch(OrderResponse.model_validate(order) for order in orders)
+
+    assert [order.po_number for order in sync.sync(client)] == ["PO-1"]
+    assert lookups == [f"{orders[0]['guid']},{purged}", orders[0]["guid"], purged]
+    assert sync.synced_at is not None
+    assert list(sync.sync(client)) == []
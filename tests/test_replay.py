@@ -0,0 +1,109 @@
+"""Testing recording and replaying traffic."""
+
+import asyncio
+import gzip
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from conftest import ACCOUNT_NUMBER, TOKEN
+
+from ssactivewear_sdk import (
+    AsyncRecordingTransport,
+    AsyncSSActivewear,
+    OrderRequest,
+    RecordingTransport,
+    ReplayTransport,
+    RetryPolicy,
+    SSActivewear,
+)
+from ssactivewear_sdk.replay import Interaction, load_interactions
+
+
+def _client(transport: httpx.BaseTransport, **kwargs: Any) -> SSActivewear:  # noqa: ANN401
+    return SSActivewear(ACCOUNT_NUMBER, TOKEN, "https://api.test/v2", transport=transport, **kwargs)
+
+
+def test_records_and_replays(
+    tmp_path: Path,
+    make_product: Callable[..., dict[str, Any]],
+    make_order_request: Callable[..., OrderRequest],
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that responses are recorded without credentials, and replayed to a client offline."""
+    recording = tmp_path / "recording.jsonl.gz"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert "Authorization" in request.headers
+        headers = {"Set-Cookie": f"session={TOKEN}"}
+        if request.method == "POST":
+            return httpx.Response(200, json=[make_order_response()], headers=headers)
+        return httpx.Response(200, json=[make_product(1), make_product(2)], headers=headers)
+
+    with _client(RecordingTransport(recording, httpx.MockTransport(handler))) as client:
+        products = client.products()
+        order = client.submit_order(make_order_request())
+
+    assert TOKEN not in gzip.decompress(recording.read_bytes()).decode()
+    assert [(interaction.method, interaction.url) for interaction in load_interactions(recording)] == [
+        ("GET", "/v2/products"),
+        ("POST", "/v2/orders"),
+    ]
+
+    with _client(ReplayTransport(recording)) as client:
+        assert client.products() == products
+        assert list(client.iter_products()) == products
+        assert client.submit_order(make_order_request()) == order
+        with pytest.raises(LookupError):
+            client.products(style_ids=[1])
+
+
+def test_async_records_and_replays(tmp_path: Path, make_product: Callable[..., dict[str, Any]]) -> None:
+    """Test that asynchronous clients record and replay alike."""
+    recording = tmp_path / "recording.jsonl.gz"
+    transport = httpx.MockTransport(lambda _: httpx.Response(200, json=[make_product(1)]))
+
+    async def main() -> None:
+        async with AsyncSSActivewear(
+            ACCOUNT_NUMBER,
+            TOKEN,
+            "https://api.test/v2",
+            transport=AsyncRecordingTransport(recording, transport),
+        ) as client:
+            recorded = await client.products()
+
+        async with AsyncSSActivewear(
+            ACCOUNT_NUMBER,
+            TOKEN,
+            "https://api.test/v2",
+            transport=ReplayTransport(recording, latency=0.01),
+        ) as client:
+            assert await client.products() == recorded
+
+    asyncio.run(main())
+
+
+def test_replays_in_order_and_injects_errors(make_product: Callable[..., dict[str, Any]]) -> None:
+    """Test that repeated requests cycle through their recorded responses, and that failures are injected."""
+    interactions = [
+        Interaction("GET", "/v2/products", 200, (), httpx.Response(200, json=[make_product(sku_id)]).content)
+        for sku_id in (1, 2)
+    ]
+
+    client = _client(ReplayTransport(interactions))
+    assert [client.products()[0].sku_id_master for _ in range(3)] == [1, 2, 1]
+
+    client = _client(ReplayTransport(interactions, error_rate=1), retry_policy=RetryPolicy(max_attempts=1))
+    with pytest.raises(httpx.HTTPStatusError):
+        client.products()
+
+    client = _client(
+        ReplayTransport(interactions, error_rate=0.5, errors=[httpx.ConnectError], seed=1),
+        retry_policy=RetryPolicy(max_attempts=10, backoff_factor=0),
+    )
+    assert len(client.products()) == 1
+
+    with pytest.raises(ValueError, match="error_rate"):
+        ReplayTransport(interactions, error_rate=2)
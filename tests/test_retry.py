@@ -0,0 +1,97 @@
+"""Testing retries and rate limiting."""
+
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from ssactivewear_sdk import OrderRequest, SSActivewear
+from ssactivewear_sdk.retry import RetryPolicy, TokenBucket, parse_retry_after
+
+NO_BACKOFF = RetryPolicy(backoff_factor=0)
+
+
+def test_retries_catalog_reads(make_client: Callable[..., SSActivewear], make_product: Callable[..., Any]) -> None:
+    """Test that idempotent requests are retried on server errors and connection failures."""
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            msg = "Connection reset"
+            raise httpx.ReadError(msg, request=request)
+        if attempts == 2:  # noqa: PLR2004
+            return httpx.Response(503)
+        return httpx.Response(200, json=[make_product()])
+
+    assert len(make_client(handler, retry_policy=NO_BACKOFF).products()) == 1
+    assert attempts == 3  # noqa: PLR2004
+
+
+def test_gives_up_after_max_attempts(make_client: Callable[..., SSActivewear]) -> None:
+    """Test that the last failure is raised once attempts are exhausted."""
+    client = make_client(lambda _: httpx.Response(502), retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.products()
+
+
+def test_only_retries_unprocessed_orders(
+    make_client: Callable[..., SSActivewear],
+    make_order_request: Callable[..., OrderRequest],
+    make_order_response: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that order submissions are retried on 429 but never on ambiguous server errors."""
+    statuses = [429, 200]
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        return httpx.Response(status, json=[make_order_response()], headers={"Retry-After": "0"})
+
+    make_client(handler, retry_policy=NO_BACKOFF).submit_order(make_order_request())
+    assert statuses == []
+
+    statuses = [500, 200]
+    with pytest.raises(httpx.HTTPStatusError):
+        make_client(handler, retry_policy=NO_BACKOFF).submit_order(make_order_request())
+    assert statuses == [200]
+
+
+def test_gives_up_when_asked_to_wait_too_long(make_client: Callable[..., SSActivewear]) -> None:
+    """Test that a Retry-After beyond the maximum backoff is honored by giving up, rather than retrying early."""
+    attempts = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        return httpx.Response(429, headers={"Retry-After": "300"})
+
+    with pytest.raises(httpx.HTTPStatusError):
+        make_client(handler, retry_policy=NO_BACKOFF).products()
+    assert attempts == 1
+
+    response = httpx.Response(429, headers={"Retry-After": "30"})
+    assert NO_BACKOFF.retry_delay(1, idempotent=True, response=response) == 30  # noqa: PLR2004
+
+
+def test_parse_retry_after() -> None:
+    """Test both forms of the Retry-After header."""
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "7"})) == 7  # noqa: PLR2004
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+    assert parse_retry_after(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+    assert parse_retry_after(httpx.Response(429)) is None
+
+
+def test_token_bucket() -> None:
+    """Test that the bucket allows bursts, then spaces requests out and honours exhausted quotas."""
+    now = 0.0
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now)
+
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 0.5, 1]
+    now = 10.0
+    assert bucket.reserve() == 0
+
+    bucket.observe(httpx.Response(200, headers={"X-Rate-Limit-Remaining": "0", "X-Rate-Limit-Reset": "30"}))
+    assert bucket.reserve() == 30  # noqa: PLR2004
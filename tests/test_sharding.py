@@ -0,0 +1,76 @@
+"""Testing sharded catalog downloads."""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from ssactivewear_sdk import AsyncSSActivewear, CatalogShard, Product, SSActivewear
+from ssactivewear_sdk.retry import RetryPolicy
+from ssactivewear_sdk.sharding import brand_shards, sku_shards, style_shards
+
+
+def test_shards(make_product: Callable[..., dict[str, Any]]) -> None:
+    """Test that styles, SKUs and brands are split into shards."""
+    assert list(style_shards([1, 2, 3], per_shard=2)) == [
+        CatalogShard("/products/", (("styleid", "1,2"),)),
+        CatalogShard("/products/", (("styleid", "3"),)),
+    ]
+    assert list(sku_shards(["B1", "B/2"])) == [CatalogShard("/products/B1,B%2F2")]
+
+    products = [
+        Product.model_validate(make_product(sku_id, brandID=brand_id, styleID=style_id))
+        for sku_id, brand_id, style_id in [(1, "1", 10), (2, "1", 10), (3, "2", 20), (4, "1", 30)]
+    ]
+    assert [shard.params for shard in brand_shards(products)] == [(("styleid", "10,30"),), (("styleid", "20"),)]
+
+
+def test_resumes_after_failed_shard(
+    make_client: Callable[..., SSActivewear],
+    make_product: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that a failed shard is raised, and that a resumed sync only fetches the shards not yet completed."""
+    failing = {"2"}
+    requested: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        style_id = request.url.params["styleid"]
+        requested.append(style_id)
+        if style_id in failing:
+            return httpx.Response(503)
+        return httpx.Response(200, json=[make_product(int(style_id), styleID=int(style_id))])
+
+    client = make_client(handler, retry_policy=RetryPolicy(max_attempts=1))
+    shards = list(style_shards([1, 2, 3], per_shard=1))
+    completed: set[CatalogShard] = set()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        list(client.iter_products_sharded(shards, max_concurrency=1, completed=completed, ordered=True))
+    assert completed == {shards[0]}
+
+    failing.clear()
+    requested.clear()
+    products = client.iter_products_sharded(shards, completed=completed, ordered=True)
+    assert [product.style_id for product in products] == [2, 3]
+    assert sorted(requested) == ["2", "3"]
+    assert completed == set(shards)
+
+
+def test_async_sharded_products(
+    make_async_client: Callable[..., AsyncSSActivewear],
+    make_product: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that the asynchronous client downloads every shard."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        skus = request.url.path.rsplit("/", 1)[1].split(",")
+        return httpx.Response(200, json=[make_product(int(sku)) for sku in skus])
+
+    async def main() -> list[int]:
+        client = make_async_client(handler)
+        shards = sku_shards(str(sku) for sku in range(10))
+        return [product.sku_id_master async for product in client.iter_products_sharded(shards)]
+
+    assert sorted(asyncio.run(main())) == list(range(10))
@@ -0,0 +1,107 @@
+"""Testing shared catalog snapshots."""
+
+import threading
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Literal
+
+import httpx
+import pytest
+
+from ssactivewear_sdk import CatalogSnapshot, Product, RetryPolicy, SharedProductTable, SSActivewear
+
+
+def test_reloads_stale_catalog(
+    make_client: Callable[..., SSActivewear],
+    make_product: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that a fresh catalog is shared, and a stale one reloaded before being returned."""
+    requests = 0
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        return httpx.Response(200, json=[make_product(requests)])
+
+    snapshot = CatalogSnapshot(make_client(handler))
+    assert snapshot.age is None
+    catalog = snapshot.get()
+    assert snapshot.get() is catalog
+    assert requests == 1
+
+    snapshot.ttl = timedelta(0)
+    assert snapshot.get().by_sku_id_master(2) is not None
+
+
+def test_refreshes_in_background(
+    make_client: Callable[..., SSActivewear],
+    make_product: Callable[..., dict[str, Any]],
+) -> None:
+    """Test that a stale catalog is served while its replacement loads, and kept a while if the replacement fails."""
+    requests = 0
+    entered, release = threading.Event(), threading.Event()
+    fail = False
+
+    def handler(_: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        if requests == 2:  # noqa: PLR2004
+            entered.set()
+            release.wait()
+        return httpx.Response(500) if fail else httpx.Response(200, json=[make_product(requests)])
+
+    snapshot = CatalogSnapshot(make_client(handler, retry_policy=RetryPolicy(max_attempts=1)), background_refresh=True)
+    stale = snapshot.get()
+
+    snapshot.ttl = timedelta(0)
+    assert snapshot.get() is stale
+    entered.wait()
+    assert snapshot.get() is stale
+    snapshot.ttl = timedelta(hours=1)
+    release.set()
+    fresh = _wait_for(lambda: snapshot.get() is not stale and snapshot.get())
+    assert fresh.by_sku_id_master(2) is not None
+    assert requests == 2  # noqa: PLR2004
+
+    fail = True
+    snapshot.ttl = timedelta(0)
+    assert snapshot.get() is fresh
+    snapshot.ttl = timedelta(hours=1)
+    assert isinstance(_wait_for(lambda: snapshot.refresh_error), httpx.HTTPStatusError)
+    assert snapshot.get() is fresh
+
+    snapshot.ttl = timedelta(0)
+    for _ in range(3):
+        assert snapshot.get() is fresh
+    assert requests == 3  # noqa: PLR2004
+    snapshot.retry_interval = timedelta(0)
+    _wait_for(lambda: snapshot.get() is fresh and requests == 4)  # noqa: PLR2004
+
+
+def _wait_for[T](condition: Callable[[], T | Literal[False] | None]) -> T:
+    """Wait for a background refresh to have an outcome."""
+    for _ in range(500):
+        result = condition()
+        if result:
+            return result
+        time.sleep(0.01)
+    msg = "Timed out waiting for the background refresh"
+    raise AssertionError(msg)
+
+
+def test_shares_table_files(make_product: Callable[..., dict[str, Any]], tmp_path: Path) -> None:
+    """Test that readers swap to a newly published table file once they check for it."""
+    publisher = SharedProductTable(tmp_path / "catalog.table")
+    reader = SharedProductTable(tmp_path / "catalog.table", check_interval=timedelta(0))
+    with pytest.raises(FileNotFoundError):
+        reader.get()
+
+    publisher.publish([Product.model_validate(make_product(1))])
+    first = reader.get()
+    assert reader.get() is first
+
+    publisher.publish(Product.model_validate(make_product(sku_id)) for sku_id in (2, 3))
+    assert [product.sku_id_master for product in reader.get()] == [2, 3]
+    assert first[0].sku_id_master == 1
@@ -0,0 +1,66 @@
+"""Testing the incremental JSON array parser."""
+
+import json
+
+import pytest
+
+from ssactivewear_sdk._streaming import JSONArrayParser, iter_json_array
+
+
+def test_parses_arbitrary_chunks() -> None:
+    """Test that elements are reassembled across chunk boundaries, one character at a time."""
+    data = [{"a": 1, "b": [1, 2, {"c": "]},"}]}, 123, "x", None, [], {}]
+    text = json.dumps(data, indent=2)
+
+    assert list(iter_json_array(text)) == data
+
+
+def test_yields_elements_before_the_end() -> None:
+    """Test that completed elements are returned without waiting for the closing bracket."""
+    parser = JSONArrayParser()
+
+    assert parser.feed('[{"a": 1}, {"b"') == [{"a": 1}]
+    assert parser.feed(": 2}]") == [{"b": 2}]
+    parser.close()
+
+
+def test_does_not_split_numbers() -> None:
+    """Test that a number at the end of a chunk is not emitted until it is terminated."""
+    parser = JSONArrayParser()
+
+    assert parser.feed("[12") == []
+    assert parser.feed("3]") == [123]
+
+    parser = JSONArrayParser()
+    assert parser.feed("[1.") == []
+    assert parser.feed("5, 2e") == [1.5]
+    assert parser.feed("3, -0.25E-1]") == [2000.0, -0.025]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "[", '[{"a": 1}', '{"a": 1}', "[1 2]", "[1]]", "[1,]", "[,1]", '[{"a" 1}]', "[1.]", "[1e+, 2]"],
+)
+def test_rejects_malformed_arrays(text: str) -> None:
+    """Test that truncated or malformed bodies are reported."""
+    with pytest.raises(ValueError, match="JSON array"):
+        list(iter_json_array([text]))
+
+
+def test_rejects_malformed_elements_at_once() -> None:
+    """Test that a malformed element is reported as soon as it is received, rather than buffered until the end."""
+    parser = JSONArrayParser()
+
+    assert parser.feed('[{"a": 1}, {"b": tru') == [{"a": 1}]
+    with pytest.raises(ValueError, match="Malformed element"):
+        parser.feed('x, "c": 2}')
+
+
+def test_waits_for_truncated_tokens() -> None:
+    """Test that elements cut anywhere, even inside a string, escape or literal, are completed by the next chunk."""
+    text = json.dumps([{"a": [1.5e3, True, None], "b": 'x\u00e9"y'}, -12.5e-7, 0.25], ensure_ascii=True)
+
+    for cut in range(1, len(text)):
+        parser = JSONArrayParser()
+        assert parser.feed(text[:cut]) + parser.feed(text[cut:]) == json.loads(text)
+        parser.close()
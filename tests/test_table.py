@@ -0,0 +1,72 @@
+"""Testing the columnar product table."""
+
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ssactivewear_sdk import Product, ProductTable
+from ssactivewear_sdk.table import DictionaryColumn
+
+
+def test_round_trips_products(make_product: Callable[..., dict[str, Any]]) -> None:
+    """Test that materialized rows equal the products the table was built from."""
+    products = [
+        Product.model_validate(make_product(1)),
+        Product.model_validate(make_product(2, saleExpiration="2026-12-31T00:00:00", warehouses=[])),
+        Product.model_validate(make_product(3, saleExpiration="2026-12-31T00:00:00Z", yourSku="MINE")),
+    ]
+    table = ProductTable.from_products(products)
+
+    assert len(table) == 3  # noqa: PLR2004
+    assert list(table) == products
+    assert table[-1] == products[2]
+    assert table[0:2] == products[:2]
+    assert table[2].sale_expiration == datetime(2026, 12, 31, tzinfo=UTC)
+    with pytest.raises(IndexError):
+        table[3]
+
+
+def test_columns(make_product: Callable[..., dict[str, Any]]) -> None:
+    """Test typed and dictionary-encoded column access."""
+    table = ProductTable.from_products(
+        Product.model_validate(make_product(sku_id, piecePrice=float(sku_id), brandName=brand))
+        for sku_id, brand in [(1, "Gildan"), (2, "Bella"), (3, "Gildan")]
+    )
+
+    assert list(table.column("piece_price")) == [1.0, 2.0, 3.0]
+    brands = table.column("brand_name")
+    assert isinstance(brands, DictionaryColumn)
+    assert brands.categories == ["Gildan", "Bella"]
+    assert list(brands.codes) == [0, 1, 0]
+    assert brands.code_of("Bella") == 1
+    assert list(brands) == ["Gildan", "Bella", "Gildan"]
+    assert list(table.warehouse_column("qty")) == [100, 50] * 3
+    assert list(table.warehouse_offsets) == [0, 2, 4, 6]
+    with pytest.raises(KeyError):
+        table.column("warehouses")
+
+
+def test_writes_and_opens_files(make_product: Callable[..., dict[str, Any]], tmp_path: Path) -> None:
+    """Test that a table opened from its file reads the same rows and columns, and is read-only."""
+    products = [
+        Product.model_validate(make_product(1, saleExpiration="2026-12-31T00:00:00Z", brandName="Bella+Canvas™")),
+        Product.model_validate(make_product(2, warehouses=[])),
+    ]
+    table = ProductTable.from_products(products)
+    table.write(tmp_path / "catalog.table")
+
+    opened = ProductTable.open(tmp_path / "catalog.table")
+    assert list(opened) == products
+    assert list(opened.column("piece_price")) == [3.5, 3.5]
+    assert list(opened.column("brand_name")) == ["Bella+Canvas™", "Gildan"]
+    assert opened.column("brand_name").code_of("Gildan") == 1  # type: ignore[union-attr]
+    assert list(opened.warehouse_offsets) == [0, 2, 2]
+    with pytest.raises(TypeError):
+        opened.append(products[0])
+
+    (tmp_path / "garbage.table").write_bytes(b"not a table")
+    with pytest.raises(ValueError, match="not a product table"):
+        ProductTable.open(tmp_path / "garbage.table")